@@ -0,0 +1,165 @@
+
+import heapq
+import itertools
+from typing import Optional
+import numpy as np
+from model.point import Point
+from logic.kq import KnightQuest
+
+class KnightAStar:
+    """
+    Finds the shortest knight path from a start to a target position on an infinite board
+    with blocked squares, using A* search guided by KnightQuest.feval.
+
+    On an empty board feval is the exact remaining distance, so it never overestimates the
+    distance around obstacles (admissible) and changes by at most one per move (consistent).
+    Ties between equal f = g + h are broken towards the smaller h, so with sparse obstacles
+    the search expands little more than the squares along the path.
+
+    The open set is a binary heap of (f, h, insertion order, g, square) entries. Squares are
+    complex numbers x + yi holding the offset from A, which stays exact as a float however
+    large the coordinates are; the closed set, g scores and parent pointers are keyed by them.
+
+    Attributes:
+        A (Point): The starting position of the knight.
+        B (Point): The target position to reach.
+        expanded (int): Number of squares expanded by the last search.
+    """
+    KNIGHT_MOVES = [
+        Point(-2, -1), Point(-1, -2), Point(1, -2), Point(2, -1),
+        Point(2, 1), Point(1, 2), Point(-1, 2), Point(-2, 1)
+    ]
+
+
+    def __init__(self, A: 'Point', B: 'Point', obstacles=None, origin: 'Point' = Point(0, 0),
+                 max_expanded: Optional[int] = None) -> None:
+        """
+        Initialize the KnightAStar with a starting point A, target point B and the obstacles.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+            obstacles (set[Point] | np.ndarray): Blocked squares, either as a collection of
+                Points or as a 2D boolean bitmap where obstacles[x - origin.x, y - origin.y]
+                is True for blocked squares (default None, no obstacles).
+            origin (Point): The square of bitmap cell [0, 0] (default (0, 0)).
+            max_expanded (Optional[int]): Give up after this many expansions. Without a limit,
+                a target walled in by obstacles is searched for forever (default None).
+        """
+        self.A = A
+        self.B = B
+
+        self.expanded = 0
+        self._max_expanded = max_expanded
+        self._kq = KnightQuest(A, B)
+        self._moves = [complex(move.x, move.y) for move in self.KNIGHT_MOVES]
+        self._target = Point(B.x - A.x, B.y - A.y)
+
+        self._bitmap = None
+        self._blocked = set()
+
+        if isinstance(obstacles, np.ndarray):
+            self._bitmap = obstacles.astype(bool, copy=False)
+            self._origin = origin
+        elif obstacles is not None:
+            self._blocked = {complex(P.x - A.x, P.y - A.y) for P in obstacles}
+
+
+    def is_blocked(self, P: 'Point') -> bool:
+        """
+        Check whether a square is blocked.
+
+        Args:
+            P (Point): The square to check.
+
+        Returns:
+            bool: True if the square is an obstacle.
+        """
+        return self._fblocked(complex(P.x - self.A.x, P.y - self.A.y))
+
+
+    def _fblocked(self, z: complex) -> bool:
+        """
+        Check whether a square given as a complex offset from A is blocked.
+
+        Args:
+            z (complex): The square's offset from A, x + yi.
+
+        Returns:
+            bool: True if the square is an obstacle.
+        """
+        if self._bitmap is None:
+            return z in self._blocked
+
+        x = self.A.x + int(z.real) - self._origin.x
+        y = self.A.y + int(z.imag) - self._origin.y
+        return 0 <= x < self._bitmap.shape[0] and 0 <= y < self._bitmap.shape[1] and bool(self._bitmap[x, y])
+
+
+    def _fh(self, z: complex) -> int:
+        """
+        Heuristic: the obstacle-free minimum number of moves from z to the target.
+
+        Args:
+            z (complex): The square's offset from A, x + yi.
+
+        Returns:
+            int: The KnightQuest evaluation from z to B.
+        """
+        return self._kq.feval(Point(int(z.real), int(z.imag)), self._target)
+
+
+    def fpath(self) -> list:
+        """
+        Execute A* to find the shortest path from start to end around the obstacles.
+
+        Returns:
+            list: The shortest path as a list of Points, empty if the target is blocked,
+            unreachable or the expansion limit was hit.
+        """
+        start = 0j
+        end = complex(self._target.x, self._target.y)
+        self.expanded = 0
+
+        if self._fblocked(start) or self._fblocked(end):
+            return []
+
+        order = itertools.count()
+        h = self._fh(start)
+        open_set = [(h, h, next(order), 0, start)]
+        parents = {start: None}
+        g_score = {start: 0}
+        closed = set()
+
+        while open_set:
+            _, _, _, g, current = heapq.heappop(open_set)
+
+            if current in closed:
+                continue
+
+            if current == end:
+                x, y = self.A
+                path = []
+                while current is not None:
+                    path.append(Point(x + int(current.real), y + int(current.imag)))
+                    current = parents[current]
+                return path[::-1]
+
+            closed.add(current)
+            self.expanded += 1
+
+            if self._max_expanded is not None and self.expanded > self._max_expanded:
+                break
+
+            for move in self._moves:
+                next_pos = current + move
+
+                if next_pos in closed or g + 1 >= g_score.get(next_pos, g + 2) or self._fblocked(next_pos):
+                    continue
+
+                g_score[next_pos] = g + 1
+                parents[next_pos] = current
+                h = self._fh(next_pos)
+                heapq.heappush(open_set, (g + 1 + h, h, next(order), g + 1, next_pos))
+
+        return []
@@ -0,0 +1,265 @@
+
+import numpy as np
+
+class KnightBatch:
+    """
+    Vectorized counterpart of KnightQuest that evaluates whole arrays of (start, target)
+    pairs at once. Every step of the scalar pipeline - reflection to the canonical region,
+    conversion to sequence indices (n, m) and the sequence value - is expressed as an
+    element-wise NumPy operation, so no Point or Sequence objects are created per pair.
+
+    Paths are produced in CSR layout: a single int32 coordinate buffer holding every path
+    back to back, plus an offsets array such that path i is coords[offsets[i]:offsets[i + 1]].
+
+    Attributes:
+        A (np.ndarray): Starting coordinates, shape (N, 2).
+        B (np.ndarray): Target coordinates, shape (N, 2).
+        ROT_U (np.ndarray): Base vector (1, 2) rotated by 0, 90, 180 and 270 degrees.
+        ROT_V (np.ndarray): Base vector (2, 1) rotated by 0, 90, 180 and 270 degrees.
+    """
+    ROT_U = np.array([(1, 2), (-2, 1), (-1, -2), (2, -1)], dtype=np.int64)
+    ROT_V = np.array([(2, 1), (-1, 2), (-2, -1), (1, -2)], dtype=np.int64)
+
+
+    def __init__(self, A: np.ndarray, B: np.ndarray) -> None:
+        """
+        Initialize the KnightBatch with arrays of starting and target coordinates.
+
+        Args:
+            A (np.ndarray): Array-like of shape (N, 2) with the starting positions.
+            B (np.ndarray): Array-like of shape (N, 2) with the target positions.
+        """
+        self.A = self._fcoords(A)
+        self.B = self._fcoords(B)
+
+        if self.A.shape != self.B.shape:
+            raise ValueError(f"Shape mismatch: A is {self.A.shape}, B is {self.B.shape}.")
+
+        self.fallback_count = 0
+
+
+    @staticmethod
+    def _fcoords(P: np.ndarray) -> np.ndarray:
+        """
+        Convert an array-like of coordinates into a contiguous int64 array of shape (N, 2).
+
+        Args:
+            P (np.ndarray): Array-like of (x, y) coordinates.
+
+        Returns:
+            np.ndarray: The coordinates as an int64 array of shape (N, 2).
+        """
+        return np.ascontiguousarray(P, dtype=np.int64).reshape(-1, 2)
+
+
+    def _fref(self, dx: np.ndarray, dy: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Reflect distance vectors to the canonical region between axes x and y = x/2.
+        Array version of KnightQuest._fref.
+
+        Args:
+            dx (np.ndarray): The x-components of the distance vectors.
+            dy (np.ndarray): The y-components of the distance vectors.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The reflected components (rx, ry), rx >= ry >= 0.
+        """
+        ax = np.abs(dx)
+        ay = np.abs(dy)
+        return np.maximum(ax, ay), np.minimum(ax, ay)
+
+
+    def _fseq(self, rx: np.ndarray, ry: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Convert reflected coordinates to sequence indices (n, m). Array version of
+        Sequence.from_point, using integer ceilings instead of float division.
+
+        Args:
+            rx (np.ndarray): Reflected x-components.
+            ry (np.ndarray): Reflected y-components.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: The sequence indices (n, m).
+        """
+        # Points above y = x/2 are shifted along the (1, -1) direction by
+        # delta = ceil((2y - x) / 3); points below the line are left as they are.
+        delta = np.where(2 * ry <= rx, 0, -((rx - 2 * ry) // 3))
+        n = rx + delta
+        m = (n + 1) // 2 - (ry - delta)
+
+        # Special case (2, 2).
+        special = (rx == 2) & (ry == 2)
+        n = np.where(special, 5, n)
+        m = np.where(special, 0, m)
+
+        return n, m
+
+
+    def _fvalue(self, n: np.ndarray, m: np.ndarray) -> np.ndarray:
+        """
+        Compute sequence values for arrays of indices (n, m). Array version of
+        Sequence.value, combining the diagonal and vertical components.
+
+        Args:
+            n (np.ndarray): The primary sequence indices.
+            m (np.ndarray): The secondary sequence indices.
+
+        Returns:
+            np.ndarray: The minimum number of moves for each pair of indices.
+        """
+        n_odd = n % 2
+        m_odd = m % 2
+        diagonal = (n + 3 * n_odd) // 2
+        vertical = (1 - n_odd) * m_odd - n_odd * m_odd
+
+        # Special case (1, 1).
+        return np.where((n == 1) & (m == 1), 3, diagonal + vertical)
+
+
+    def _fquad(self, dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+        """
+        Determine the rotation index (0 to 3) for every distance vector. Array version
+        of KnightQuest._fquad, with the adjacent square rotation wrapped modulo 4.
+
+        Args:
+            dx (np.ndarray): The x-components of the distance vectors.
+            dy (np.ndarray): The y-components of the distance vectors.
+
+        Returns:
+            np.ndarray: Rotation indices (0 to 3).
+        """
+        theta = np.where(dx >= 0, np.where(dy >= 0, 0, 3), np.where(dy >= 0, 1, 2))
+
+        # Adjacent square adjustment.
+        theta += (np.abs(dx) == 1) & (np.abs(dy) == 1)
+
+        return theta % 4
+
+
+    def _fvalue_of(self, dx: np.ndarray, dy: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the minimum number of moves for arrays of distance vector components.
+
+        Args:
+            dx (np.ndarray): The x-components of the distance vectors.
+            dy (np.ndarray): The y-components of the distance vectors.
+
+        Returns:
+            np.ndarray: The minimum number of moves for each distance vector.
+        """
+        rx, ry = self._fref(dx, dy)
+        n, m = self._fseq(rx, ry)
+        return self._fvalue(n, m)
+
+
+    def _fmove(self, A: np.ndarray, P: np.ndarray) -> np.ndarray:
+        """
+        Compute the next knight move towards A for every current path endpoint in P.
+        Array version of KnightQuest.fmove, following the same move selection rules:
+          - A distance that is an integer multiple of a base move is walked with that unit move.
+          - Otherwise the rotated (1, 2) candidate is taken if it decreases the evaluation by one,
+          - then the rotated (2, 1) candidate,
+          - and as a fallback the candidate better aligned with the distance vector.
+
+        Since an integer multiple stays an integer multiple of the same unit move after one
+        step, emitting a single unit step per call yields the same path as the scalar version.
+
+        Args:
+            A (np.ndarray): Starting positions, shape (K, 2).
+            P (np.ndarray): Current path endpoints, shape (K, 2).
+
+        Returns:
+            np.ndarray: The moves to apply to P, shape (K, 2).
+        """
+        dx = A[:, 0] - P[:, 0]
+        dy = A[:, 1] - P[:, 1]
+        s = self._fvalue_of(dx, dy)
+
+        theta = self._fquad(dx, dy)
+        cu = self.ROT_U[theta]
+        cv = self.ROT_V[theta]
+        su = self._fvalue_of(dx - cu[:, 0], dy - cu[:, 1])
+        sv = self._fvalue_of(dx - cv[:, 0], dy - cv[:, 1])
+
+        # Integer multiples of a base knight move.
+        hi = np.maximum(dx, dy)
+        lo = np.minimum(dx, dy)
+        multiple = (lo != 0) & (np.abs(hi) == 2 * np.abs(lo))
+        count = np.maximum(np.maximum(np.abs(dx), np.abs(dy)) // 2, 1)
+        unit = np.stack((dx // count, dy // count), axis=1)
+
+        # Fallback on the candidate whose vector aligns better with the distance vector.
+        dot_u = cu[:, 0] * dx + cu[:, 1] * dy
+        dot_v = cv[:, 0] * dx + cv[:, 1] * dy
+        fallback = ~multiple & (s - su != 1) & (s - sv != 1)
+        self.fallback_count += int(np.count_nonzero(fallback))
+
+        move = np.where((dot_u >= dot_v)[:, None], cu, cv)
+        move = np.where((s - sv == 1)[:, None], cv, move)
+        move = np.where((s - su == 1)[:, None], cu, move)
+        return np.where(multiple[:, None], unit, move)
+
+
+    def feval(self, A: np.ndarray, B: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the minimum number of knight moves for every (A[i], B[i]) pair.
+        Gives the same result as KnightQuest.feval element for element.
+
+        Args:
+            A (np.ndarray): Array-like of shape (N, 2) with the starting positions.
+            B (np.ndarray): Array-like of shape (N, 2) with the target positions.
+
+        Returns:
+            np.ndarray: Array of shape (N,) with the minimum number of moves.
+        """
+        A = self._fcoords(A)
+        B = self._fcoords(B)
+
+        return self._fvalue_of(A[:, 0] - B[:, 0], A[:, 1] - B[:, 1])
+
+
+    def fpath(self) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Construct the knight paths for all (A[i], B[i]) pairs in CSR layout. Like
+        KnightQuest.fpath, each path is built from the target back to the start, but the
+        points are written directly into their final slots, so no reversal is needed.
+        All unfinished paths advance one move per iteration.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]:
+                - coords: int32 array of shape (total, 2) with all path points, A to B.
+                - offsets: int64 array of shape (N + 1,); path i is coords[offsets[i]:offsets[i + 1]].
+        """
+        # Paths may overshoot the endpoints by a square or two near the end.
+        limit = np.iinfo(np.int32).max - 2
+        if self.A.size and max(np.abs(self.A).max(), np.abs(self.B).max()) > limit:
+            raise ValueError("Coordinates do not fit into the int32 path buffer.")
+
+        lengths = self.feval(self.A, self.B) + 1
+        offsets = np.zeros(len(lengths) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        coords = np.empty((offsets[-1], 2), dtype=np.int32)
+
+        # Paths grow from the last slot (B) down to the first one (A).
+        slot = offsets[1:] - 1
+        coords[slot] = self.B
+
+        active = np.flatnonzero(lengths > 1)
+        A = self.A[active]
+        P = self.B[active]
+        slot = slot[active]
+
+        while active.size:
+            P = P + self._fmove(A, P)
+            slot -= 1
+            coords[slot] = P
+
+            # Paths whose first slot has been written are complete.
+            running = slot > offsets[active]
+            if not running.all():
+                active = active[running]
+                A = A[running]
+                P = P[running]
+                slot = slot[running]
+
+        return coords, offsets
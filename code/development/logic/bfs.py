@@ -1,32 +1,135 @@
 
-from collections import deque
+from typing import Optional
+import numpy as np
 from model.point import Point
 
 class KnightBFS:
     """
-    Performs a brute-force Breadth-First Search (BFS) to find the shortest path 
+    Performs a brute-force Breadth-First Search (BFS) to find the shortest path
     for a knight from a start position to an end position on an infinite board.
 
+    The search is bidirectional: it grows one BFS level at a time from both A and B,
+    always expanding the smaller frontier, until the two searches meet. Each visited
+    square stores only its parent, and the path is reconstructed from the meeting square
+    once the searches meet. Squares are kept as complex numbers x + yi during the search,
+    which hash and add much faster than Point instances. The search runs on offsets from A,
+    so the floats stay exact however large the coordinates are, and the path is translated
+    back to A with integer arithmetic.
+
     Attributes:
         KNIGHT_MOVES(arr[Point]): List of all moves knight can make
+        FIELD_MARGIN(int): Extra squares searched around a distance field, so that shortest
+            paths to squares near its border may leave the reported region.
     """
     KNIGHT_MOVES = [
         Point(-2, -1), Point(-1, -2), Point(1, -2), Point(2, -1),
         Point(2, 1), Point(1, 2), Point(-1, 2), Point(-2, 1)
     ]
+    FIELD_MARGIN = 4
 
 
-    def __init__(self, A: 'Point', B: 'Point') -> None:
+    def __init__(self, A: 'Point', B: 'Point', obstacles: Optional[set] = None) -> None:
         """
         Initialize the KnightBFS with a starting point A and target point B.
 
         Args:
             A (Point): The starting position of the knight.
             B (Point): The target position to reach.
+            obstacles (Optional[set[Point]]): Blocked squares. The target must be reachable,
+                otherwise the search on the infinite board does not end (default None).
         """
         self.A = A
         self.B = B
 
+        self.visited = 0
+        self._blocked = {complex(P.x - A.x, P.y - A.y) for P in obstacles or ()}
+
+        self._moves = [complex(move.x, move.y) for move in self.KNIGHT_MOVES]
+
+
+    def _fexpand(self, frontier: list, visited: dict, other: dict, track: bool) -> tuple:
+        """
+        Expand one BFS level of one side of the search.
+
+        Since all squares closer than the current levels were already checked against
+        each other, the first square found in the other side's visited squares lies
+        on a shortest path and the expansion stops there.
+
+        Args:
+            frontier (list): The squares of the current level.
+            visited (dict|set): The squares visited by this side (mapped to their parents if tracked).
+            other (dict|set): The squares visited by the other side.
+            track (bool): Whether to record parent pointers.
+
+        Returns:
+            tuple: The next level and the meeting square (None if the sides did not meet).
+        """
+        level = []
+
+        for current in frontier:
+            for move in self._moves:
+                next_pos = current + move
+
+                if next_pos not in visited and next_pos not in self._blocked:
+                    if track:
+                        visited[next_pos] = current
+                    else:
+                        visited.add(next_pos)
+
+                    if next_pos in other:
+                        return level, next_pos
+
+                    level.append(next_pos)
+
+        return level, None
+
+
+    def _fsearch(self, track: bool) -> tuple:
+        """
+        Run the bidirectional search from A and B until both sides meet.
+
+        Args:
+            track (bool): Whether to record parent pointers for path reconstruction.
+
+        Returns:
+            tuple: The meeting square, the distance, and the visited squares from A and from B,
+            all as offsets from A.
+        """
+        start = 0j
+        end = complex(self.B.x - self.A.x, self.B.y - self.A.y)
+
+        visited_a = {start: None} if track else {start}
+        visited_b = {end: None} if track else {end}
+        frontier_a, frontier_b = [start], [end]
+        depth_a = depth_b = 0
+
+        if start == end:
+            self.visited = 1
+            return start, 0, visited_a, visited_b
+
+        while True:
+            if len(frontier_a) <= len(frontier_b):
+                frontier_a, meet = self._fexpand(frontier_a, visited_a, visited_b, track)
+                depth_a += 1
+            else:
+                frontier_b, meet = self._fexpand(frontier_b, visited_b, visited_a, track)
+                depth_b += 1
+
+            if meet is not None:
+                self.visited = len(visited_a) + len(visited_b)
+                return meet, depth_a + depth_b, visited_a, visited_b
+
+
+    def fdist(self) -> int:
+        """
+        Execute the search in distance-only mode: no parent pointers are stored
+        and no path is built.
+
+        Returns:
+            int: The minimum number of knight moves from start to end.
+        """
+        return self._fsearch(track=False)[1]
+
 
     def fpath(self) -> list:
         """
@@ -35,23 +138,60 @@ class KnightBFS:
         Returns:
             Optional[List[Point]]: The shortest path as a list of Points.
         """
-        if self.A == self.B:
-            return [self.A]
+        meet, _, parents_a, parents_b = self._fsearch(track=True)
 
-        visited = set()
-        queue = deque([(self.A, [self.A])])
+        # Walk from the meeting square back to A, then forward to B.
+        path = []
+        node = meet
+        while node is not None:
+            path.append(node)
+            node = parents_a[node]
+        path.reverse()
+
+        node = parents_b[meet]
+        while node is not None:
+            path.append(node)
+            node = parents_b[node]
+
+        x, y = self.A
+        return [Point(x + int(z.real), y + int(z.imag)) for z in path]
+
+
+    @classmethod
+    def ffield(cls, radius: int) -> np.ndarray:
+        """
+        Compute the distance field of a single BFS from the origin. Since the knight metric
+        is translation-invariant, field[dx + radius, dy + radius] is the minimum number of
+        moves between any two squares A and B with B - A = (dx, dy), |dx|, |dy| <= radius.
+
+        The search runs level by level on a flat grid: every level is an array of cell
+        indices, and the next one is formed by adding the 8 move offsets to all of them
+        at once. The grid is framed by a 2-cell border marked as visited, so moves never
+        leave the grid.
+
+        Args:
+            radius (int): The half-width of the square region to cover.
+
+        Returns:
+            np.ndarray: int32 array of shape (2 * radius + 1, 2 * radius + 1) with the distances.
+        """
+        half = radius + cls.FIELD_MARGIN + 2
+        width = 2 * half + 1
 
-        while queue:
-            current_pos, path = queue.popleft()
+        dist = np.full((width, width), -1, dtype=np.int32)
+        dist[:2, :] = dist[-2:, :] = dist[:, :2] = dist[:, -2:] = np.iinfo(np.int32).max
 
-            if current_pos == self.B:
-                return path
+        flat = dist.reshape(-1)
+        offsets = np.array([move.x * width + move.y for move in cls.KNIGHT_MOVES])
 
-            for move in self.KNIGHT_MOVES:
-                next_pos = current_pos + move
-                if next_pos not in visited:
-                    visited.add(next_pos)
-                    queue.append((next_pos, path + [next_pos]))
+        frontier = np.array([half * width + half])
+        flat[frontier] = 0
+        level = 0
 
-        return [] 
+        while frontier.size:
+            level += 1
+            neighbours = (frontier[:, None] + offsets).ravel()
+            frontier = np.unique(neighbours[flat[neighbours] == -1])
+            flat[frontier] = level
 
+        return dist[half - radius:half + radius + 1, half - radius:half + radius + 1].copy()
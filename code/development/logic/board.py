@@ -0,0 +1,326 @@
+
+from typing import Optional
+from collections import OrderedDict
+import numpy as np
+from model.point import Point
+from logic.kq import KnightQuest
+from logic.table import KnightTable
+
+class KnightBoard:
+    """
+    Evaluates minimum knight moves and reconstructs paths on a bounded N x M board with
+    squares (0, 0) to (N - 1, M - 1). The infinite-plane formula of KnightQuest ignores the
+    board edges, which matters near them: on 8x8, a corner and its diagonal neighbour are
+    4 moves apart, not 2.
+
+    Distances are looked up in all-pairs tables built by BFS once per board size and shared
+    by every KnightBoard of that size:
+      - Boards of at most FULL_TABLE_SQUARES squares get a full table over all pairs of
+        squares.
+      - On larger boards with both sides at least CORNER_SIZE the board distance only
+        differs from the infinite-plane one between a corner and its diagonal neighbour, so
+        only the pairs within each CORNER_SIZE x CORNER_SIZE corner window are tabled, and
+        KnightQuest.feval answers everything else.
+      - Larger boards with a side shorter than CORNER_SIZE differ from the plane everywhere,
+        and a full table would grow with the square of the long side. They get no table:
+        queries are answered from BFS distance fields of the query squares, of which the
+        FIELD_CACHE most recently used are kept.
+
+    Table entries are uint8, or uint16 when a distance does not fit. The largest value of
+    the dtype marks unreachable squares. Tables can be saved with fsave and memory-mapped
+    from the file by later processes instead of being rebuilt.
+
+    Attributes:
+        N (int): Board size along x.
+        M (int): Board size along y.
+        CORNER_SIZE (int): Side of the corner windows tabled on large boards.
+        FULL_TABLE_SQUARES (int): Largest board area that gets a full all-pairs table.
+        FIELD_CACHE (int): Distance fields kept per board without tables.
+    """
+    CORNER_SIZE = 5
+    FULL_TABLE_SQUARES = 1024
+    FIELD_CACHE = 8
+
+    KNIGHT_MOVES = [
+        Point(-2, -1), Point(-1, -2), Point(1, -2), Point(2, -1),
+        Point(2, 1), Point(1, 2), Point(-1, 2), Point(-2, 1)
+    ]
+
+    _tables = {}
+
+
+    def __init__(self, N: int, M: int, path: Optional[str] = None) -> None:
+        """
+        Initialize the KnightBoard for an N x M board. The tables of each board size are
+        loaded from path, or built when no path is given, on first use.
+
+        Args:
+            N (int): Board size along x.
+            M (int): Board size along y.
+            path (Optional[str]): Table file written by fsave for this board size (default None).
+        """
+        if N < 1 or M < 1:
+            raise ValueError(f"Invalid board size: {N}x{M}.")
+
+        self.N = N
+        self.M = M
+
+        self._kq = KnightQuest(Point(0, 0), Point(0, 0))
+        self._full = N * M <= self.FULL_TABLE_SQUARES
+        self._narrow = not self._full and min(N, M) < self.CORNER_SIZE
+        self._fields = OrderedDict()
+
+        if (N, M) not in self._tables:
+            self._tables[(N, M)] = self._fbuild() if path is None else self._fload(path)
+
+        self.table, self.corners = self._tables[(N, M)]
+        self._origins = self._fcorners()
+        tables = self.corners if self.table is None else self.table
+        self.unreachable = -1 if tables is None else np.iinfo(tables.dtype).max
+
+
+    def ffield(self, source: 'Point') -> np.ndarray:
+        """
+        Compute the board distances from a source square with a level-by-level BFS.
+        The grid is framed by a 2-cell border marked as visited, so moves never leave it.
+
+        Args:
+            source (Point): The square to start from.
+
+        Returns:
+            np.ndarray: int32 array of shape (N, M) with the distances, -1 where unreachable.
+        """
+        width = self.M + 4
+        dist = np.full((self.N + 4, width), -1, dtype=np.int32)
+        dist[:2, :] = dist[-2:, :] = dist[:, :2] = dist[:, -2:] = np.iinfo(np.int32).max
+
+        flat = dist.reshape(-1)
+        offsets = np.array([move.x * width + move.y for move in self.KNIGHT_MOVES])
+
+        frontier = np.array([(source.x + 2) * width + source.y + 2])
+        flat[frontier] = 0
+        level = 0
+
+        while frontier.size:
+            level += 1
+            neighbours = (frontier[:, None] + offsets).ravel()
+            frontier = np.unique(neighbours[flat[neighbours] == -1])
+            flat[frontier] = level
+
+        return dist[2:-2, 2:-2]
+
+
+    def _fdistances(self, P: 'Point') -> np.ndarray:
+        """
+        Return the distance field of a square on a board without tables, running the BFS
+        only if the field is not among the FIELD_CACHE most recently used.
+
+        Args:
+            P (Point): The square.
+
+        Returns:
+            np.ndarray: The distances from P, as returned by ffield.
+        """
+        fields = self._fields
+        field = fields.get(P)
+
+        if field is not None:
+            fields.move_to_end(P)
+            return field
+
+        field = fields[P] = self.ffield(P)
+        if len(fields) > self.FIELD_CACHE:
+            fields.popitem(last=False)
+
+        return field
+
+
+    def _fbuild(self) -> tuple:
+        """
+        Build the distance tables for this board size.
+
+        Returns:
+            tuple: The full table of shape (N * M, N * M), indexed by x * M + y, or None;
+            and the corner tables of shape (4, C * C, C * C), indexed by window-relative
+            x * C + y, or None. Both are None for narrow boards, which have no tables.
+        """
+        if self._narrow:
+            return None, None
+
+        if self._full:
+            table = np.empty((self.N * self.M, self.N * self.M), dtype=np.int32)
+
+            for x in range(self.N):
+                for y in range(self.M):
+                    table[x * self.M + y] = self.ffield(Point(x, y)).reshape(-1)
+
+            return KnightTable.fpack(table), None
+
+        size = self.CORNER_SIZE
+        corners = np.empty((4, size * size, size * size), dtype=np.int32)
+
+        for k, corner in enumerate(self._fcorners()):
+            for x in range(size):
+                for y in range(size):
+                    dist = self.ffield(corner + Point(x, y))
+                    window = dist[corner.x:corner.x + size, corner.y:corner.y + size]
+                    corners[k, x * size + y] = window.reshape(-1)
+
+        return None, KnightTable.fpack(corners)
+
+
+    def _fload(self, path: str) -> tuple:
+        """
+        Memory-map the distance tables for this board size from a table file.
+
+        Args:
+            path (str): The table file path.
+
+        Returns:
+            tuple: The full table or None, and the corner tables or None, as in _fbuild.
+        """
+        if self._narrow:
+            raise ValueError(f"A {self.N}x{self.M} board has no distance tables.")
+
+        table = KnightTable.load(path)
+
+        if table.kind not in (KnightTable.BOARD_FULL, KnightTable.BOARD_CORNERS) or table.params != (self.N, self.M):
+            raise ValueError(f"{path} does not hold the tables of a {self.N}x{self.M} board.")
+        if (table.kind == KnightTable.BOARD_FULL) != self._full:
+            raise ValueError(f"{path} holds the wrong kind of table for a {self.N}x{self.M} board.")
+
+        if table.kind == KnightTable.BOARD_FULL:
+            return table.data, None
+
+        return None, table.data
+
+
+    def fsave(self, path: str) -> None:
+        """
+        Write the distance tables of this board size to a table file.
+
+        Args:
+            path (str): Destination file path.
+        """
+        if self._narrow:
+            raise ValueError(f"A {self.N}x{self.M} board has no distance tables.")
+
+        if self.table is not None:
+            KnightTable(KnightTable.BOARD_FULL, (self.N, self.M), self.table).save(path)
+        else:
+            KnightTable(KnightTable.BOARD_CORNERS, (self.N, self.M), self.corners).save(path)
+
+
+    def _fcorners(self) -> list:
+        """
+        Lower-left squares of the four corner windows.
+
+        Returns:
+            list[Point]: The window origins, in the order of the corner tables.
+        """
+        size = self.CORNER_SIZE
+        return [
+            Point(0, 0), Point(self.N - size, 0),
+            Point(0, self.M - size), Point(self.N - size, self.M - size)
+        ]
+
+
+    def _fcheck(self, P: 'Point') -> None:
+        """
+        Raise a ValueError if a square does not lie on the board.
+
+        Args:
+            P (Point): The square to check.
+        """
+        if not (0 <= P.x < self.N and 0 <= P.y < self.M):
+            raise ValueError(f"{P} is outside the {self.N}x{self.M} board.")
+
+
+    def _flookup(self, A: 'Point', B: 'Point') -> int:
+        """
+        Look up the board distance between two on-board squares.
+
+        Args:
+            A (Point): The starting square.
+            B (Point): The target square.
+
+        Returns:
+            int: The minimum number of moves, -1 if B cannot be reached.
+        """
+        if self._narrow:
+            # Distances are symmetric, so a cached field of B serves as well as one of A.
+            field = self._fields.get(B)
+            if field is not None:
+                return int(field[A.x, A.y])
+
+            return int(self._fdistances(A)[B.x, B.y])
+
+        if self.table is not None:
+            value = int(self.table[A.x * self.M + A.y, B.x * self.M + B.y])
+        else:
+            size = self.CORNER_SIZE
+
+            for k, corner in enumerate(self._origins):
+                a = A - corner
+                b = B - corner
+
+                if 0 <= a.x < size and 0 <= a.y < size and 0 <= b.x < size and 0 <= b.y < size:
+                    value = int(self.corners[k, a.x * size + a.y, b.x * size + b.y])
+                    break
+            else:
+                return self._kq.feval(A, B)
+
+        return -1 if value == self.unreachable else value
+
+
+    def feval(self, A: 'Point', B: 'Point') -> int:
+        """
+        Evaluate the minimum number of knight moves from A to B on the board.
+
+        Args:
+            A (Point): The starting square.
+            B (Point): The target square.
+
+        Returns:
+            int: The minimum number of moves, -1 if B cannot be reached.
+        """
+        self._fcheck(A)
+        self._fcheck(B)
+
+        return self._flookup(A, B)
+
+
+    def fpath(self, A: 'Point', B: 'Point') -> list:
+        """
+        Construct a shortest knight path from A to B on the board by walking down the
+        distance table: every step moves to an on-board neighbour whose distance to B
+        is one less than the current one.
+
+        Args:
+            A (Point): The starting square.
+            B (Point): The target square.
+
+        Returns:
+            list: The list of path squares (Points) from A to B, empty if B cannot be reached.
+        """
+        remaining = self.feval(A, B)
+        if remaining < 0:
+            return []
+
+        if self._narrow:
+            # Every step looks up its distance to B, so keep the field of B at hand.
+            self._fdistances(B)
+
+        path = [A]
+        while remaining > 0:
+            current = path[-1]
+
+            for move in self.KNIGHT_MOVES:
+                P = current + move
+
+                if 0 <= P.x < self.N and 0 <= P.y < self.M and self._flookup(P, B) == remaining - 1:
+                    path.append(P)
+                    remaining -= 1
+                    break
+
+        return path
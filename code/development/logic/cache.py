@@ -0,0 +1,235 @@
+
+import sys
+from collections import OrderedDict
+import numpy as np
+from model.point import Point
+from logic.kq import KnightQuest
+from logic.packed import KnightPackedPath
+
+class KnightPathCache:
+    """
+    Bounded LRU cache of shortest knight paths keyed by the canonical distance vector.
+
+    A shortest path from A to B moved by any translation, or by any of the 8 symmetries of
+    the board (swapping x and y, negating either), is a shortest path between the moved
+    squares. So every pair with the same reflected distance (max(|dx|, |dy|), min(|dx|, |dy|)),
+    the canonical vector _fref also uses, shares one cache entry: a KnightPackedPath from the
+    origin to the canonical vector, mapped back to the actual A and B on every hit.
+
+    Entries are kept in least recently used order and evicted once their total size exceeds
+    max_bytes. The size of an entry counts the packed payload and the objects holding it:
+    the KnightPackedPath instance and its __dict__, the key tuple and its ints, and the
+    OrderedDict node. The start square of every entry is the shared, interned origin. Paths
+    larger than max_bytes on their own are returned but not cached.
+
+    The returned paths are shortest paths, but not necessarily the squares
+    KnightQuest(A, B).fpath() would return for the actual A and B.
+
+    Attributes:
+        max_bytes (int): The limit on the total size of the cache entries, in bytes.
+        nbytes (int): The current total size of the cache entries, in bytes.
+        hits (int): Lookups answered from the cache.
+        misses (int): Lookups that computed a new path.
+        evictions (int): Entries dropped to stay within max_bytes.
+    """
+    # The move vectors of the packed codes mapped back from the canonical octant, indexed by
+    # [x and y swapped, x negated, y negated].
+    _SYMMETRIES = np.empty((2, 2, 2, 8, 2), dtype=np.int64)
+    for _swap in (0, 1):
+        for _nx in (0, 1):
+            for _ny in (0, 1):
+                _vectors = KnightPackedPath._VECTORS[:, ::-1] if _swap else KnightPackedPath._VECTORS
+                _SYMMETRIES[_swap, _nx, _ny] = _vectors * (-1 if _nx else 1, -1 if _ny else 1)
+    del _swap, _nx, _ny, _vectors
+
+    # Approximate bytes per OrderedDict entry: the hash table slot, its index and the node
+    # of the order list, measured at about 85 to 105 bytes depending on the table load.
+    _NODE_BYTES = 104
+
+    # Bytes of every entry besides its key and payload: the node, and the KnightPackedPath
+    # instance with its __dict__, measured once on an empty path so that the __dict__ of
+    # cached paths is never materialized.
+    _sample = KnightPackedPath(Point(0, 0), 0, b"")
+    _ENTRY_BYTES = _NODE_BYTES + sys.getsizeof(_sample) + sys.getsizeof(vars(_sample))
+    del _sample
+
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024) -> None:
+        """
+        Initialize an empty KnightPathCache.
+
+        Args:
+            max_bytes (int): The limit on the total size of the cache entries, in bytes
+                (default 64 MiB).
+        """
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._entries = OrderedDict()
+
+
+    def __len__(self) -> int:
+        """
+        Number of cached paths.
+
+        Returns:
+            int: The number of entries.
+        """
+        return len(self._entries)
+
+
+    @classmethod
+    def _fsize(cls, key: tuple, packed: 'KnightPackedPath') -> int:
+        """
+        Estimate the memory held by one cache entry.
+
+        Args:
+            key (tuple[int, int]): The canonical distance vector of the entry.
+            packed (KnightPackedPath): The cached path.
+
+        Returns:
+            int: The size of the entry, in bytes.
+        """
+        return (
+            cls._ENTRY_BYTES + sys.getsizeof(packed.data)
+            + sys.getsizeof(key) + sys.getsizeof(key[0]) + sys.getsizeof(key[1])
+        )
+
+
+    def _fentry(self, key: tuple) -> 'KnightPackedPath':
+        """
+        Look up the canonical path of a key, computing and caching it on a miss.
+
+        Args:
+            key (tuple[int, int]): The canonical distance vector (a, b), a >= b >= 0.
+
+        Returns:
+            KnightPackedPath: The packed path from the origin to (a, b).
+        """
+        entries = self._entries
+        packed = entries.get(key)
+
+        if packed is not None:
+            self.hits += 1
+            entries.move_to_end(key)
+            return packed
+
+        self.misses += 1
+        packed = KnightPackedPath.from_points(KnightQuest(Point(0, 0), Point(*key)).fpath())
+        size = self._fsize(key, packed)
+
+        if size <= self.max_bytes:
+            while self.nbytes + size > self.max_bytes:
+                self.nbytes -= self._fsize(*entries.popitem(last=False))
+                self.evictions += 1
+
+            entries[key] = packed
+            self.nbytes += size
+
+        return packed
+
+
+    def fcoords(self, A: 'Point', B: 'Point') -> np.ndarray:
+        """
+        Return a shortest path from A to B as coordinates, from the cache when possible.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+
+        Returns:
+            np.ndarray: An int64 array of shape (moves + 1, 2) with the squares from A to B.
+        """
+        return self.fplace(self._fentry(self.fkey(A, B)), A, B)
+
+
+    @staticmethod
+    def fkey(A: 'Point', B: 'Point') -> tuple:
+        """
+        Compute the canonical distance vector shared by all pairs related to (A, B) by a
+        translation or a symmetry of the board.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+
+        Returns:
+            tuple[int, int]: The canonical vector (a, b), a >= b >= 0.
+        """
+        ax, ay = abs(B.x - A.x), abs(B.y - A.y)
+        return (ay, ax) if ay > ax else (ax, ay)
+
+
+    @classmethod
+    def fplace(cls, packed: 'KnightPackedPath', A: 'Point', B: 'Point') -> np.ndarray:
+        """
+        Map a packed path from the origin to the canonical vector of (A, B) back to a path
+        from A to B.
+
+        Args:
+            packed (KnightPackedPath): The path from the origin to fkey(A, B).
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+
+        Returns:
+            np.ndarray: An int64 array of shape (moves + 1, 2) with the squares from A to B.
+        """
+        dx = B.x - A.x
+        dy = B.y - A.y
+        vectors = cls._SYMMETRIES[int(abs(dy) > abs(dx)), int(dx < 0), int(dy < 0)]
+
+        coords = np.empty((packed.length + 1, 2), dtype=np.int64)
+        coords[0] = (A.x, A.y)
+        np.cumsum(vectors[packed.fcodes()], axis=0, out=coords[1:])
+        coords[1:] += coords[0]
+
+        return coords
+
+
+    def fpath(self, A: 'Point', B: 'Point') -> list:
+        """
+        Return a shortest path from A to B as Points, from the cache when possible.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+
+        Returns:
+            list: The list of path segment (Points) from A to B.
+        """
+        return Point.from_pairs(self.fcoords(A, B).tolist())
+
+
+    def stats(self) -> dict:
+        """
+        Summarize the cache usage.
+
+        Returns:
+            dict: Entries, bytes, limit, hits, misses, evictions and the hit rate.
+        """
+        lookups = self.hits + self.misses
+
+        return {
+            "entries": len(self._entries),
+            "nbytes": self.nbytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / lookups if lookups else 0
+        }
+
+
+    def clear(self) -> None:
+        """
+        Drop all entries and reset the statistics.
+        """
+        self._entries.clear()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
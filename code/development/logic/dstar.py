@@ -0,0 +1,338 @@
+
+import heapq
+import itertools
+from typing import Optional
+from model.point import Point
+from logic.kq import KnightQuest
+
+class KnightDStarLite:
+    """
+    Incremental knight path planner for obstacles that appear and disappear over time,
+    based on D* Lite (Koenig & Likhachev). The search runs backward from the target B,
+    keeping for every touched square its distance estimate g and one-step lookahead rhs.
+    After obstacle updates only the squares whose estimates became inconsistent are
+    re-expanded, so a small change near the path costs a small repair instead of a new
+    search. KnightQuest.feval from the start is the heuristic.
+
+    The start may also move along the path (move_start); the key modifier km keeps the
+    queued priorities valid without reordering the queue.
+
+    Squares are complex numbers x + yi internally, holding the offset from the target B,
+    which stays exact as a float however large the coordinates are and does not change
+    when the start moves. The priority queue is a binary heap with
+    lazy deletion: every queued square maps to its current key, and heap entries whose key
+    no longer matches are skipped.
+
+    Attributes:
+        A (Point): The current position of the knight.
+        B (Point): The target position to reach.
+        expanded (int): Squares expanded since the counters were last reset.
+        updated (int): Square estimates recomputed since the counters were last reset.
+    """
+    KNIGHT_MOVES = [
+        Point(-2, -1), Point(-1, -2), Point(1, -2), Point(2, -1),
+        Point(2, 1), Point(1, 2), Point(-1, 2), Point(-2, 1)
+    ]
+    INF = float('inf')
+
+
+    def __init__(self, A: 'Point', B: 'Point', obstacles: Optional[set] = None,
+                 max_expanded: Optional[int] = None) -> None:
+        """
+        Initialize the KnightDStarLite with a starting point A, target point B and the
+        initial obstacles. No search is done until the first fpath call.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+            obstacles (Optional[set[Point]]): Initially blocked squares (default None).
+            max_expanded (Optional[int]): Give up a replanning after this many expansions.
+                Without a limit, a walled-in start is searched for forever (default None).
+        """
+        self.A = A
+        self.B = B
+
+        self.expanded = 0
+        self.updated = 0
+        self._max_expanded = max_expanded
+        self._kq = KnightQuest(A, B)
+        self._moves = [complex(move.x, move.y) for move in self.KNIGHT_MOVES]
+        self._blocked = {self._fsquare(P) for P in obstacles or ()}
+
+        self._start = self._fsquare(A)
+        self._goal = 0j
+        self._km = 0
+        self._g = {}
+        self._rhs = {self._goal: 0}
+        self._open = {}
+        self._heap = []
+        self._order = itertools.count()
+
+        self._fpush(self._goal)
+
+
+    def _fsquare(self, P: 'Point') -> complex:
+        """
+        Convert a square to its internal form, the offset from the target.
+
+        Args:
+            P (Point): The square.
+
+        Returns:
+            complex: The offset from B, x + yi.
+        """
+        return complex(P.x - self.B.x, P.y - self.B.y)
+
+
+    def _fh(self, a: complex, b: complex) -> int:
+        """
+        Heuristic: the obstacle-free minimum number of moves between two squares.
+
+        Args:
+            a (complex): The first square.
+            b (complex): The second square.
+
+        Returns:
+            int: The KnightQuest evaluation between a and b.
+        """
+        return self._kq.feval(Point(int(a.real), int(a.imag)), Point(int(b.real), int(b.imag)))
+
+
+    def _fkey(self, s: complex) -> tuple:
+        """
+        Compute the priority of a square: (min(g, rhs) + h(start, s) + km, min(g, rhs)).
+
+        Args:
+            s (complex): The square.
+
+        Returns:
+            tuple: The two-level priority key.
+        """
+        m = min(self._g.get(s, self.INF), self._rhs.get(s, self.INF))
+        return (m + self._fh(self._start, s) + self._km, m)
+
+
+    def _fpush(self, s: complex) -> None:
+        """
+        Queue a square with its current key, replacing any previous entry.
+
+        Args:
+            s (complex): The square.
+        """
+        key = self._fkey(s)
+        self._open[s] = key
+        heapq.heappush(self._heap, (key, next(self._order), s))
+
+
+    def _ftop(self) -> tuple:
+        """
+        Drop stale heap entries and return the smallest valid key.
+
+        Returns:
+            tuple: The smallest key in the queue, or (INF, INF) if it is empty.
+        """
+        while self._heap:
+            key, _, s = self._heap[0]
+
+            if self._open.get(s) == key:
+                return key
+
+            heapq.heappop(self._heap)
+
+        return (self.INF, self.INF)
+
+
+    def _fupdate(self, u: complex) -> None:
+        """
+        Recompute the one-step lookahead rhs of a square from its unblocked neighbours and
+        queue the square if it became inconsistent (g != rhs), or dequeue it otherwise.
+
+        Args:
+            u (complex): The square.
+        """
+        self.updated += 1
+
+        if u != self._goal:
+            rhs = self.INF
+
+            if u not in self._blocked:
+                for move in self._moves:
+                    s = u + move
+
+                    if s not in self._blocked:
+                        rhs = min(rhs, self._g.get(s, self.INF) + 1)
+
+            self._rhs[u] = rhs
+
+        if self._g.get(u, self.INF) != self._rhs.get(u, self.INF):
+            self._fpush(u)
+        else:
+            self._open.pop(u, None)
+
+
+    def _fcompute(self) -> bool:
+        """
+        Expand inconsistent squares in key order until the start is consistent and no
+        queued square could still improve it.
+
+        Returns:
+            bool: False if the expansion limit was hit, True otherwise.
+        """
+        while True:
+            top = self._ftop()
+            g_start = self._g.get(self._start, self.INF)
+
+            if not (top < self._fkey(self._start) or self._rhs.get(self._start, self.INF) != g_start):
+                return True
+            if top == (self.INF, self.INF):
+                return True
+
+            key, _, u = heapq.heappop(self._heap)
+            self.expanded += 1
+
+            if self._max_expanded is not None and self.expanded > self._max_expanded:
+                self._open[u] = key
+                heapq.heappush(self._heap, (key, next(self._order), u))
+                return False
+
+            new_key = self._fkey(u)
+            g = self._g.get(u, self.INF)
+            rhs = self._rhs.get(u, self.INF)
+
+            if key < new_key:
+                self._fpush(u)
+            elif g > rhs:
+                # Overconsistent: the square got closer, settle it and propagate.
+                self._g[u] = rhs
+                del self._open[u]
+
+                for move in self._moves:
+                    self._fupdate(u + move)
+            else:
+                # Underconsistent: the square got farther, reset it and its neighbours.
+                self._g[u] = self.INF
+                self._open.pop(u, None)
+
+                for move in self._moves:
+                    self._fupdate(u + move)
+                self._fupdate(u)
+
+
+    def _ftoggle(self, P: 'Point', blocked: bool) -> None:
+        """
+        Block or unblock a square and update the estimates of the square and of its
+        neighbours, whose edges to it changed cost.
+
+        Args:
+            P (Point): The square.
+            blocked (bool): Whether the square becomes blocked.
+        """
+        z = self._fsquare(P)
+
+        if (z in self._blocked) == blocked:
+            return
+
+        if blocked:
+            self._blocked.add(z)
+        else:
+            self._blocked.discard(z)
+
+        self._fupdate(z)
+
+        # Neighbours only see the square through g(z), so their lookahead cannot change
+        # while the square has never been settled.
+        if self._g.get(z, self.INF) != self.INF:
+            for move in self._moves:
+                self._fupdate(z + move)
+
+
+    def add_obstacle(self, P: 'Point') -> None:
+        """
+        Block a square. The path is repaired on the next fpath call.
+
+        Args:
+            P (Point): The square that became blocked.
+        """
+        self._ftoggle(P, True)
+
+
+    def remove_obstacle(self, P: 'Point') -> None:
+        """
+        Unblock a square. The path is repaired on the next fpath call.
+
+        Args:
+            P (Point): The square that became free.
+        """
+        self._ftoggle(P, False)
+
+
+    def move_start(self, P: 'Point') -> None:
+        """
+        Move the knight to a new square, typically the next square of the current path.
+
+        Args:
+            P (Point): The new position of the knight.
+        """
+        start = self._fsquare(P)
+        self._km += self._fh(self._start, start)
+        self._start = start
+        self.A = P
+
+
+    def reset_counters(self) -> None:
+        """
+        Reset the expanded and updated counters.
+        """
+        self.expanded = 0
+        self.updated = 0
+
+
+    def update(self, added: list = (), removed: list = ()) -> list:
+        """
+        Apply one tick of obstacle events and return the repaired path. The counters are
+        reset first, so afterwards they describe the work of this update alone.
+
+        Args:
+            added (list[Point]): Squares that became blocked.
+            removed (list[Point]): Squares that became free.
+
+        Returns:
+            list: The shortest path from A to B as a list of Points, empty if there is none.
+        """
+        self.reset_counters()
+
+        for P in added:
+            self.add_obstacle(P)
+        for P in removed:
+            self.remove_obstacle(P)
+
+        return self.fpath()
+
+
+    def fpath(self) -> list:
+        """
+        Bring the search up to date and follow the distance estimates from A to B.
+
+        Returns:
+            list: The shortest path from A to B as a list of Points, empty if the start or
+            target is blocked, the target is unreachable or the expansion limit was hit.
+        """
+        if self._start in self._blocked or self._goal in self._blocked:
+            return []
+
+        if not self._fcompute() or self._g.get(self._start, self.INF) == self.INF:
+            return []
+
+        path = [self._start]
+        current = self._start
+
+        # Each step goes to a neighbour whose distance estimate is one less.
+        for _ in range(int(self._g[self._start])):
+            current = min(
+                (current + move for move in self._moves if current + move not in self._blocked),
+                key=lambda s: self._g.get(s, self.INF)
+            )
+            path.append(current)
+
+        x, y = self.B
+        return [Point(x + int(z.real), y + int(z.imag)) for z in path]
@@ -0,0 +1,270 @@
+
+import struct
+import numpy as np
+from model.point import Point
+from logic.kq import KnightQuest
+
+class KnightPackedPath:
+    """
+    Compact knight path: the start square plus one 3-bit move code per step. Move code c
+    stands for MOVES[c], and step i occupies bits 3i to 3i + 2 of the little-endian bit
+    stream stored in data, so a path of n steps takes ceil(3n / 8) bytes instead of a list
+    of n + 1 Points. Unused bits of the last byte are zero.
+
+    Every 3-bit code is a legal knight move, so a packed path can only be wrong about where
+    it ends, which is_valid checks from the move counts without decoding any squares.
+
+    Attributes:
+        MOVES (tuple): The move vector of every move code.
+        start (Point): The first square of the path.
+        length (int): The number of steps.
+        data (bytes): The packed move codes.
+    """
+    MOVES = (
+        Point(-2, -1), Point(-1, -2), Point(1, -2), Point(2, -1),
+        Point(2, 1), Point(1, 2), Point(-1, 2), Point(-2, 1)
+    )
+    HEADER = struct.Struct("<qqQ")
+
+    # Move code of the step (dx, dy), indexed by (dx + 2) * 5 + dy + 2; -1 for non-moves.
+    _CODES = np.full(25, -1, dtype=np.int8)
+    for _code, _move in enumerate(MOVES):
+        _CODES[(_move.x + 2) * 5 + _move.y + 2] = _code
+    del _code, _move
+
+    _VECTORS = np.array(MOVES, dtype=np.int64)
+
+
+    def __init__(self, start: 'Point', length: int, data: bytes) -> None:
+        """
+        Initialize the KnightPackedPath from its start square and packed move codes.
+
+        Args:
+            start (Point): The first square of the path.
+            length (int): The number of steps.
+            data (bytes): The packed move codes, ceil(3 * length / 8) bytes.
+        """
+        if len(data) != (3 * length + 7) // 8:
+            raise ValueError(f"{length} steps need {(3 * length + 7) // 8} bytes, got {len(data)}.")
+
+        self.start = start
+        self.length = length
+        self.data = bytes(data)
+
+
+    @classmethod
+    def from_coords(cls, coords: np.ndarray) -> 'KnightPackedPath':
+        """
+        Encode a path given as an (n + 1, 2) integer array of squares.
+
+        Args:
+            coords (np.ndarray): The squares of the path in order.
+
+        Returns:
+            KnightPackedPath: The packed path.
+        """
+        coords = np.asarray(coords, dtype=np.int64).reshape(-1, 2)
+
+        if len(coords) == 0:
+            raise ValueError("A path has at least one square.")
+
+        steps = np.diff(coords, axis=0)
+        legal = np.all(np.abs(steps) <= 2, axis=1)
+        codes = np.full(len(steps), -1, dtype=np.int8)
+        codes[legal] = cls._CODES[(steps[legal, 0] + 2) * 5 + steps[legal, 1] + 2]
+
+        if np.any(codes < 0):
+            i = int(np.argmax(codes < 0))
+            raise ValueError(f"Step {i} from {tuple(coords[i].tolist())} to {tuple(coords[i + 1].tolist())} is not a knight move.")
+
+        bits = (codes[:, None].astype(np.uint8) >> np.arange(3, dtype=np.uint8)) & 1
+        data = np.packbits(bits.ravel(), bitorder="little").tobytes()
+
+        return cls(Point(int(coords[0, 0]), int(coords[0, 1])), len(steps), data)
+
+
+    @classmethod
+    def from_points(cls, path: list) -> 'KnightPackedPath':
+        """
+        Encode a path given as a list of Points.
+
+        Args:
+            path (list[Point]): The squares of the path in order.
+
+        Returns:
+            KnightPackedPath: The packed path.
+        """
+        return cls.from_coords(np.array(path, dtype=np.int64))
+
+
+    @classmethod
+    def from_kq(cls, A: 'Point', B: 'Point') -> 'KnightPackedPath':
+        """
+        Encode the KnightQuest path from A to B.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+
+        Returns:
+            KnightPackedPath: The packed KnightQuest path.
+        """
+        return cls.from_points(KnightQuest(A, B).fpath())
+
+
+    def __len__(self) -> int:
+        """
+        Number of steps of the path.
+
+        Returns:
+            int: The number of steps.
+        """
+        return self.length
+
+
+    def code(self, i: int) -> int:
+        """
+        Read the move code of step i without decoding the steps before it.
+
+        Args:
+            i (int): The step index, 0 <= i < length.
+
+        Returns:
+            int: The move code (0 to 7).
+        """
+        if not 0 <= i < self.length:
+            raise IndexError(f"Step {i} out of range for a path of {self.length} steps.")
+
+        bit = 3 * i
+        return (int.from_bytes(self.data[bit >> 3:(bit >> 3) + 2], "little") >> (bit & 7)) & 7
+
+
+    def move(self, i: int) -> 'Point':
+        """
+        Read the move vector of step i.
+
+        Args:
+            i (int): The step index, 0 <= i < length.
+
+        Returns:
+            Point: The move of step i.
+        """
+        return self.MOVES[self.code(i)]
+
+
+    def fcodes(self) -> np.ndarray:
+        """
+        Unpack all move codes at once.
+
+        Returns:
+            np.ndarray: The uint8 move codes of the steps in order.
+        """
+        bits = np.unpackbits(np.frombuffer(self.data, dtype=np.uint8), bitorder="little")
+        bits = bits[:3 * self.length].reshape(-1, 3)
+        return bits[:, 0] | (bits[:, 1] << 1) | (bits[:, 2] << 2)
+
+
+    def fcoords(self) -> np.ndarray:
+        """
+        Decode the squares of the path, vectorized.
+
+        Returns:
+            np.ndarray: An int64 array of shape (length + 1, 2) with the squares in order.
+        """
+        coords = np.empty((self.length + 1, 2), dtype=np.int64)
+        coords[0] = self.start
+        np.cumsum(self._VECTORS[self.fcodes()], axis=0, out=coords[1:])
+        coords[1:] += coords[0]
+        return coords
+
+
+    def __iter__(self):
+        """
+        Decode the squares of the path one at a time.
+
+        Yields:
+            Point: The squares of the path in order, start included.
+        """
+        x, y = self.start
+        yield self.start
+
+        data = self.data
+        moves = self.MOVES
+
+        for i in range(self.length):
+            bit = 3 * i
+            code = (int.from_bytes(data[bit >> 3:(bit >> 3) + 2], "little") >> (bit & 7)) & 7
+            x += moves[code][0]
+            y += moves[code][1]
+            yield Point(x, y)
+
+
+    def fpath(self) -> list:
+        """
+        Decode the path to a list of Points.
+
+        Returns:
+            list: The list of path segment (Points) in order.
+        """
+        return list(self)
+
+
+    def fend(self) -> 'Point':
+        """
+        Compute the last square of the path from the number of steps with each move code.
+
+        Returns:
+            Point: The last square of the path.
+        """
+        dx, dy = np.bincount(self.fcodes(), minlength=8) @ self._VECTORS
+        return Point(self.start.x + int(dx), self.start.y + int(dy))
+
+
+    def is_valid(self, A: 'Point', B: 'Point') -> bool:
+        """
+        Validates that the packed path:
+            - Begins at the correct start point.
+            - Ends at the correct target point.
+            - Has no stray bits after its last step.
+        Every move code is a legal knight move, so the steps need no checking.
+
+        Args:
+            A (Point): The expected starting point.
+            B (Point): The expected ending point.
+
+        Returns:
+            bool: True if the path is valid, False otherwise.
+        """
+        if self.start != A:
+            return False
+
+        if self.length % 8 and self.data[-1] >> (3 * self.length & 7):
+            return False
+
+        return self.fend() == B
+
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the path: start x, start y and length as little-endian 64-bit integers,
+        followed by the packed move codes.
+
+        Returns:
+            bytes: The serialized path.
+        """
+        return self.HEADER.pack(self.start.x, self.start.y, self.length) + self.data
+
+
+    @classmethod
+    def from_bytes(cls, buffer: bytes) -> 'KnightPackedPath':
+        """
+        Deserialize a path written by to_bytes.
+
+        Args:
+            buffer (bytes): The serialized path.
+
+        Returns:
+            KnightPackedPath: The packed path.
+        """
+        x, y, length = cls.HEADER.unpack_from(buffer)
+        return cls(Point(x, y), length, buffer[cls.HEADER.size:])
@@ -0,0 +1,215 @@
+
+import os
+from typing import Optional
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from logic.batch import KnightBatch
+
+class KnightParallel:
+    """
+    Splits a large set of (start, target) pairs across a pool of worker processes. Inputs
+    and results live in multiprocessing.shared_memory buffers: workers attach to them by
+    name, solve their chunk with KnightBatch and write move counts and CSR paths in place,
+    so only the (start, stop) range of each chunk is pickled between processes.
+
+    Attributes:
+        workers (int): Number of worker processes.
+        chunk_size (int): Number of pairs handed to a worker at a time.
+    """
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = 10000) -> None:
+        """
+        Initialize the KnightParallel solver.
+
+        Args:
+            workers (Optional[int]): Number of worker processes (default: number of CPUs).
+            chunk_size (int): Number of pairs per task (default: 10000).
+        """
+        if chunk_size < 1:
+            raise ValueError(f"Chunk size must be positive, got {chunk_size}.")
+
+        self.workers = workers or os.cpu_count() or 1
+        self.chunk_size = chunk_size
+
+
+    @staticmethod
+    def _fshare(blocks: list, specs: dict, key: str, shape: tuple, dtype: np.dtype, array: np.ndarray = None) -> None:
+        """
+        Create a shared memory block for an array, optionally filled with a copy of the given
+        array (fresh blocks are zero-filled), and record it in blocks and specs.
+
+        Args:
+            blocks (list): List collecting the created SharedMemory blocks.
+            specs (dict): Mapping of buffer key to its (name, shape, dtype) spec.
+            key (str): Key of the buffer in specs.
+            shape (tuple): Shape of the shared array.
+            dtype (np.dtype): Data type of the shared array.
+            array (np.ndarray): Optional initial content (default None).
+        """
+        dtype = np.dtype(dtype)
+        size = int(np.prod(shape)) * dtype.itemsize
+        shm = shared_memory.SharedMemory(create=True, size=max(size, 1))
+        blocks.append(shm)
+        specs[key] = (shm.name, shape, dtype.str)
+
+        if array is not None:
+            np.ndarray(shape, dtype=dtype, buffer=shm.buf)[...] = array
+
+
+    @staticmethod
+    def _fworker(task, specs: dict, start: int, stop: int) -> None:
+        """
+        Worker entry point: attach to the shared buffers by name, run the task on the chunk
+        [start, stop) and detach again. The array views are dropped before the blocks are
+        closed, since a block cannot be closed while views into it exist.
+
+        Args:
+            task (callable): One of the _f*_chunk functions.
+            specs (dict): Mapping of buffer key to its (name, shape, dtype) spec.
+            start (int): First pair index of the chunk.
+            stop (int): One past the last pair index of the chunk.
+        """
+        handles = [shared_memory.SharedMemory(name=name) for name, _, _ in specs.values()]
+
+        try:
+            arrays = {
+                key: np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+                for shm, (key, (_, shape, dtype)) in zip(handles, specs.items())
+            }
+            task(arrays, start, stop)
+        finally:
+            arrays = None
+            for shm in handles:
+                shm.close()
+
+
+    @staticmethod
+    def _feval_chunk(arrays: dict, start: int, stop: int) -> None:
+        """
+        Evaluate the move counts of pairs [start, stop) into the shared counts buffer.
+
+        Args:
+            arrays (dict): Shared arrays 'A', 'B' and 'counts'.
+            start (int): First pair index of the chunk.
+            stop (int): One past the last pair index of the chunk.
+        """
+        A = arrays['A'][start:stop]
+        B = arrays['B'][start:stop]
+        arrays['counts'][start:stop] = KnightBatch(A, B).feval(A, B)
+
+
+    @staticmethod
+    def _fpath_chunk(arrays: dict, start: int, stop: int) -> None:
+        """
+        Write the paths of pairs [start, stop) into the shared coordinate buffer at the
+        positions given by the shared offsets buffer.
+
+        Args:
+            arrays (dict): Shared arrays 'A', 'B', 'offsets' and 'coords'.
+            start (int): First pair index of the chunk.
+            stop (int): One past the last pair index of the chunk.
+        """
+        offsets = arrays['offsets']
+        coords, _ = KnightBatch(arrays['A'][start:stop], arrays['B'][start:stop]).fpath()
+        arrays['coords'][offsets[start]:offsets[stop]] = coords
+
+
+    def _frun(self, task, specs: dict, n: int) -> None:
+        """
+        Run a chunk task over all n pairs on the process pool.
+
+        Args:
+            task (callable): One of the _f*_chunk functions.
+            specs (dict): Buffer specs passed to every worker.
+            n (int): Total number of pairs.
+        """
+        with ProcessPoolExecutor(max_workers=self.workers) as pool:
+            futures = [
+                pool.submit(self._fworker, task, specs, start, min(start + self.chunk_size, n))
+                for start in range(0, n, self.chunk_size)
+            ]
+
+            for future in futures:
+                future.result()
+
+
+    def feval(self, A: np.ndarray, B: np.ndarray) -> np.ndarray:
+        """
+        Evaluate the minimum number of knight moves for every (A[i], B[i]) pair in parallel.
+
+        Args:
+            A (np.ndarray): Array-like of shape (N, 2) with the starting positions.
+            B (np.ndarray): Array-like of shape (N, 2) with the target positions.
+
+        Returns:
+            np.ndarray: Array of shape (N,) with the minimum number of moves.
+        """
+        return self._fsolve(A, B, paths=False)[0]
+
+
+    def fpath(self, A: np.ndarray, B: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Construct the knight paths for every (A[i], B[i]) pair in parallel. Move counts are
+        computed first so that the parent can lay out the CSR offsets, then every worker
+        writes its paths into its own disjoint region of the shared coordinate buffer.
+
+        Args:
+            A (np.ndarray): Array-like of shape (N, 2) with the starting positions.
+            B (np.ndarray): Array-like of shape (N, 2) with the target positions.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray, np.ndarray]:
+                - counts: int64 array of shape (N,) with the minimum number of moves.
+                - coords: int32 array of shape (total, 2) with all path points, A to B.
+                - offsets: int64 array of shape (N + 1,); path i is coords[offsets[i]:offsets[i + 1]].
+        """
+        return self._fsolve(A, B, paths=True)
+
+
+    def _fsolve(self, A: np.ndarray, B: np.ndarray, paths: bool) -> tuple:
+        """
+        Share the inputs, run the evaluation and optionally the path phase, and copy the
+        results out of shared memory before releasing it.
+
+        Args:
+            A (np.ndarray): Array-like of shape (N, 2) with the starting positions.
+            B (np.ndarray): Array-like of shape (N, 2) with the target positions.
+            paths (bool): Whether to construct the paths as well.
+
+        Returns:
+            tuple: (counts,) or (counts, coords, offsets).
+        """
+        A = KnightBatch._fcoords(A)
+        B = KnightBatch._fcoords(B)
+        n = len(A)
+        blocks = []
+        specs = {}
+
+        try:
+            self._fshare(blocks, specs, 'A', A.shape, A.dtype, A)
+            self._fshare(blocks, specs, 'B', B.shape, B.dtype, B)
+            self._fshare(blocks, specs, 'counts', (n,), np.int64)
+
+            self._frun(self._feval_chunk, specs, n)
+            counts = np.ndarray((n,), dtype=np.int64, buffer=blocks[-1].buf).copy()
+
+            if not paths:
+                return (counts,)
+
+            offsets = np.zeros(n + 1, dtype=np.int64)
+            np.cumsum(counts + 1, out=offsets[1:])
+            total = int(offsets[-1])
+
+            del specs['counts']
+            self._fshare(blocks, specs, 'offsets', offsets.shape, offsets.dtype, offsets)
+            self._fshare(blocks, specs, 'coords', (total, 2), np.int32)
+
+            self._frun(self._fpath_chunk, specs, n)
+            coords = np.ndarray((total, 2), dtype=np.int32, buffer=blocks[-1].buf).copy()
+
+            return counts, coords, offsets
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
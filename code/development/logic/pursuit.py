@@ -0,0 +1,98 @@
+
+from collections import deque
+from model.point import Point
+from logic.kq import KnightQuest
+
+class KnightPursuit:
+    """
+    Keeps a shortest knight path to a moving target and repairs it incrementally.
+
+    When the target moves from B to B', a prefix path[0..k] of the current path is still the
+    start of a shortest path to B' exactly when k + feval(path[k], B') == feval(A, B'). The
+    longest such prefix is found by scanning back from the end of the path, so only the tail
+    near the target is checked and rebuilt with KnightQuest. For a target that moves a square
+    or two per tick, the work per tick depends on how far it moved, not on the distance.
+
+    The path is stored in a deque, so the knight advancing at the front and the repairs at
+    the back are both cheap.
+
+    Attributes:
+        A (Point): The current position of the knight.
+        B (Point): The current position of the target.
+        checked (int): Path squares checked by the last retarget.
+        rebuilt (int): Path squares rebuilt by the last retarget.
+    """
+
+    def __init__(self, A: 'Point', B: 'Point') -> None:
+        """
+        Initialize the KnightPursuit with the knight at A chasing a target at B.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The starting position of the target.
+        """
+        self.A = A
+        self.B = B
+
+        self.checked = 0
+        self.rebuilt = 0
+        self._kq = KnightQuest(A, B)
+        self._path = deque(KnightQuest(A, B).fpath())
+
+
+    def retarget(self, B: 'Point') -> int:
+        """
+        Move the target to B and repair the end of the path.
+
+        Args:
+            B (Point): The new position of the target.
+
+        Returns:
+            int: The minimum number of moves from the knight to the new target.
+        """
+        path = self._path
+        remaining = self._kq.feval(self.A, B)
+
+        # Longest prefix that is still the start of a shortest path to B. The empty
+        # prefix (k = 0, the knight itself) always qualifies.
+        k = len(path) - 1
+        self.checked = 1
+        while k > 0 and k + self._kq.feval(path[k], B) != remaining:
+            k -= 1
+            self.checked += 1
+
+        for _ in range(len(path) - 1 - k):
+            path.pop()
+
+        tail = KnightQuest(path[-1], B).fpath()
+        path.extend(tail[1:])
+
+        self.B = B
+        self.rebuilt = len(tail) - 1
+
+        return remaining
+
+
+    def advance(self) -> 'Point':
+        """
+        Move the knight one step along the path. A suffix of a shortest path is a shortest
+        path itself, so the rest of the path stays valid.
+
+        Returns:
+            Point: The new position of the knight.
+        """
+        if len(self._path) > 1:
+            self._path.popleft()
+            self.A = self._path[0]
+
+        return self.A
+
+
+    def fpath(self) -> list:
+        """
+        Return the current path.
+
+        Returns:
+            list: The list of path segment (Points) from the knight to the target.
+        """
+        return list(self._path)
@@ -0,0 +1,170 @@
+
+from model.point import Point
+from logic.kq import KnightQuest
+
+class KnightRuns:
+    """
+    Describes a shortest knight path from A to B in constant size: at most two runs of a
+    repeated move followed by a short final approach. The description is computed in O(1)
+    time however far apart A and B are, and the squares are only produced on request.
+
+    The distance vector B - A is reflected into the octant x >= y >= 0, where the two knight
+    moves bracketing its direction, (2, 1) with (1, 2) or (2, 1) with (2, -1), add up to
+    it with real coefficients. Both coefficients are rounded down and reduced by a small
+    margin, and the runs are accepted once their moves plus the exact evaluation of the
+    remainder equal the evaluation of the whole vector, so the runs start a shortest path.
+    The remainder is within a few moves of the end of the runs and is walked by KnightQuest.
+
+    The runs are a shortest path, not necessarily the same squares as KnightQuest.fpath.
+
+    Attributes:
+        MARGIN (int): Moves held back from each run for the final approach.
+        A (Point): The starting position of the knight.
+        B (Point): The target position to reach.
+        runs (list[tuple[Point, int]]): The (move, repeat count) runs, in order.
+        approach (list[Point]): The squares from the end of the runs to B, both included.
+        moves (int): The total number of moves.
+    """
+    MARGIN = 2
+
+
+    def __init__(self, A: 'Point', B: 'Point') -> None:
+        """
+        Initialize the KnightRuns and compute the run-length description from A to B.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+        """
+        self.A = A
+        self.B = B
+
+        self._kq = KnightQuest(A, B)
+        self.runs = self._fruns(B.x - A.x, B.y - A.y)
+
+        C = A
+        for move, count in self.runs:
+            C = Point(C.x + count * move.x, C.y + count * move.y)
+
+        self.approach = KnightQuest(C, B).fpath()
+        self.moves = sum(count for _, count in self.runs) + len(self.approach) - 1
+
+
+    def _fruns(self, dx: int, dy: int) -> list:
+        """
+        Split the distance vector into at most two runs of repeated moves that start a
+        shortest path, leaving a remainder of a few moves.
+
+        Args:
+            dx (int): The x-component of B - A.
+            dy (int): The y-component of B - A.
+
+        Returns:
+            list: The (move, repeat count) runs with a positive count.
+        """
+        sx = -1 if dx < 0 else 1
+        sy = -1 if dy < 0 else 1
+        a, b = abs(dx), abs(dy)
+        swap = b > a
+
+        if swap:
+            a, b = b, a
+
+        if a >= 2 * b:
+            m1, m2 = (2, 1), (2, -1)
+            k1, k2 = (a + 2 * b) // 4, (a - 2 * b) // 4
+        else:
+            m1, m2 = (2, 1), (1, 2)
+            k1, k2 = (2 * a - b) // 3, (2 * b - a) // 3
+
+        k1 = max(0, k1 - self.MARGIN)
+        k2 = max(0, k2 - self.MARGIN)
+
+        origin = Point(0, 0)
+        total = self._kq.feval(origin, Point(a, b))
+
+        # The margin leaves room to fix up parity; hold back more only if the remainder
+        # still cannot be finished in the remaining moves.
+        while k1 + k2 > 0:
+            rx = a - k1 * m1[0] - k2 * m2[0]
+            ry = b - k1 * m1[1] - k2 * m2[1]
+
+            if k1 + k2 + self._kq.feval(origin, Point(rx, ry)) == total:
+                break
+
+            if k1 >= k2:
+                k1 -= 1
+            else:
+                k2 -= 1
+
+        runs = []
+        for (mx, my), k in ((m1, k1), (m2, k2)):
+            if k > 0:
+                if swap:
+                    mx, my = my, mx
+                runs.append((Point(sx * mx, sy * my), k))
+
+        return runs
+
+
+    def __len__(self) -> int:
+        """
+        Number of moves of the path.
+
+        Returns:
+            int: The number of moves.
+        """
+        return self.moves
+
+
+    def fsquare(self, i: int) -> 'Point':
+        """
+        Compute the square reached after i moves without producing the squares before it.
+
+        Args:
+            i (int): The number of moves, 0 <= i <= moves.
+
+        Returns:
+            Point: The square after i moves.
+        """
+        if not 0 <= i <= self.moves:
+            raise IndexError(f"Move {i} out of range for a path of {self.moves} moves.")
+
+        x, y = self.A
+
+        for move, count in self.runs:
+            k = min(i, count)
+            x += k * move.x
+            y += k * move.y
+            i -= k
+
+        return self.approach[i] if i else Point(x, y)
+
+
+    def iter_path(self):
+        """
+        Lazily generate the squares of the path from A to B.
+
+        Yields:
+            Point: The squares of the path in order, A and B included.
+        """
+        x, y = self.A
+        yield self.A
+
+        for move, count in self.runs:
+            for _ in range(count):
+                x += move.x
+                y += move.y
+                yield Point(x, y)
+
+        yield from self.approach[1:]
+
+
+    def fpath(self) -> list:
+        """
+        Expand the runs to the full path.
+
+        Returns:
+            list: The list of path segment (Points) from A to B.
+        """
+        return list(self.iter_path())
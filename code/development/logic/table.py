@@ -0,0 +1,175 @@
+
+import zlib
+import struct
+import numpy as np
+from model.point import Point
+from logic.kq import KnightQuest
+from logic.bfs import KnightBFS
+
+class KnightTable:
+    """
+    Versioned binary file format for precomputed knight distance tables. Files are opened
+    with numpy.memmap, so every process reading the same file shares the operating system's
+    page cache instead of rebuilding or copying the table.
+
+    File layout (little-endian):
+      - A HEADER_SIZE byte header: magic, format version, table kind, dtype, shape,
+        two kind-specific parameters and the CRC32 checksum of the payload.
+      - The payload starting at HEADER_SIZE: the table in C order.
+
+    Table kinds:
+      - ORIGIN: distance field around the origin, data[dx + R, dy + R] for |dx|, |dy| <= R,
+        as built by KnightBFS.ffield. Parameters: (R, 0).
+      - BOARD_FULL / BOARD_CORNERS: the full or corner tables of KnightBoard. Parameters: (N, M).
+
+    Attributes:
+        kind (int): The table kind.
+        params (tuple[int, int]): The kind-specific parameters.
+        data (np.ndarray): The table, memory-mapped read-only when loaded from a file.
+    """
+    MAGIC = b"KQTB"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHH8sI4Q2qI")
+    HEADER_SIZE = 128
+
+    ORIGIN = 0
+    BOARD_FULL = 1
+    BOARD_CORNERS = 2
+
+
+    def __init__(self, kind: int, params: tuple, data: np.ndarray) -> None:
+        """
+        Initialize the KnightTable from a table kind, its parameters and the table data.
+
+        Args:
+            kind (int): The table kind (ORIGIN, BOARD_FULL or BOARD_CORNERS).
+            params (tuple[int, int]): The kind-specific parameters.
+            data (np.ndarray): The table.
+        """
+        if kind not in (self.ORIGIN, self.BOARD_FULL, self.BOARD_CORNERS):
+            raise ValueError(f"Unknown table kind: {kind}.")
+
+        self.kind = kind
+        self.params = tuple(params)
+        self.data = data
+
+        self._kq = KnightQuest(Point(0, 0), Point(0, 0))
+
+
+    @staticmethod
+    def fpack(table: np.ndarray) -> np.ndarray:
+        """
+        Convert a BFS distance table to the compact uint8/uint16 representation.
+
+        Args:
+            table (np.ndarray): int32 distances, -1 where unreachable.
+
+        Returns:
+            np.ndarray: The same distances with unreachable squares set to the dtype maximum.
+        """
+        dtype = np.uint8 if table.max() < np.iinfo(np.uint8).max else np.uint16
+        packed = table.astype(dtype)
+        packed[table < 0] = np.iinfo(dtype).max
+        return packed
+
+
+    @classmethod
+    def from_origin(cls, radius: int) -> 'KnightTable':
+        """
+        Build an ORIGIN table from a single BFS distance field.
+
+        Args:
+            radius (int): The half-width of the square region to cover.
+
+        Returns:
+            KnightTable: The distance table around the origin.
+        """
+        return cls(cls.ORIGIN, (radius, 0), cls.fpack(KnightBFS.ffield(radius)))
+
+
+    def save(self, path: str) -> None:
+        """
+        Write the table to a file in the binary table format.
+
+        Args:
+            path (str): Destination file path.
+        """
+        data = np.ascontiguousarray(self.data)
+        dtype = data.dtype.newbyteorder('<') if data.dtype.itemsize > 1 else data.dtype
+        data = data.astype(dtype, copy=False)
+
+        if data.ndim > 4:
+            raise ValueError(f"Tables have at most 4 dimensions, got {data.ndim}.")
+
+        shape = list(data.shape) + [0] * (4 - data.ndim)
+        header = self.HEADER.pack(
+            self.MAGIC, self.VERSION, self.kind, dtype.str.encode("ascii"),
+            data.ndim, *shape, *self.params, zlib.crc32(data)
+        )
+
+        with open(path, "wb") as f:
+            f.write(header.ljust(self.HEADER_SIZE, b"\0"))
+            data.tofile(f)
+
+
+    @classmethod
+    def load(cls, path: str, verify: bool = True) -> 'KnightTable':
+        """
+        Open a table file and map its payload read-only without copying it.
+
+        Args:
+            path (str): The table file path.
+            verify (bool): Whether to check the payload checksum, which reads the whole
+                payload once (default True).
+
+        Returns:
+            KnightTable: The table, with data as a read-only numpy.memmap.
+        """
+        with open(path, "rb") as f:
+            header = f.read(cls.HEADER.size)
+
+        if len(header) < cls.HEADER.size:
+            raise ValueError(f"{path} is too short to be a knight table file.")
+
+        magic, version, kind, dtype, ndim, *rest = cls.HEADER.unpack(header)
+        shape = tuple(rest[:ndim])
+        params = tuple(rest[4:6])
+        checksum = rest[6]
+
+        if magic != cls.MAGIC:
+            raise ValueError(f"{path} is not a knight table file.")
+        if version != cls.VERSION:
+            raise ValueError(f"Unsupported knight table version {version} in {path}.")
+
+        data = np.memmap(path, dtype=np.dtype(dtype.rstrip(b"\0").decode("ascii")),
+                         mode="r", offset=cls.HEADER_SIZE, shape=shape)
+
+        if verify and zlib.crc32(data) != checksum:
+            raise ValueError(f"Checksum mismatch in {path}.")
+
+        return cls(kind, params, data)
+
+
+    def feval(self, A: 'Point', B: 'Point') -> int:
+        """
+        Evaluate the minimum number of knight moves from A to B with an ORIGIN table,
+        falling back to KnightQuest.feval when B - A lies outside the table.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+
+        Returns:
+            int: The minimum number of moves.
+        """
+        if self.kind != self.ORIGIN:
+            raise ValueError("feval requires an ORIGIN table; load board tables into KnightBoard.")
+
+        radius = self.params[0]
+        dx = B.x - A.x
+        dy = B.y - A.y
+
+        if -radius <= dx <= radius and -radius <= dy <= radius:
+            return int(self.data[dx + radius, dy + radius])
+
+        return self._kq.feval(A, B)
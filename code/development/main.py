@@ -1,6 +1,10 @@
 
 import argparse
 from tests.tester import KnightPathTester
+from tests.benchmark import KnightPathBenchmark
+from tests.store import KnightResultStore
+from logic.board import KnightBoard
+from logic.table import KnightTable
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Knight pathfinding test runner.")
@@ -11,16 +15,97 @@ if __name__ == "__main__":
                         help="Point range: (-max_cord, +max_coord) (default: 100)")
     parser.add_argument("--seed", type=int, default=None,
                         help="Random seed for reproducibility (default: None)")
-    parser.add_argument("--log", choices=["console", "file"], default="console",
-                        help="Output mode: 'console' or 'file' (default: console)")
-    parser.add_argument("--path", type=str, default="tests/output/log.txt",
-                        help="File path to write results if --log=file (default: tests/output/log.txt)")
+    parser.add_argument("--log", choices=["console", "file", "jsonl", "csv", "sqlite"], default="console",
+                        help="Output mode: 'console', 'file', or for test cases a 'jsonl', 'csv' or 'sqlite' store (default: console)")
+    parser.add_argument("--path", type=str, default=None,
+                        help="File path to write results if --log is not console (default: tests/output/log.txt, .jsonl, .csv or .db)")
+    parser.add_argument("--bfs_cache", type=str, nargs="?", const="tests/output/bfs_cache.db", default=None,
+                        help="Reuse BFS ground truth from this persistent cache database (default: off; "
+                             "without a value: tests/output/bfs_cache.db)")
+    parser.add_argument("--resume", action="store_true",
+                        help="Continue an interrupted test case run written to --path from its checkpoint")
+    parser.add_argument("--grid", type=int, default=None,
+                        help="Verify every square within this radius against one BFS distance field (default: None)")
+    parser.add_argument("--board", type=str, default=None,
+                        help="Verify the bounded board engine on a board[str]: 'N,M' (default: None)")
+    parser.add_argument("--huge", type=int, default=None,
+                        help="Verify this many pairs with coordinates up to 2^huge_bits against translated BFS ground truth (default: None)")
+    parser.add_argument("--huge_bits", type=int, default=62,
+                        help="Coordinate range of --huge: (-2^huge_bits, 2^huge_bits) (default: 62)")
+    parser.add_argument("--grid_samples", type=int, default=1000,
+                        help="Number of paths validated by --grid, or source squares by --board (default: 1000)")
+    parser.add_argument("--build_table", type=str, default=None,
+                        help="Build a distance table file[str]: 'origin:R' or 'board:N,M' (default: None)")
+    parser.add_argument("--table_path", type=str, default="tests/output/table.kqt",
+                        help="File path of the table written by --build_table (default: tests/output/table.kqt)")
+    parser.add_argument("--bench", choices=["feval", "fpath", "kernel", "parallel", "astar", "dstar", "pursuit", "models", "stream", "packed", "runs", "exact", "cache"], default=None,
+                        help="Run a throughput benchmark instead of the test cases (default: None)")
+    parser.add_argument("--bench_pairs", type=int, default=100000,
+                        help="Number of random pairs used by --bench (default: 100000)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Number of worker processes: for --bench (default: number of CPUs), or running the test cases (default: 1)")
+    parser.add_argument("--chunk_size", type=int, default=10000,
+                        help="Number of pairs per worker task (default: 10000)")
 
     args = parser.parse_args()
 
-    tester = KnightPathTester(args.num_cases, args.max_coord, args.seed)
+    if args.path is None:
+        args.path = {"jsonl": "tests/output/log.jsonl", "csv": "tests/output/log.csv",
+                     "sqlite": "tests/output/log.db"}.get(args.log, "tests/output/log.txt")
 
-    if args.log == "file":
-        tester.run_all_file(args.path)
+    if args.resume and args.log == "console":
+        parser.error("--resume needs a run written to disk: --log file, jsonl, csv or sqlite.")
+
+    if args.log in KnightResultStore.FORMATS and any(
+        mode is not None for mode in (args.build_table, args.bench, args.grid, args.huge, args.board)
+    ):
+        parser.error(f"--log {args.log} is only supported for the test cases.")
+
+    if args.build_table is not None:
+        kind, _, spec = args.build_table.partition(':')
+
+        if kind == "origin":
+            KnightTable.from_origin(int(spec)).save(args.table_path)
+        elif kind == "board":
+            N, M = map(int, spec.split(','))
+            KnightBoard(N, M).fsave(args.table_path)
+        else:
+            parser.error(f"Invalid table spec: '{args.build_table}'. Expected 'origin:R' or 'board:N,M'.")
+
+        print(f"Distance table written to {args.table_path}.")
+    elif args.bench is not None:
+        benchmark = KnightPathBenchmark(args.bench_pairs, args.max_coord, args.seed,
+                                        args.workers, args.chunk_size)
+        result = getattr(benchmark, f"bench_{args.bench}")()
+        print(benchmark.format_result(result))
+    elif args.grid is not None:
+        tester = KnightPathTester(0, args.max_coord, args.seed)
+
+        if args.log == "file":
+            tester.run_grid_file(args.grid, args.grid_samples, args.path)
+        else:
+            tester.run_grid_console(args.grid, args.grid_samples)
+    elif args.huge is not None:
+        tester = KnightPathTester(0, args.max_coord, args.seed)
+
+        if args.log == "file":
+            tester.run_huge_file(args.huge, args.huge_bits, args.path)
+        else:
+            tester.run_huge_console(args.huge, args.huge_bits)
+    elif args.board is not None:
+        N, M = map(int, args.board.split(','))
+        tester = KnightPathTester(0, args.max_coord, args.seed)
+
+        if args.log == "file":
+            tester.run_board_file(N, M, args.grid_samples, args.path)
+        else:
+            tester.run_board_console(N, M, args.grid_samples)
     else:
-        tester.run_all_console()
+        tester = KnightPathTester(args.num_cases, args.max_coord, args.seed, args.workers or 1, args.bfs_cache)
+
+        if args.log == "file":
+            tester.run_all_file(args.path, args.resume)
+        elif args.log in KnightResultStore.FORMATS:
+            tester.run_all_store(args.log, args.path, args.resume)
+        else:
+            tester.run_all_console()
@@ -0,0 +1,787 @@
+
+import os
+import math
+import time
+import random
+import tracemalloc
+from io import StringIO
+from typing import Optional
+from dataclasses import dataclass
+import numpy as np
+from model.point import Point
+from logic.kq import KnightQuest
+from logic.batch import KnightBatch
+from logic.parallel import KnightParallel
+from logic.astar import KnightAStar
+from logic.bfs import KnightBFS
+from logic.dstar import KnightDStarLite
+from logic.pursuit import KnightPursuit
+from logic.packed import KnightPackedPath
+from logic.runs import KnightRuns
+from logic.cache import KnightPathCache
+from model.sequence import Sequence
+from tests.case import KnightPathCase
+
+@dataclass(frozen=True)
+class _DataclassPoint:
+    """
+    The previous Point model, a frozen dataclass, kept as the baseline of bench_models.
+    """
+    x: int
+    y: int
+
+
+def _ffloat_sequence(r: Point) -> Sequence:
+    """
+    The previous float-division Sequence.from_point, kept as the baseline of bench_exact.
+    Exact only below about 2^53.
+    """
+    if r.x == 2 and r.y == 2:
+        return Sequence(5, 0)
+    elif r.y <= (r.x / 2):
+        n = r.x
+        m = math.ceil(n / 2) - r.y
+    else:
+        delta = math.ceil((2 * r.y - r.x) / 3)
+        n = r.x + delta
+        m = math.ceil(n / 2) - (r.y - delta)
+
+    return Sequence(n, m)
+
+class KnightPathBenchmark:
+    """
+    Measures throughput of the KnightQuest solvers on random (start, target) pairs.
+    Each benchmark returns a dictionary with its parameters and timings, which can
+    be turned into a printable report with format_result.
+    """
+
+    def __init__(self, num_pairs: int, max_coord: int, seed: Optional[int] = None,
+                 workers: Optional[int] = None, chunk_size: int = 10000):
+        """
+        Initialize the benchmark with the number and range of random pairs.
+
+        Args:
+            num_pairs (int): Number of (start, target) pairs to generate.
+            max_coord (int): Coordinates are drawn from (-max_coord, +max_coord).
+            seed (Optional[int]): Seed value for reproducibility (default None).
+            workers (Optional[int]): Maximum number of worker processes (default: number of CPUs).
+            chunk_size (int): Number of pairs per worker task (default 10000).
+        """
+        self._num_pairs = num_pairs
+        self._max_coord = max_coord
+        self._seed = seed
+        self._workers = workers or os.cpu_count() or 1
+        self._chunk_size = chunk_size
+
+        rng = np.random.default_rng(seed)
+        self.A = rng.integers(-max_coord, max_coord + 1, size=(num_pairs, 2), dtype=np.int64)
+        self.B = rng.integers(-max_coord, max_coord + 1, size=(num_pairs, 2), dtype=np.int64)
+
+
+    def _fpoints(self) -> list[tuple[Point, Point]]:
+        """
+        Convert the coordinate arrays into (start, target) Point pairs for the scalar solvers.
+
+        Returns:
+            list[tuple[Point, Point]]: List of (start, target) point tuples.
+        """
+        return [(Point(*a), Point(*b)) for a, b in zip(self.A.tolist(), self.B.tolist())]
+
+
+    def bench_feval(self) -> dict:
+        """
+        Compare the scalar KnightQuest.feval loop against the vectorized KnightBatch.feval.
+        The scalar loop includes the KnightQuest construction, as done for every query today.
+
+        Returns:
+            dict: Benchmark parameters, timings, throughput and whether the results match.
+        """
+        pairs = self._fpoints()
+
+        t0 = time.perf_counter()
+        scalar = [KnightQuest(A, B).feval(A, B) for A, B in pairs]
+        t1 = time.perf_counter()
+        time_scalar = t1 - t0
+
+        t0 = time.perf_counter()
+        batch = KnightBatch(self.A, self.B).feval(self.A, self.B)
+        t1 = time.perf_counter()
+        time_batch = t1 - t0
+
+        return {
+            "name": "feval",
+            "num_pairs": self._num_pairs,
+            "timings": {
+                "scalar KnightQuest.feval": time_scalar,
+                "batch KnightBatch.feval": time_batch
+            },
+            "matches": batch.tolist() == scalar
+        }
+
+
+    def bench_fpath(self) -> dict:
+        """
+        Compare building a list of Points per query with KnightQuest.fpath against writing
+        all paths into a CSR coordinate buffer with KnightBatch.fpath.
+
+        Returns:
+            dict: Benchmark parameters, timings, throughput and whether the paths match.
+        """
+        pairs = self._fpoints()
+
+        t0 = time.perf_counter()
+        scalar = [KnightQuest(A, B).fpath() for A, B in pairs]
+        t1 = time.perf_counter()
+        time_scalar = t1 - t0
+
+        t0 = time.perf_counter()
+        coords, offsets = KnightBatch(self.A, self.B).fpath()
+        t1 = time.perf_counter()
+        time_batch = t1 - t0
+
+        matches = all(
+            [(p.x, p.y) for p in path] == [tuple(c) for c in coords[offsets[i]:offsets[i + 1]].tolist()]
+            for i, path in enumerate(scalar)
+        )
+
+        return {
+            "name": "fpath",
+            "num_pairs": self._num_pairs,
+            "timings": {
+                "scalar KnightQuest.fpath": time_scalar,
+                "batch KnightBatch.fpath": time_batch
+            },
+            "matches": matches
+        }
+
+
+    def bench_kernel(self) -> dict:
+        """
+        Compare the original step loop, which calls fmove and re-evaluates feval on every
+        step, against the integer path kernel used by KnightQuest.fpath.
+
+        Returns:
+            dict: Benchmark parameters, timings, time per path step and whether the paths match.
+        """
+        pairs = self._fpoints()
+        paths_step = []
+        paths_kernel = []
+
+        t0 = time.perf_counter()
+        for A, B in pairs:
+            kq = KnightQuest(A, B)
+
+            while kq.feval(kq.A, kq._p[-1]) > 0:
+                kq.fmove()
+
+            paths_step.append(kq._p[::-1])
+        t1 = time.perf_counter()
+        time_step = t1 - t0
+
+        t0 = time.perf_counter()
+        for A, B in pairs:
+            paths_kernel.append(KnightQuest(A, B).fpath())
+        t1 = time.perf_counter()
+        time_kernel = t1 - t0
+
+        steps = sum(len(path) - 1 for path in paths_kernel)
+
+        return {
+            "name": "kernel",
+            "num_pairs": self._num_pairs,
+            "timings": {
+                "fmove step loop": time_step,
+                "integer kernel (fpath)": time_kernel
+            },
+            "counters": {
+                "Path steps": steps,
+                "fmove step loop, ns per step": 1e9 * time_step / steps if steps else 0,
+                "integer kernel, ns per step": 1e9 * time_kernel / steps if steps else 0
+            },
+            "matches": paths_step == paths_kernel
+        }
+
+
+    def bench_parallel(self) -> dict:
+        """
+        Measure how KnightParallel.fpath scales with the number of worker processes.
+        Worker counts double from 1 up to the configured maximum; the single-process
+        KnightBatch.fpath is included as the baseline.
+
+        Returns:
+            dict: Benchmark parameters, timings per worker count and whether the paths match.
+        """
+        timings = {}
+
+        t0 = time.perf_counter()
+        coords, offsets = KnightBatch(self.A, self.B).fpath()
+        t1 = time.perf_counter()
+        timings["single process KnightBatch.fpath"] = t1 - t0
+
+        counts = [1]
+        while counts[-1] * 2 <= self._workers:
+            counts.append(counts[-1] * 2)
+        if counts[-1] != self._workers:
+            counts.append(self._workers)
+
+        matches = True
+        for workers in counts:
+            solver = KnightParallel(workers, self._chunk_size)
+
+            t0 = time.perf_counter()
+            _, coords_p, offsets_p = solver.fpath(self.A, self.B)
+            t1 = time.perf_counter()
+            timings[f"KnightParallel.fpath, {workers} worker(s)"] = t1 - t0
+
+            matches = matches and np.array_equal(coords, coords_p) and np.array_equal(offsets, offsets_p)
+
+        return {
+            "name": f"parallel (chunk size {self._chunk_size})",
+            "num_pairs": self._num_pairs,
+            "timings": timings,
+            "matches": matches
+        }
+
+
+    def bench_astar(self, density: float = 0.05) -> dict:
+        """
+        Compare KnightAStar against the bidirectional KnightBFS on a board with random sparse
+        obstacles, in time and in the number of squares each search touches.
+
+        Args:
+            density (float): Fraction of blocked squares within the coordinate range (default 0.05).
+
+        Returns:
+            dict: Benchmark parameters, timings, average search sizes and whether the path lengths match.
+        """
+        # A separate stream, so obstacles are not correlated with the pair coordinates.
+        rng = np.random.default_rng(None if self._seed is None else self._seed + 1)
+        side = 2 * self._max_coord + 1
+        cells = np.argwhere(rng.random((side, side)) < density) - self._max_coord
+        obstacles = {Point(x, y) for x, y in cells.tolist()}
+
+        pairs = [(A, B) for A, B in self._fpoints() if A not in obstacles and B not in obstacles]
+        time_astar = time_bfs = 0
+        expanded = visited = 0
+        matches = True
+
+        for A, B in pairs:
+            astar = KnightAStar(A, B, obstacles)
+            t0 = time.perf_counter()
+            path_astar = astar.fpath()
+            t1 = time.perf_counter()
+            time_astar += t1 - t0
+
+            bfs = KnightBFS(A, B, obstacles)
+            t0 = time.perf_counter()
+            path_bfs = bfs.fpath()
+            t1 = time.perf_counter()
+            time_bfs += t1 - t0
+
+            expanded += astar.expanded
+            visited += bfs.visited
+            matches = matches and len(path_astar) == len(path_bfs)
+
+        return {
+            "name": f"astar (obstacle density {density})",
+            "num_pairs": len(pairs),
+            "timings": {
+                "KnightBFS.fpath": time_bfs,
+                "KnightAStar.fpath": time_astar
+            },
+            "counters": {
+                "Average squares visited by BFS": visited / len(pairs) if pairs else 0,
+                "Average squares expanded by A*": expanded / len(pairs) if pairs else 0
+            },
+            "matches": matches
+        }
+
+
+    def bench_dstar(self, ticks: int = 50, events: int = 4, density: float = 0.05) -> dict:
+        """
+        Compare incremental replanning with KnightDStarLite against a new KnightAStar search
+        on every tick, while random obstacles appear and disappear around each pair.
+
+        Args:
+            ticks (int): Number of ticks simulated per pair (default 50).
+            events (int): Obstacles added and removed per tick (default 4 each).
+            density (float): Initial fraction of blocked squares around each pair (default 0.05).
+
+        Returns:
+            dict: Benchmark parameters, timings, average work per tick and whether the path lengths match.
+        """
+        rng = random.Random(self._seed)
+        time_astar = time_dstar = 0
+        expanded_astar = expanded_dstar = updated_dstar = 0
+        matches = True
+        pairs = self._fpoints()
+
+        for A, B in pairs:
+            # Obstacles live in the bounding box of the pair, with some room around it.
+            x0, x1 = min(A.x, B.x) - 4, max(A.x, B.x) + 4
+            y0, y1 = min(A.y, B.y) - 4, max(A.y, B.y) + 4
+            squares = [Point(x, y) for x in range(x0, x1 + 1) for y in range(y0, y1 + 1) if Point(x, y) not in (A, B)]
+            obstacles = set(rng.sample(squares, int(len(squares) * density)))
+
+            dstar = KnightDStarLite(A, B, obstacles)
+            dstar.fpath()
+
+            for _ in range(ticks):
+                added = rng.sample(squares, events)
+                removed = rng.sample(sorted(obstacles, key=lambda P: (P.x, P.y)), min(events, len(obstacles)))
+                obstacles.update(added)
+                obstacles.difference_update(removed)
+
+                t0 = time.perf_counter()
+                path_dstar = dstar.update(added, removed)
+                t1 = time.perf_counter()
+                time_dstar += t1 - t0
+
+                astar = KnightAStar(A, B, obstacles)
+                t0 = time.perf_counter()
+                path_astar = astar.fpath()
+                t1 = time.perf_counter()
+                time_astar += t1 - t0
+
+                expanded_astar += astar.expanded
+                expanded_dstar += dstar.expanded
+                updated_dstar += dstar.updated
+                matches = matches and len(path_astar) == len(path_dstar)
+
+        total = len(pairs) * ticks
+
+        return {
+            "name": f"dstar ({ticks} ticks, {events} obstacles added and removed per tick)",
+            "num_pairs": total,
+            "timings": {
+                "KnightAStar.fpath from scratch": time_astar,
+                "KnightDStarLite.update": time_dstar
+            },
+            "counters": {
+                "Average squares expanded by A* per tick": expanded_astar / total if total else 0,
+                "Average squares expanded by D* Lite per tick": expanded_dstar / total if total else 0,
+                "Average squares updated by D* Lite per tick": updated_dstar / total if total else 0
+            },
+            "matches": matches
+        }
+
+
+    def bench_pursuit(self, ticks: int = 100) -> dict:
+        """
+        Compare rebuilding the full path with KnightQuest.fpath on every tick against
+        KnightPursuit.retarget, for targets taking a random step to one of the 8 adjacent
+        squares per tick while the knight advances one move every other tick.
+
+        Args:
+            ticks (int): Number of ticks simulated per pair (default 100).
+
+        Returns:
+            dict: Benchmark parameters, timings, average work per tick and whether the path lengths match.
+        """
+        rng = random.Random(self._seed)
+        steps = [Point(dx, dy) for dx in (-1, 0, 1) for dy in (-1, 0, 1) if dx or dy]
+        time_full = time_pursuit = 0
+        checked = rebuilt = length = 0
+        matches = True
+        pairs = self._fpoints()
+
+        for A, B in pairs:
+            pursuit = KnightPursuit(A, B)
+
+            for tick in range(ticks):
+                B = B + rng.choice(steps)
+
+                t0 = time.perf_counter()
+                path_full = KnightQuest(pursuit.A, B).fpath()
+                t1 = time.perf_counter()
+                time_full += t1 - t0
+
+                t0 = time.perf_counter()
+                remaining = pursuit.retarget(B)
+                t1 = time.perf_counter()
+                time_pursuit += t1 - t0
+
+                checked += pursuit.checked
+                rebuilt += pursuit.rebuilt
+                length += len(path_full)
+                matches = matches and remaining + 1 == len(path_full)
+
+                if tick % 2:
+                    pursuit.advance()
+
+        total = len(pairs) * ticks
+
+        return {
+            "name": f"pursuit ({ticks} ticks)",
+            "num_pairs": total,
+            "timings": {
+                "KnightQuest.fpath from scratch": time_full,
+                "KnightPursuit.retarget": time_pursuit
+            },
+            "counters": {
+                "Average path length": length / total if total else 0,
+                "Average squares checked per tick": checked / total if total else 0,
+                "Average squares rebuilt per tick": rebuilt / total if total else 0
+            },
+            "matches": matches
+        }
+
+
+    def bench_stream(self) -> dict:
+        """
+        Compare building full paths with KnightQuest.fpath against consuming them lazily
+        with KnightQuest.iter_path: total time, time until the first square is available
+        and peak memory for the longest pair.
+
+        Returns:
+            dict: Benchmark parameters, timings, latency and memory counters and whether
+            the path lengths and endpoints match.
+        """
+        pairs = self._fpoints()
+        first_list = first_iter = 0
+        matches = True
+
+        t0 = time.perf_counter()
+        for A, B in pairs:
+            path = KnightQuest(A, B).fpath()
+        t1 = time.perf_counter()
+        time_list = t1 - t0
+
+        t0 = time.perf_counter()
+        for A, B in pairs:
+            for P in KnightQuest(A, B).iter_path():
+                pass
+        t1 = time.perf_counter()
+        time_iter = t1 - t0
+
+        for A, B in pairs:
+            t0 = time.perf_counter()
+            path = KnightQuest(A, B).fpath()
+            first = path[0]
+            t1 = time.perf_counter()
+            squares = KnightQuest(A, B).iter_path()
+            first = next(squares)
+            t2 = time.perf_counter()
+
+            first_list += t1 - t0
+            first_iter += t2 - t1
+
+            length = 1
+            for P in squares:
+                length += 1
+            matches = matches and first == path[0] and P == path[-1] and length == len(path)
+
+        kq = KnightQuest(Point(0, 0), Point(0, 0))
+        A, B = max(pairs, key=lambda pair: kq.feval(*pair))
+        peaks = []
+
+        for consume in (lambda: KnightQuest(A, B).fpath(), lambda: sum(1 for _ in KnightQuest(A, B).iter_path())):
+            tracemalloc.start()
+            consume()
+            peaks.append(tracemalloc.get_traced_memory()[1])
+            tracemalloc.stop()
+
+        return {
+            "name": "stream",
+            "num_pairs": self._num_pairs,
+            "timings": {
+                "KnightQuest.fpath": time_list,
+                "KnightQuest.iter_path": time_iter
+            },
+            "counters": {
+                "fpath, us to first square": 1e6 * first_list / len(pairs),
+                "iter_path, us to first square": 1e6 * first_iter / len(pairs),
+                "Longest path, moves": kq.feval(A, B),
+                "fpath, peak bytes for the longest path": peaks[0],
+                "iter_path, peak bytes for the longest path": peaks[1]
+            },
+            "matches": matches
+        }
+
+
+    def bench_packed(self) -> dict:
+        """
+        Compare paths stored as lists of Points against packed 3-bit move codes: memory per
+        step, encode and decode time, and validation of the Point lists with
+        KnightPathCase.is_valid_knight_path against KnightPackedPath.is_valid.
+
+        Returns:
+            dict: Benchmark parameters, timings, memory counters and whether the decoded
+            paths match and validate.
+        """
+        pairs = self._fpoints()
+
+        tracemalloc.start()
+        paths = [KnightQuest(A, B).fpath() for A, B in pairs]
+        list_bytes = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+        t0 = time.perf_counter()
+        packed = [KnightPackedPath.from_points(path) for path in paths]
+        t1 = time.perf_counter()
+        time_encode = t1 - t0
+
+        t0 = time.perf_counter()
+        valid_list = all(KnightPathCase.is_valid_knight_path(path, A, B) for path, (A, B) in zip(paths, pairs))
+        t1 = time.perf_counter()
+        time_valid_list = t1 - t0
+
+        t0 = time.perf_counter()
+        valid_packed = all(p.is_valid(A, B) for p, (A, B) in zip(packed, pairs))
+        t1 = time.perf_counter()
+        time_valid_packed = t1 - t0
+
+        t0 = time.perf_counter()
+        decoded = [p.fcoords() for p in packed]
+        t1 = time.perf_counter()
+        time_decode = t1 - t0
+
+        steps = sum(len(p) for p in packed)
+        packed_bytes = sum(len(p.data) for p in packed)
+        matches = valid_list and valid_packed and all(
+            np.array_equal(coords, np.array(path)) for coords, path in zip(decoded, paths)
+        )
+
+        return {
+            "name": "packed",
+            "num_pairs": self._num_pairs,
+            "timings": {
+                "is_valid_knight_path (Point lists)": time_valid_list,
+                "KnightPackedPath.is_valid": time_valid_packed
+            },
+            "counters": {
+                "Path steps": steps,
+                "Point lists, bytes per step": list_bytes / steps if steps else 0,
+                "Packed codes, bytes per step": packed_bytes / steps if steps else 0,
+                "Encode, ns per step": 1e9 * time_encode / steps if steps else 0,
+                "Vectorized decode, ns per step": 1e9 * time_decode / steps if steps else 0
+            },
+            "matches": matches
+        }
+
+
+    def bench_runs(self) -> dict:
+        """
+        Compare building full paths with KnightQuest.fpath against the constant-size
+        run-length description of KnightRuns.
+
+        Returns:
+            dict: Benchmark parameters, timings, description sizes and whether the move
+            counts match.
+        """
+        pairs = self._fpoints()
+
+        t0 = time.perf_counter()
+        lengths = [len(KnightQuest(A, B).fpath()) - 1 for A, B in pairs]
+        t1 = time.perf_counter()
+        time_path = t1 - t0
+
+        t0 = time.perf_counter()
+        described = [KnightRuns(A, B) for A, B in pairs]
+        t1 = time.perf_counter()
+        time_runs = t1 - t0
+
+        total = len(pairs)
+
+        return {
+            "name": "runs",
+            "num_pairs": self._num_pairs,
+            "timings": {
+                "KnightQuest.fpath": time_path,
+                "KnightRuns": time_runs
+            },
+            "counters": {
+                "Average path length": sum(lengths) / total if total else 0,
+                "Average runs": sum(len(r.runs) for r in described) / total if total else 0,
+                "Average approach squares": sum(len(r.approach) for r in described) / total if total else 0
+            },
+            "matches": lengths == [r.moves for r in described]
+        }
+
+
+    def bench_exact(self) -> dict:
+        """
+        Compare the previous float-division sequence evaluation against the integer
+        Sequence.from_point on the benchmark's (small) coordinates, to confirm that exact
+        arithmetic does not slow down the common case.
+
+        Returns:
+            dict: Benchmark parameters, timings and whether both evaluations agree.
+        """
+        kq = KnightQuest(Point(0, 0), Point(0, 0))
+        reflected = [kq._fref(A - B) for A, B in self._fpoints()]
+
+        t0 = time.perf_counter()
+        values_float = [_ffloat_sequence(r).value() for r in reflected]
+        t1 = time.perf_counter()
+        time_float = t1 - t0
+
+        t0 = time.perf_counter()
+        values_exact = [Sequence.from_point(r).value() for r in reflected]
+        t1 = time.perf_counter()
+        time_exact = t1 - t0
+
+        return {
+            "name": "exact",
+            "num_pairs": self._num_pairs,
+            "timings": {
+                "float sequence evaluation": time_float,
+                "integer Sequence.from_point": time_exact
+            },
+            "counters": {
+                "float, ns per evaluation": 1e9 * time_float / len(reflected),
+                "integer, ns per evaluation": 1e9 * time_exact / len(reflected)
+            },
+            "matches": values_float == values_exact
+        }
+
+
+    def bench_cache(self, distinct: int = 1000, max_bytes: int = 1024 * 1024) -> dict:
+        """
+        Compare KnightQuest.fpath against KnightPathCache on traffic that repeats relative
+        deltas: every query draws one of a pool of distance vectors with Zipf-distributed
+        popularity, applies a random board symmetry and starts from a random square.
+
+        Args:
+            distinct (int): Number of distinct distance vectors in the pool (default 1000).
+            max_bytes (int): The cache size limit in bytes (default 1 MiB).
+
+        Returns:
+            dict: Benchmark parameters, timings, cache statistics and whether the path
+            lengths match.
+        """
+        rng = np.random.default_rng(self._seed)
+        pool = rng.integers(-self._max_coord, self._max_coord + 1, size=(distinct, 2))
+        picks = (rng.zipf(1.2, size=self._num_pairs) - 1) % distinct
+        signs = rng.choice((-1, 1), size=(self._num_pairs, 2))
+        swaps = rng.random(self._num_pairs) < 0.5
+
+        deltas = pool[picks] * signs
+        deltas[swaps] = deltas[swaps, ::-1]
+        pairs = [
+            (A, Point(A.x + int(dx), A.y + int(dy)))
+            for (A, _), (dx, dy) in zip(self._fpoints(), deltas.tolist())
+        ]
+
+        t0 = time.perf_counter()
+        paths_kq = [KnightQuest(A, B).fpath() for A, B in pairs]
+        t1 = time.perf_counter()
+        time_kq = t1 - t0
+
+        cache = KnightPathCache(max_bytes)
+
+        t0 = time.perf_counter()
+        paths_cache = [cache.fpath(A, B) for A, B in pairs]
+        t1 = time.perf_counter()
+        time_cache = t1 - t0
+
+        stats = cache.stats()
+
+        # The same traffic answered as coordinate arrays from the now warm cache, which
+        # skips creating the Points.
+        t0 = time.perf_counter()
+        for A, B in pairs:
+            cache.fcoords(A, B)
+        t1 = time.perf_counter()
+        time_coords = t1 - t0
+
+        matches = all(
+            len(p) == len(q) and q[0] == A and q[-1] == B
+            for p, q, (A, B) in zip(paths_kq, paths_cache, pairs)
+        )
+
+        return {
+            "name": f"cache ({distinct} distinct deltas, {max_bytes:,} byte limit)",
+            "num_pairs": self._num_pairs,
+            "timings": {
+                "KnightQuest.fpath": time_kq,
+                "KnightPathCache.fpath": time_cache,
+                "KnightPathCache.fcoords (warm)": time_coords
+            },
+            "counters": {
+                "Hit rate, %": 100 * stats["hit_rate"],
+                "Hits": stats["hits"],
+                "Misses": stats["misses"],
+                "Evictions": stats["evictions"],
+                "Cached entries": stats["entries"],
+                "Cached bytes": stats["nbytes"]
+            },
+            "matches": matches
+        }
+
+
+    def bench_models(self) -> dict:
+        """
+        Compare the frozen dataclass Point used previously against the tuple-backed Point
+        on construction, hashing into a set and set membership, the operations that
+        dominate the path searches.
+
+        Returns:
+            dict: Benchmark parameters, timings, time per operation and whether both models agree.
+        """
+        coords = list(zip(self.A[:, 0].tolist(), self.A[:, 1].tolist()))
+        timings = {}
+        counters = {}
+        members = []
+
+        for label, cls in (("frozen dataclass Point", _DataclassPoint), ("tuple-backed Point", Point)):
+            t0 = time.perf_counter()
+            points = [cls(x, y) for x, y in coords]
+            t1 = time.perf_counter()
+            squares = set(points)
+            t2 = time.perf_counter()
+            found = sum(P in squares for P in points)
+            t3 = time.perf_counter()
+
+            timings[label] = t3 - t0
+            counters[f"{label}, ns per construction"] = 1e9 * (t1 - t0) / len(coords)
+            counters[f"{label}, ns per set insertion"] = 1e9 * (t2 - t1) / len(coords)
+            counters[f"{label}, ns per membership test"] = 1e9 * (t3 - t2) / len(coords)
+            members.append((len(squares), found))
+
+        return {
+            "name": "models",
+            "num_pairs": self._num_pairs,
+            "timings": timings,
+            "counters": counters,
+            "matches": members[0] == members[1]
+        }
+
+
+    def format_result(self, result: dict) -> str:
+        """
+        Format a benchmark result as a human-readable report.
+
+        Includes the total time and pairs/sec of every measured variant, and the speedup
+        of each variant relative to the first (baseline) one.
+
+        Args:
+            result (dict): A dictionary returned by one of the bench_* methods.
+
+        Returns:
+            str: Formatted string representation of the result.
+        """
+        out = StringIO()
+
+        print(f"\n⏱️ Benchmark: {result['name']}", file=out)
+        print(f"  Pairs: {result['num_pairs']}, range: ({-self._max_coord}, {self._max_coord}), seed: {self._seed}", file=out)
+
+        baseline = None
+        for label, seconds in result['timings'].items():
+            rate = result['num_pairs'] / seconds if seconds else float('inf')
+            line = f"  {label}: {seconds:.6f}s ({rate:,.0f} pairs/s)"
+
+            if baseline is None:
+                baseline = seconds
+            elif seconds:
+                line += f", {baseline / seconds:.2f}x"
+
+            print(line, file=out)
+
+        for label, value in result.get('counters', {}).items():
+            print(f"  {label}: {value:,.1f}", file=out)
+
+        if 'matches' in result:
+            print(f"  Results match: {result['matches']}", file=out)
+
+        return out.getvalue()
@@ -1,4 +1,6 @@
 
+import sys
+import time
 from io import StringIO
 
 class KnightPathReporter:
@@ -6,7 +8,52 @@ class KnightPathReporter:
     This class is responsible for generating representations of individual test case results, 
     summarizing aggregate statistics from multiple test cases and writing formatted results 
     and summary to a file.
+
+    Console output goes through print_buffered, which writes in chunks of up to
+    BUFFER_LINES lines, or sooner once BUFFER_SECONDS have passed since the last write.
+
+    Attributes:
+        BUFFER_LINES (int): Lines held back before the console buffer is written.
+        BUFFER_SECONDS (float): Longest time output is held back, in seconds.
     """
+    BUFFER_LINES = 512
+    BUFFER_SECONDS = 0.5
+
+    def __init__(self):
+        """
+        Initialize the reporter with an empty console buffer.
+        """
+        self._buffer = []
+        self._buffered_lines = 0
+        self._flushed = time.perf_counter()
+
+
+    def print_buffered(self, text: str) -> None:
+        """
+        Queue text for the console and write the queue if it is full or old enough.
+
+        Args:
+            text (str): The text to print, including its line breaks.
+        """
+        self._buffer.append(text)
+        self._buffered_lines += text.count("\n")
+
+        if self._buffered_lines >= self.BUFFER_LINES or time.perf_counter() - self._flushed >= self.BUFFER_SECONDS:
+            self.flush_console()
+
+
+    def flush_console(self) -> None:
+        """
+        Write the queued console text.
+        """
+        sys.stdout.write("".join(self._buffer))
+        sys.stdout.flush()
+
+        self._buffer.clear()
+        self._buffered_lines = 0
+        self._flushed = time.perf_counter()
+
+
     def format_case_result(self, result: dict) -> str:
         """
         Format the output for a single test case.
@@ -30,7 +77,8 @@ class KnightPathReporter:
         print(f"\nTesting from {result['start']} to {result['target']}", file=out)
         print(f"🎯 Minimum number of moves (feval): {result['kq_eval']}, Matches: {result['eval_matches']}", file=out)
         print(f"✅ KQ valid: {result['valid_kq']}, length: {len(result['path_kq'])}, time: {result['time_kq']:.6f}s", file=out)
-        print(f"✅ BF valid: {result['valid_bfs']}, length: {len(result['path_bfs'])}, time: {result['time_bfs']:.6f}s", file=out)
+        cached = " (cached)" if result.get('bfs_cached') else ""
+        print(f"✅ BF valid: {result['valid_bfs']}, length: {len(result['path_bfs'])}, time: {result['time_bfs']:.6f}s{cached}", file=out)
         print(f"🔁 Same length: {result['same_length']}, Same path: {result['same_path']}", file=out)
         print(f"🧮 Fallbacks used: {result['fallbacks']}", file=out)
 
@@ -57,8 +105,10 @@ class KnightPathReporter:
           - Total number of tests run.
           - Number of failed tests.
           - Total number of fallbacks.
+          - BFS ground truth cache hits, when a cache is used.
           - Average timing for KnightQuest, BFS, and feval.
           - Average speedups.
+          - Worker processes, wall time and the time spent per worker, when recorded.
 
         Args:
             stats (dict): A dictionary of summary statistics.
@@ -79,6 +129,11 @@ class KnightPathReporter:
         print(f"  Failed tests: {stats['failed_tests']}", file=out)
         print(f"  Total fallback moves used: {stats['total_fallbacks']}", file=out)
 
+        if stats.get('bfs_cache') is not None:
+            hits, total = stats['bfs_cache_hits'], stats['total_tests']
+            print(f"  BFS ground truth cache: {hits}/{total} hits ({100 * hits / total if total else 0:.1f}%), "
+                  f"{stats['bfs_cache_entries']} entries in {stats['bfs_cache']}", file=out)
+
         print(f"  Average KQ path time: {stats['avg_kq_time']:.8f}s", file=out)
         print(f"  Average BFS path time: {stats['avg_bfs_time']:.8f}s", file=out)
         print(f"  Average feval time: {stats['avg_eval_time']:.8f}s", file=out)
@@ -86,6 +141,137 @@ class KnightPathReporter:
         print(f"  Average KQ speedup: {stats['avg_kq_speedup']:.2f}x", file=out)
         print(f"  Average feval speedup: {stats['avg_eval_speedup']:.2f}x", file=out)
 
+        if 'wall_time' in stats:
+            wall = stats['wall_time']
+            busy = stats['total_case_time']
+            print(f"  Workers: {stats['workers']}, wall time: {wall:.3f}s, time in cases: {busy:.3f}s"
+                  f" ({busy / wall if wall else 0:.2f}x)", file=out)
+
+            if stats['workers'] > stats['cpus']:
+                print(f"  ⚠️ More workers than CPUs ({stats['cpus']}): case timings include contention.", file=out)
+
+            if stats['workers'] > 1:
+                for i, (cases, seconds) in enumerate(sorted(stats['per_worker'].values(), reverse=True), start=1):
+                    print(f"    Worker {i}: {cases} cases, {seconds:.3f}s", file=out)
+
+        return out.getvalue()
+
+
+    def format_grid_result(self, result: dict) -> str:
+        """
+        Format the result of an exhaustive grid verification.
+
+        Includes:
+          - The verified region and the number of squares compared against the BFS field.
+          - The number of feval mismatches and the first few mismatching squares.
+          - The number of sampled paths, invalid or non-optimal paths, and fallbacks.
+          - Timings of the distance field, the feval sweep and the path sample.
+
+        Args:
+            result (dict): A dictionary as returned by KnightPathTester._run_grid().
+
+        Returns:
+            str: Formatted string of the verification results.
+        """
+        out = StringIO()
+
+        print("\n🗺️ Grid verification:", file=out)
+        print(f"  Verified region: ({-result['radius']}, {result['radius']})", file=out)
+        print(f"  Squares compared: {result['squares']}", file=out)
+        print(f"  feval mismatches: {len(result['eval_mismatches'])}", file=out)
+
+        for point in result['eval_mismatches'][:10]:
+            print(f"    ❌ {point}", file=out)
+
+        print(f"  Paths sampled: {result['samples']} (offsets within ({-result['max_coord']}, {result['max_coord']}), seed: {result['seed']})", file=out)
+        print(f"  Path failures: {len(result['path_failures'])}", file=out)
+
+        for start, target in result['path_failures'][:10]:
+            print(f"    ❌ {start} -> {target}", file=out)
+
+        print(f"  Total fallback moves used: {result['fallbacks']}", file=out)
+        print(f"  BFS distance field time: {result['time_field']:.6f}s", file=out)
+        print(f"  feval sweep time: {result['time_eval']:.6f}s", file=out)
+        print(f"  Path sample time: {result['time_paths']:.6f}s", file=out)
+
+        return out.getvalue()
+
+
+    def format_board_result(self, result: dict) -> str:
+        """
+        Format the result of a bounded board verification.
+
+        Includes:
+          - The board size, the kind of distance table and its size in bytes.
+          - The number of verified sources, compared pairs and feval mismatches.
+          - The number of invalid, off-board or non-optimal paths.
+          - Timings of the table build, the feval comparisons and the paths.
+
+        Args:
+            result (dict): A dictionary as returned by KnightPathTester._run_board().
+
+        Returns:
+            str: Formatted string of the verification results.
+        """
+        out = StringIO()
+        N, M = result['board']
+
+        print("\n♞ Board verification:", file=out)
+        print(f"  Board: {N}x{M}, table: {result['table']} ({result['table_bytes']} bytes)", file=out)
+        print(f"  Sources verified: {result['sources']} (seed: {result['seed']})", file=out)
+        print(f"  Pairs compared: {result['squares']}", file=out)
+        print(f"  feval mismatches: {len(result['eval_mismatches'])}", file=out)
+
+        for start, target in result['eval_mismatches'][:10]:
+            print(f"    ❌ {start} -> {target}", file=out)
+
+        print(f"  Path failures: {len(result['path_failures'])}", file=out)
+
+        for start, target in result['path_failures'][:10]:
+            print(f"    ❌ {start} -> {target}", file=out)
+
+        print(f"  Table build time: {result['time_build']:.6f}s", file=out)
+        print(f"  feval time: {result['time_eval']:.6f}s", file=out)
+        print(f"  Path time: {result['time_paths']:.6f}s", file=out)
+
+        return out.getvalue()
+
+
+    def format_huge_result(self, result: dict) -> str:
+        """
+        Format the result of a huge-coordinate verification.
+
+        Includes:
+          - The coordinate range, the number of pairs and the BFS field they reduce to.
+          - The number of feval mismatches and the first few mismatching pairs.
+          - The number of pairs whose first path steps or run-length description failed.
+          - Timings of the evaluations and of the path checks.
+
+        Args:
+            result (dict): A dictionary as returned by KnightPathTester._run_huge().
+
+        Returns:
+            str: Formatted string of the verification results.
+        """
+        out = StringIO()
+
+        print("\n🔭 Huge-coordinate verification:", file=out)
+        print(f"  Coordinate range: (-2^{result['bits']}, 2^{result['bits']})", file=out)
+        print(f"  Pairs verified: {result['samples']} (seed: {result['seed']})", file=out)
+        print(f"  Ground truth: BFS field of radius {result['radius']}, translated", file=out)
+        print(f"  feval mismatches: {len(result['eval_mismatches'])}", file=out)
+
+        for start, target in result['eval_mismatches'][:10]:
+            print(f"    ❌ {start} -> {target}", file=out)
+
+        print(f"  Path failures (first {result['steps']} steps): {len(result['path_failures'])}", file=out)
+
+        for start, target in result['path_failures'][:10]:
+            print(f"    ❌ {start} -> {target}", file=out)
+
+        print(f"  feval time: {result['time_eval']:.6f}s", file=out)
+        print(f"  Path check time: {result['time_paths']:.6f}s", file=out)
+
         return out.getvalue()
 
 
@@ -94,7 +280,8 @@ class KnightPathReporter:
         Write all test case results and the final summary to a specified file.
 
         Args:
-            results (list[dict]): List of result dictionaries from individual test cases.
+            results (Iterable[dict]): Result dictionaries from individual test cases,
+                consumed one at a time.
             summary (dict): Aggregated statistics across all test cases.
             path (str): File path to write the output.
         """
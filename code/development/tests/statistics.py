@@ -1,22 +1,59 @@
-from typing import List
-
 class KnightPathStats:
     """
     Tracks and summarizes statistics for multiple knight pathfinding results.
+
+    Only running totals are kept, not the results themselves, so memory does not grow with
+    the number of results.
     """
 
     def __init__(self):
         """
         Initialize an empty statistics tracker.
         """
-        self.results: List[dict] = []
+        self.total_tests = 0
+        self.failed_tests = 0
+        self.total_fallbacks = 0
+        self.bfs_cache_hits = 0
+
+        self.total_time_kq = 0
+        self.total_time_bfs = 0
+        self.total_time_eval = 0
+
+        self._kq_speedup_sum = 0
+        self._kq_speedup_count = 0
+        self._eval_speedup_sum = 0
+        self._eval_speedup_count = 0
+
+        # Cases and time spent in them per worker process.
+        self._workers = {}
 
 
     def add_result(self, result: dict) -> None:
         """
         Add a single test result to the tracker.
         """
-        self.results.append(result)
+        self.total_tests += 1
+        self.failed_tests += bool(result['failed'])
+        self.total_fallbacks += result['fallbacks']
+        self.bfs_cache_hits += bool(result.get('bfs_cached'))
+
+        self.total_time_kq += result['time_kq']
+        self.total_time_bfs += result['time_bfs']
+        self.total_time_eval += result['time_eval']
+
+        if result['kq_speedup'] != float('inf'):
+            self._kq_speedup_sum += result['kq_speedup']
+            self._kq_speedup_count += 1
+
+        if result['eval_speedup'] != float('inf'):
+            self._eval_speedup_sum += result['eval_speedup']
+            self._eval_speedup_count += 1
+
+        if 'worker' in result:
+            cases, busy = self._workers.get(result['worker'], (0, 0))
+            self._workers[result['worker']] = (
+                cases + 1, busy + result['time_kq'] + result['time_bfs'] + result['time_eval']
+            )
 
 
     def summary(self) -> dict:
@@ -26,31 +63,52 @@ class KnightPathStats:
         Returns:
             dict: Aggregated metrics including test counts, timings, and speedups.
         """
-        total_tests = len(self.results)
-        failed_tests = sum(1 for r in self.results if r['failed'])
-        total_fallbacks = sum(r['fallbacks'] for r in self.results)
+        total_tests = self.total_tests
 
-        total_time_kq = sum(r['time_kq'] for r in self.results)
-        total_time_bfs = sum(r['time_bfs'] for r in self.results)
-        total_time_eval = sum(r['time_eval'] for r in self.results)
+        avg_kq_time = self.total_time_kq / total_tests if total_tests else 0
+        avg_bfs_time = self.total_time_bfs / total_tests if total_tests else 0
+        avg_eval_time = self.total_time_eval / total_tests if total_tests else 0
 
-        kq_speedups = [r['kq_speedup'] for r in self.results if r['kq_speedup'] != float('inf')]
-        eval_speedups = [r['eval_speedup'] for r in self.results if r['eval_speedup'] != float('inf')]
-
-        avg_kq_time = total_time_kq / total_tests if total_tests else 0
-        avg_bfs_time = total_time_bfs / total_tests if total_tests else 0
-        avg_eval_time = total_time_eval / total_tests if total_tests else 0
-
-        avg_kq_speedup = sum(kq_speedups) / len(kq_speedups) if kq_speedups else 0
-        avg_eval_speedup = sum(eval_speedups) / len(eval_speedups) if eval_speedups else float('inf')
+        avg_kq_speedup = self._kq_speedup_sum / self._kq_speedup_count if self._kq_speedup_count else 0
+        avg_eval_speedup = self._eval_speedup_sum / self._eval_speedup_count if self._eval_speedup_count else float('inf')
 
         return {
             "total_tests": total_tests,
-            "failed_tests": failed_tests,
-            "total_fallbacks": total_fallbacks,
+            "failed_tests": self.failed_tests,
+            "total_fallbacks": self.total_fallbacks,
+            "bfs_cache_hits": self.bfs_cache_hits,
             "avg_kq_time": avg_kq_time,
             "avg_bfs_time": avg_bfs_time,
             "avg_eval_time": avg_eval_time,
             "avg_kq_speedup": avg_kq_speedup,
-            "avg_eval_speedup": avg_eval_speedup
-        }
\ No newline at end of file
+            "avg_eval_speedup": avg_eval_speedup,
+            "total_case_time": self.total_time_kq + self.total_time_bfs + self.total_time_eval,
+            "per_worker": dict(self._workers)
+        }
+
+
+    def state(self) -> dict:
+        """
+        Capture the running totals, for a checkpoint.
+
+        Returns:
+            dict: A JSON-serializable copy of the totals.
+        """
+        state = {key: value for key, value in vars(self).items() if key != '_workers'}
+        state['_workers'] = [[worker, cases, busy] for worker, (cases, busy) in self._workers.items()]
+        return state
+
+
+    def load_state(self, state: dict) -> None:
+        """
+        Restore the running totals captured by state, so that adding the remaining results
+        gives the same summary as an uninterrupted run.
+
+        Args:
+            state (dict): The totals returned by state.
+        """
+        for key, value in state.items():
+            if key != '_workers':
+                setattr(self, key, value)
+
+        self._workers = {worker: (cases, busy) for worker, cases, busy in state['_workers']}
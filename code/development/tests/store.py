@@ -0,0 +1,293 @@
+import os
+import csv
+import json
+import time
+import base64
+import sqlite3
+from typing import Optional
+from logic.packed import KnightPackedPath
+
+class KnightResultStore:
+    """
+    Writes test case results in a machine-readable format, for dashboards and queries
+    across runs instead of parsing the text log.
+
+    Formats:
+      - 'jsonl': one JSON object per case ("type": "case"), then one summary object
+        ("type": "summary").
+      - 'csv': one row per case under a header row.
+      - 'sqlite': a 'runs' table with the settings and summary of every run and a 'cases'
+        table with one row per case, indexed on start, target, distance, timings,
+        fallbacks and failure. Runs accumulate in the same database file.
+
+    Every case is stored with its start, target, distance (the BFS move count), feval
+    result, validity and comparison flags, timings, speedups, fallbacks, failure flag and
+    worker. Paths are stored as KnightPackedPath bytes, 3 bits per move: as BLOBs in
+    SQLite and base64 text in JSON lines and CSV.
+
+    Results are buffered and written BATCH_SIZE at a time, one transaction per batch in
+    SQLite, so storing does not slow large runs down. fsync makes everything added so far
+    durable, and a store can be reopened at such a point with resume, dropping whatever
+    was written after it.
+
+    Attributes:
+        FORMATS (tuple): The supported formats.
+        COLUMNS (tuple): The stored fields of a case, in column order.
+        BATCH_SIZE (int): Results buffered before they are written.
+        run_id (Optional[int]): The id of the run in the SQLite 'runs' table.
+    """
+    FORMATS = ("jsonl", "csv", "sqlite")
+    COLUMNS = (
+        "run_id", "case_number", "start_x", "start_y", "target_x", "target_y",
+        "distance", "kq_eval", "kq_moves", "valid_kq", "valid_bfs", "eval_matches",
+        "same_length", "same_path", "time_kq", "time_bfs", "time_eval",
+        "kq_speedup", "eval_speedup", "fallbacks", "failed", "worker", "path_kq", "path_bfs"
+    )
+    BATCH_SIZE = 1000
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS runs (
+            run_id INTEGER PRIMARY KEY,
+            started REAL NOT NULL,
+            seed INTEGER,
+            max_coord INTEGER,
+            workers INTEGER,
+            total_tests INTEGER,
+            failed_tests INTEGER,
+            total_fallbacks INTEGER,
+            wall_time REAL,
+            summary TEXT
+        );
+        CREATE TABLE IF NOT EXISTS cases (
+            run_id INTEGER NOT NULL REFERENCES runs(run_id),
+            case_number INTEGER NOT NULL,
+            start_x INTEGER NOT NULL,
+            start_y INTEGER NOT NULL,
+            target_x INTEGER NOT NULL,
+            target_y INTEGER NOT NULL,
+            distance INTEGER NOT NULL,
+            kq_eval INTEGER NOT NULL,
+            kq_moves INTEGER NOT NULL,
+            valid_kq INTEGER NOT NULL,
+            valid_bfs INTEGER NOT NULL,
+            eval_matches INTEGER NOT NULL,
+            same_length INTEGER NOT NULL,
+            same_path INTEGER NOT NULL,
+            time_kq REAL NOT NULL,
+            time_bfs REAL NOT NULL,
+            time_eval REAL NOT NULL,
+            kq_speedup REAL,
+            eval_speedup REAL,
+            fallbacks INTEGER NOT NULL,
+            failed INTEGER NOT NULL,
+            worker INTEGER,
+            path_kq BLOB,
+            path_bfs BLOB,
+            PRIMARY KEY (run_id, case_number)
+        );
+        CREATE INDEX IF NOT EXISTS cases_start ON cases (start_x, start_y);
+        CREATE INDEX IF NOT EXISTS cases_target ON cases (target_x, target_y);
+        CREATE INDEX IF NOT EXISTS cases_distance ON cases (distance);
+        CREATE INDEX IF NOT EXISTS cases_time_kq ON cases (time_kq);
+        CREATE INDEX IF NOT EXISTS cases_time_bfs ON cases (time_bfs);
+        CREATE INDEX IF NOT EXISTS cases_time_eval ON cases (time_eval);
+        CREATE INDEX IF NOT EXISTS cases_fallbacks ON cases (fallbacks);
+        CREATE INDEX IF NOT EXISTS cases_failed ON cases (failed);
+    """
+
+    def __init__(self, path: str, fmt: str, seed: Optional[int] = None, max_coord: Optional[int] = None,
+                 workers: int = 1, resume: Optional[dict] = None) -> None:
+        """
+        Open the store. JSON lines and CSV files are overwritten; a SQLite database is
+        created if needed and the run is added to it.
+
+        Args:
+            path (str): The output file or database path.
+            fmt (str): One of FORMATS.
+            seed (Optional[int]): The seed of the run (default None).
+            max_coord (Optional[int]): The coordinate range of the run (default None).
+            workers (int): The number of worker processes of the run (default 1).
+            resume (Optional[dict]): Continue an earlier run instead, from the 'completed',
+                'position' and 'run_id' of a checkpoint taken with fsync (default None).
+        """
+        if fmt not in self.FORMATS:
+            raise ValueError(f"Invalid store format: '{fmt}'. Expected one of {', '.join(self.FORMATS)}.")
+
+        self.fmt = fmt
+        self.run_id = None
+        self._rows = []
+
+        if fmt == "sqlite":
+            self._db = sqlite3.connect(path)
+            self._db.execute("PRAGMA journal_mode = WAL")
+            self._db.execute("PRAGMA synchronous = FULL")
+            self._db.executescript(self._SCHEMA)
+
+            with self._db:
+                if resume is not None:
+                    self.run_id = resume['run_id']
+                    self._db.execute(
+                        "DELETE FROM cases WHERE run_id = ? AND case_number > ?", (self.run_id, resume['completed'])
+                    )
+                else:
+                    self.run_id = self._db.execute(
+                        "INSERT INTO runs (started, seed, max_coord, workers) VALUES (?, ?, ?, ?)",
+                        (time.time(), seed, max_coord, workers)
+                    ).lastrowid
+        else:
+            if resume is not None:
+                self._file = open(path, "r+", encoding="utf-8", newline="")
+                self._file.truncate(resume['position'])
+                self._file.seek(resume['position'])
+            else:
+                self._file = open(path, "w", encoding="utf-8", newline="")
+
+            if fmt == "csv":
+                self._csv = csv.writer(self._file)
+                if resume is None:
+                    self._csv.writerow(self.COLUMNS[1:])
+
+
+    def __enter__(self) -> 'KnightResultStore':
+        """
+        Use the store as a context manager that closes it on exit.
+
+        Returns:
+            KnightResultStore: The store itself.
+        """
+        return self
+
+
+    def __exit__(self, *exc) -> None:
+        """
+        Close the store, writing the buffered results.
+        """
+        self.close()
+
+
+    @staticmethod
+    def fpack(path: list) -> bytes:
+        """
+        Pack a path to KnightPackedPath bytes; an empty path is stored as empty bytes.
+
+        Args:
+            path (list[Point]): The squares of the path.
+
+        Returns:
+            bytes: The serialized packed path.
+        """
+        return KnightPackedPath.from_points(path).to_bytes() if path else b""
+
+
+    def add(self, case_number: int, result: dict) -> None:
+        """
+        Buffer one case result, writing the buffer once it holds BATCH_SIZE results.
+
+        Args:
+            case_number (int): The number of the case in the run, from 1.
+            result (dict): The result of KnightPathCase.run.
+        """
+        speedups = tuple(
+            None if result[key] == float('inf') else result[key] for key in ("kq_speedup", "eval_speedup")
+        )
+
+        self._rows.append((
+            self.run_id, case_number,
+            result['start'].x, result['start'].y, result['target'].x, result['target'].y,
+            len(result['path_bfs']) - 1, result['kq_eval'], len(result['path_kq']) - 1,
+            int(result['valid_kq']), int(result['valid_bfs']), int(result['eval_matches']),
+            int(result['same_length']), int(result['same_path']),
+            result['time_kq'], result['time_bfs'], result['time_eval'], *speedups,
+            result['fallbacks'], int(result['failed']), result.get('worker'),
+            self.fpack(result['path_kq']), self.fpack(result['path_bfs'])
+        ))
+
+        if len(self._rows) >= self.BATCH_SIZE:
+            self.flush()
+
+
+    def flush(self) -> None:
+        """
+        Write the buffered results.
+        """
+        if not self._rows:
+            return
+
+        if self.fmt == "sqlite":
+            with self._db:
+                self._db.executemany(
+                    f"INSERT INTO cases VALUES ({', '.join('?' * len(self.COLUMNS))})", self._rows
+                )
+        else:
+            rows = [
+                row[1:-2] + tuple(base64.b64encode(path).decode("ascii") for path in row[-2:])
+                for row in self._rows
+            ]
+
+            if self.fmt == "csv":
+                self._csv.writerows(rows)
+            else:
+                self._file.write("".join(
+                    json.dumps({"type": "case", **dict(zip(self.COLUMNS[1:], row))}, separators=(",", ":")) + "\n"
+                    for row in rows
+                ))
+
+            self._file.flush()
+
+        self._rows.clear()
+
+
+    def fsync(self) -> Optional[int]:
+        """
+        Write the buffered results and make everything stored so far durable.
+
+        Returns:
+            Optional[int]: The file position after the last result, None for SQLite,
+            where every written batch is already a committed transaction.
+        """
+        self.flush()
+
+        if self.fmt == "sqlite":
+            return None
+
+        os.fsync(self._file.fileno())
+        return self._file.tell()
+
+
+    def write_summary(self, summary: dict) -> None:
+        """
+        Store the summary of the run: a final record in JSON lines, the run row in SQLite.
+        CSV files hold cases only.
+
+        Args:
+            summary (dict): The summary statistics of the run.
+        """
+        self.flush()
+        summary = {
+            key: (None if value == float('inf') else value)
+            for key, value in summary.items() if key != 'per_worker'
+        }
+
+        if self.fmt == "sqlite":
+            with self._db:
+                self._db.execute(
+                    "UPDATE runs SET total_tests = ?, failed_tests = ?, total_fallbacks = ?, wall_time = ?, "
+                    "summary = ? WHERE run_id = ?",
+                    (summary['total_tests'], summary['failed_tests'], summary['total_fallbacks'],
+                     summary.get('wall_time'), json.dumps(summary), self.run_id)
+                )
+        elif self.fmt == "jsonl":
+            self._file.write(json.dumps({"type": "summary", **summary}, separators=(",", ":")) + "\n")
+            self._file.flush()
+
+
+    def close(self) -> None:
+        """
+        Write the remaining buffered results and close the store.
+        """
+        self.flush()
+
+        if self.fmt == "sqlite":
+            self._db.close()
+        else:
+            self._file.close()
@@ -0,0 +1,30 @@
+import pytest
+from model.point import Point
+from logic.board import KnightBoard
+from tests.case import KnightPathCase
+
+def test_long_narrow_board():
+    """
+    A long board with a side shorter than KnightBoard.CORNER_SIZE must not build a full
+    all-pairs table, and must still answer feval and fpath exactly.
+    """
+    N, M = 4, 10000
+    board = KnightBoard(N, M)
+
+    assert board.table is None and board.corners is None
+
+    for source in (Point(0, 0), Point(3, 5000), Point(1, 9999)):
+        field = board.ffield(source)
+
+        for target in (Point(0, 1), Point(2, 4321), Point(3, 9999), source):
+            assert board.feval(source, target) == field[target.x, target.y]
+
+            path = board.fpath(source, target)
+            assert len(path) == field[target.x, target.y] + 1
+            assert KnightPathCase.is_valid_knight_path(path, source, target)
+            assert all(0 <= P.x < N and 0 <= P.y < M for P in path)
+
+    assert len(board._fields) <= KnightBoard.FIELD_CACHE
+
+    with pytest.raises(ValueError):
+        board.fsave("unused.kqt")
@@ -0,0 +1,81 @@
+import json
+import pytest
+from tests.tester import KnightPathTester
+
+class Interrupted(Exception):
+    """
+    Stands in for the interruption of a run.
+    """
+
+
+def interrupt(tester: KnightPathTester, after: int) -> None:
+    """
+    Make a tester's run stop with Interrupted once it has completed `after` cases.
+    """
+    run_cases = tester._run_cases
+
+    def cases(skip=0):
+        for number, result in enumerate(run_cases(skip)):
+            if number == after:
+                raise Interrupted()
+            yield result
+
+    tester._run_cases = cases
+
+
+def run(fmt: str, path: str, seed, resume: bool = False, after=None) -> None:
+    """
+    Run 20 cases written to path, interrupted after `after` cases if given.
+    """
+    tester = KnightPathTester(20, 10, seed)
+
+    if after is not None:
+        interrupt(tester, after)
+
+    if fmt == "file":
+        tester.run_all_file(path, resume)
+    else:
+        tester.run_all_store(fmt, path, resume)
+
+
+def pairs(fmt: str, path: str) -> list:
+    """
+    Read the (start, target) pairs of the cases written to path.
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        text = f.read()
+
+    assert "\0" not in text
+
+    if fmt == "file":
+        return [line for line in text.splitlines() if line.startswith("Testing from")]
+
+    records = [json.loads(line) for line in text.splitlines()]
+    return [
+        (r["case_number"], r["start_x"], r["start_y"], r["target_x"], r["target_y"])
+        for r in records if r["type"] == "case"
+    ]
+
+
+@pytest.mark.parametrize("fmt", ["file", "jsonl"])
+def test_resume_ignores_stale_checkpoint(fmt, tmp_path, monkeypatch):
+    """
+    Interrupt a run after several checkpoints, start a new run over the same path and
+    interrupt it before its first checkpoint, then resume: the result must be the new
+    run, the same as an uninterrupted run with its seed.
+    """
+    path = str(tmp_path / "log")
+    expected = str(tmp_path / "expected")
+    run(fmt, expected, seed=2)
+
+    monkeypatch.setattr(KnightPathTester, "CHECKPOINT_SECONDS", 0.0)
+    with pytest.raises(Interrupted):
+        run(fmt, path, seed=1, after=15)
+
+    monkeypatch.setattr(KnightPathTester, "CHECKPOINT_SECONDS", 3600.0)
+    with pytest.raises(Interrupted):
+        run(fmt, path, seed=2, after=3)
+
+    run(fmt, path, seed=None, resume=True)
+
+    assert pairs(fmt, path) == pairs(fmt, expected)
@@ -1,99 +1,750 @@
 
+import os
+import json
+import time
 import random
 from typing import Optional
+from itertools import islice
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from model.point import Point
+from logic.kq import KnightQuest
+from logic.bfs import KnightBFS
+from logic.board import KnightBoard
+from logic.runs import KnightRuns
 from tests.case import KnightPathCase
 from tests.statistics import KnightPathStats
 from tests.reporter import KnightPathReporter
+from tests.store import KnightResultStore
+from tests.truth import KnightTruthCache
 
 class KnightPathTester:
     """
     Runs a batch of knight pathfinding test cases and reports results. 
     Supports console output or file logging.
+
+    With more than one worker, the cases run across a process pool. The cases are generated
+    lazily from random.Random(seed), at most PENDING_PER_WORKER per worker ahead of the
+    results, and the results are collected in case order, so the log is the same as a
+    sequential run apart from the timings. Each case is timed inside the process that
+    runs it, so its speedups compare timings taken under the same load.
+
+    Runs written to disk are checkpointed every CHECKPOINT_SECONDS to '<path>.ckpt': the
+    number of completed cases, the output position after them and the running summary
+    totals. A resumed run truncates the output to the checkpoint, regenerates the seeded
+    cases skipping the completed ones and continues, so it ends with the same output and
+    summary as an uninterrupted run, timings aside.
+
+    Attributes:
+        HUGE_MARGIN (int): Distance kept from the region boundaries when distance vectors
+            are reduced by _freduce; the reduction matches BFS for margins of 3 and up.
+        PENDING_PER_WORKER (int): Cases submitted ahead per worker process.
+        CHECKPOINT_SECONDS (float): Interval between checkpoints of runs written to disk.
     """
-    def __init__(self, num_cases: int, max_coord: int, seed: Optional[int] = None):
+    HUGE_MARGIN = 8
+    PENDING_PER_WORKER = 4
+    CHECKPOINT_SECONDS = 5.0
+
+    def __init__(self, num_cases: int, max_coord: int, seed: Optional[int] = None,
+                 workers: int = 1, truth_path: Optional[str] = None):
         """
         Initialize with a list of (start, target) point pairs.
+
+        Args:
+            num_cases (int): Number of test cases to generate.
+            max_coord (int): Maximum absolute value for x and y coordinates.
+            seed (Optional[int]): Seed value for reproducibility (default None).
+            workers (int): Number of worker processes running the cases (default 1).
+            truth_path (Optional[str]): Database of the persistent BFS ground truth cache
+                shared by the cases, or None to run every BFS (default None).
         """
         self._num_cases = num_cases
         self._max_coord = max_coord
         self._seed = seed
+        self._workers = max(1, workers)
+        self._truth_path = truth_path
 
-        self.cases = self._generate_random_cases()
         self.stats = KnightPathStats()
         self.reporter = KnightPathReporter()
 
 
-    def _generate_random_cases(self) -> list[tuple[Point, Point]]:
+    def _generate_random_cases(self):
         """
-        Generate a list of random (start, target) Point pairs for knight path tests.
+        Lazily generate random (start, target) Point pairs for knight path tests.
 
         Coordinates are chosen from -max_coord to +max_coord to test negative positions.
-        Optionally accepts a seed for reproducibility.
+        The pairs come from a generator seeded with the tester's seed, so the same seed
+        gives the same cases however many are drawn at a time.
 
-        Args:
-            num_cases (int): Number of test cases to generate.
-            max_coord (int): Maximum absolute value for x and y coordinates (default 300).
-            seed (Optional[int]): Seed value for reproducibility (default None).
-
-        Returns:
-            list[tuple[Point, Point]]: List of (start, target) point tuples.
+        Yields:
+            tuple[Point, Point]: The (start, target) points of each case.
         """
-        if self._seed is not None:
-            random.seed(self._seed)
+        rng = random.Random(self._seed)
 
-        cases = []
         for _ in range(self._num_cases):
             start = Point(
-                random.randint(-self._max_coord, self._max_coord),
-                random.randint(-self._max_coord, self._max_coord)
+                rng.randint(-self._max_coord, self._max_coord),
+                rng.randint(-self._max_coord, self._max_coord)
             )
             target = Point(
-                random.randint(-self._max_coord, self._max_coord),
-                random.randint(-self._max_coord, self._max_coord)
+                rng.randint(-self._max_coord, self._max_coord),
+                rng.randint(-self._max_coord, self._max_coord)
             )
-            cases.append((start, target))
-        return cases
+            yield start, target
 
 
-    def run_all_console(self) -> None:
+    @staticmethod
+    def _frun_case(pair: tuple[Point, Point], truth_path: Optional[str] = None) -> dict:
+        """
+        Run a single test case and tag the result with the process that ran it.
+
+        Args:
+            pair (tuple[Point, Point]): The (start, target) points of the case.
+            truth_path (Optional[str]): Database of the BFS ground truth cache (default None).
+
+        Returns:
+            dict: The result of KnightPathCase.run, with the process id under 'worker'.
         """
-        Run all test cases and print formatted results to the console.
+        start, target = pair
+        truth = KnightTruthCache.fopen(truth_path) if truth_path is not None else None
+
+        result = KnightPathCase(start, target, truth).run()
+        result["worker"] = os.getpid()
+        return result
+
+
+    def _run_cases(self, skip: int = 0):
         """
-        for start, target in self.cases:
-            case = KnightPathCase(start, target)
-            result = case.run()
-            self.stats.add_result(result)
-            print(self.reporter.format_case_result(result))
+        Run all test cases, on the worker processes if there is more than one. At most
+        PENDING_PER_WORKER cases per worker are submitted ahead of the next result, so
+        neither the cases nor the results pile up in memory.
 
+        Args:
+            skip (int): Number of leading cases not to run, already completed (default 0).
+
+        Yields:
+            dict: The result of every case after the skipped ones, in case order.
+        """
+        cases = islice(self._generate_random_cases(), skip, None)
+
+        if self._workers == 1:
+            for pair in cases:
+                yield self._frun_case(pair, self._truth_path)
+            return
+
+        with ProcessPoolExecutor(max_workers=self._workers) as pool:
+            pending = deque(
+                pool.submit(self._frun_case, pair, self._truth_path)
+                for pair in islice(cases, self.PENDING_PER_WORKER * self._workers)
+            )
+
+            while pending:
+                result = pending.popleft().result()
+
+                pair = next(cases, None)
+                if pair is not None:
+                    pending.append(pool.submit(self._frun_case, pair, self._truth_path))
+
+                yield result
+
+
+    def _fsummary(self, wall_time: float) -> dict:
+        """
+        Summarize the collected results together with the run settings.
+
+        Args:
+            wall_time (float): Wall time of the whole run, in seconds.
+
+        Returns:
+            dict: The summary statistics.
+        """
         summary = self.stats.summary()
         summary['max_coord'] = self._max_coord
         summary['seed'] = self._seed
+        summary['workers'] = self._workers
+        summary['cpus'] = os.cpu_count() or 1
+        summary['wall_time'] = wall_time
+        summary['bfs_cache'] = self._truth_path
+
+        if self._truth_path is not None:
+            summary['bfs_cache_entries'] = len(KnightTruthCache.fopen(self._truth_path))
+
+        return summary
+
+
+    def run_all_console(self) -> None:
+        """
+        Run all test cases and print formatted results to the console as they finish,
+        in buffered chunks.
+        """
+        t0 = time.perf_counter()
+        for result in self._run_cases():
+            self.stats.add_result(result)
+            self.reporter.print_buffered(self.reporter.format_case_result(result) + "\n")
+        t1 = time.perf_counter()
+
+        self.reporter.print_buffered(self.reporter.format_summary(self._fsummary(t1 - t0)) + "\n")
+        self.reporter.flush_console()
+
+
+    def _fresume(self, filepath: str, fmt: str, resume: bool) -> dict:
+        """
+        Load the checkpoint of an interrupted run into the tester, or set up a new run. A
+        run without a seed gets a random one, so that it can be resumed. A new run writes
+        its initial checkpoint over any existing one.
+
+        Args:
+            filepath (str): Destination path of the run's output.
+            fmt (str): The output format of the run.
+            resume (bool): Whether to continue from an existing checkpoint.
+
+        Returns:
+            dict: The checkpoint: settings, completed cases, output position, SQLite run
+            id and wall time so far.
+        """
+        path = filepath + ".ckpt"
+
+        if resume and os.path.exists(path):
+            with open(path, "r", encoding="utf-8") as f:
+                checkpoint = json.load(f)
+
+            settings = {"format": fmt, "num_cases": self._num_cases, "max_coord": self._max_coord}
+            if self._seed is not None:
+                settings["seed"] = self._seed
 
-        print(self.reporter.format_summary(summary))
+            for key, value in settings.items():
+                if checkpoint[key] != value:
+                    raise ValueError(f"Cannot resume {filepath}: it was started with {key} {checkpoint[key]!r}, not {value!r}.")
 
+            self._seed = checkpoint['seed']
+            self.stats.load_state(checkpoint.pop('stats'))
 
-    def run_all_file(self, filepath: str = "tests/output/log.txt") -> None:
+            self.reporter.print_buffered(f"Resuming {filepath} after {checkpoint['completed']} of {self._num_cases} cases.\n")
+            return checkpoint
+
+        if resume:
+            self.reporter.print_buffered(f"No checkpoint found for {filepath}, starting a new run.\n")
+
+        if self._seed is None:
+            self._seed = random.randrange(2 ** 32)
+
+        checkpoint = {
+            "format": fmt, "num_cases": self._num_cases, "max_coord": self._max_coord, "seed": self._seed,
+            "completed": 0, "position": 0, "run_id": None, "wall_time": 0.0
+        }
+
+        # Replace the checkpoint of any earlier run at once, so that resuming this run if it
+        # is interrupted before its first checkpoint restarts it instead of the earlier one.
+        self._fcheckpoint(filepath, checkpoint, 0, 0, 0.0)
+        return checkpoint
+
+
+    def _fcheckpoint(self, filepath: str, checkpoint: dict, completed: int, position: Optional[int],
+                     wall_time: float) -> None:
         """
-        Run all test cases and write formatted results to a file.
+        Durably replace the checkpoint of a run. The output up to position must already be
+        on disk; the checkpoint is written to a temporary file and renamed over the old one,
+        so an interruption leaves either checkpoint intact.
+
+        Args:
+            filepath (str): Destination path of the run's output.
+            checkpoint (dict): The checkpoint returned by _fresume.
+            completed (int): Number of cases completed and written.
+            position (Optional[int]): Output position after the completed cases.
+            wall_time (float): Wall time of the run so far, in seconds.
+        """
+        path = filepath + ".ckpt"
+        state = dict(checkpoint, completed=completed, position=position, wall_time=wall_time,
+                     stats=self.stats.state())
+
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(path + ".tmp", path)
+
+
+    def run_all_file(self, filepath: str = "tests/output/log.txt", resume: bool = False) -> None:
+        """
+        Run all test cases and write formatted results to a file. Every result is written
+        and flushed as soon as its case finishes, so an interrupted run keeps the cases
+        completed so far, and the summary is appended at the end.
 
         Args:
             filepath (str): Destination path for output log file.
             Defaults to 'tests\\output\\log.txt'.
+            resume (bool): Continue an interrupted run from its checkpoint (default False).
         """
-        results = []
+        checkpoint = self._fresume(filepath, "file", resume)
+        completed = checkpoint['completed']
 
-        for case_number, (start, target) in enumerate(self.cases, start=1):
-            case = KnightPathCase(start, target)
-            result = case.run()
-            self.stats.add_result(result)
-            results.append(result)
+        with open(filepath, "r+" if completed else "w", encoding="utf-8") as f:
+            f.truncate(checkpoint['position'])
+            f.seek(checkpoint['position'])
 
-            print(f"Case {case_number} from {start} to {target} written to file.")
+            t0 = saved = time.perf_counter()
+            for case_number, result in enumerate(self._run_cases(completed), start=completed + 1):
+                self.stats.add_result(result)
+                f.write(self.reporter.format_case_result(result))
+                f.flush()
 
-        summary = self.stats.summary()
-        summary['max_coord'] = self._max_coord
-        summary['seed'] = self._seed
-        self.reporter.write_to_file(results, summary, filepath)
+                self.reporter.print_buffered(
+                    f"Case {case_number} from {result['start']} to {result['target']} written to file.\n"
+                )
+
+                if time.perf_counter() - saved >= self.CHECKPOINT_SECONDS:
+                    os.fsync(f.fileno())
+                    saved = time.perf_counter()
+                    self._fcheckpoint(filepath, checkpoint, case_number, f.tell(), checkpoint['wall_time'] + saved - t0)
+            t1 = time.perf_counter()
+
+            f.write(self.reporter.format_summary(self._fsummary(checkpoint['wall_time'] + t1 - t0)))
+
+        if os.path.exists(filepath + ".ckpt"):
+            os.remove(filepath + ".ckpt")
+
+        self.reporter.print_buffered(f"All test cases written to {filepath}.\n")
+        self.reporter.flush_console()
+
+
+    def run_all_store(self, fmt: str, filepath: str, resume: bool = False) -> None:
+        """
+        Run all test cases and store the results in a machine-readable format, then print
+        the summary to the console.
+
+        Args:
+            fmt (str): The store format: 'jsonl', 'csv' or 'sqlite'.
+            filepath (str): Destination path of the output file or database.
+            resume (bool): Continue an interrupted run from its checkpoint (default False).
+        """
+        checkpoint = self._fresume(filepath, fmt, resume)
+        completed = checkpoint['completed']
+
+        with KnightResultStore(filepath, fmt, self._seed, self._max_coord, self._workers,
+                               checkpoint if completed else None) as store:
+            checkpoint['run_id'] = store.run_id
+
+            t0 = saved = time.perf_counter()
+            for case_number, result in enumerate(self._run_cases(completed), start=completed + 1):
+                self.stats.add_result(result)
+                store.add(case_number, result)
+
+                if time.perf_counter() - saved >= self.CHECKPOINT_SECONDS:
+                    position = store.fsync()
+                    saved = time.perf_counter()
+                    self._fcheckpoint(filepath, checkpoint, case_number, position, checkpoint['wall_time'] + saved - t0)
+            t1 = time.perf_counter()
+
+            summary = self._fsummary(checkpoint['wall_time'] + t1 - t0)
+            store.write_summary(summary)
+
+        if os.path.exists(filepath + ".ckpt"):
+            os.remove(filepath + ".ckpt")
+
+        self.reporter.print_buffered(self.reporter.format_summary(summary) + "\n")
+        self.reporter.print_buffered(f"All test cases stored in {filepath} ({fmt}).\n")
+        self.reporter.flush_console()
+
+
+    def _run_grid(self, radius: int, num_samples: int) -> dict:
+        """
+        Verify KnightQuest exhaustively over the square region [-radius, radius]^2 of
+        distance vectors, using a single BFS distance field as ground truth.
+
+        Performs the following:
+            - Builds the distance field once with KnightBFS.ffield.
+            - Compares KnightQuest.feval against the field for every square.
+            - Runs KnightQuest.fpath for a random sample of squares, each translated by a
+              random offset within max_coord, and validates the path and its length.
+
+        Args:
+            radius (int): The half-width of the verified region.
+            num_samples (int): Number of squares whose paths are validated.
+
+        Returns:
+            dict: A dictionary containing the verification counts, mismatches and timings.
+        """
+        if self._seed is not None:
+            random.seed(self._seed)
+
+        t0 = time.perf_counter()
+        field = KnightBFS.ffield(radius)
+        t1 = time.perf_counter()
+        time_field = t1 - t0
+
+        origin = Point(0, 0)
+        kq = KnightQuest(origin, origin)
+        eval_mismatches = []
+
+        t0 = time.perf_counter()
+        for x in range(-radius, radius + 1):
+            row = field[x + radius]
+
+            for y in range(-radius, radius + 1):
+                target = Point(x, y)
+
+                if kq.feval(origin, target) != row[y + radius]:
+                    eval_mismatches.append(target)
+        t1 = time.perf_counter()
+        time_eval = t1 - t0
+
+        path_failures = []
+        fallbacks = 0
+
+        t0 = time.perf_counter()
+        for _ in range(num_samples):
+            delta = Point(random.randint(-radius, radius), random.randint(-radius, radius))
+            start = Point(
+                random.randint(-self._max_coord, self._max_coord),
+                random.randint(-self._max_coord, self._max_coord)
+            )
+            target = start + delta
+
+            kq_path = KnightQuest(start, target)
+            path = kq_path.fpath()
+            fallbacks += kq_path.fallback_count
+
+            valid = KnightPathCase.is_valid_knight_path(path, start, target)
+            if not valid or len(path) != field[delta.x + radius, delta.y + radius] + 1:
+                path_failures.append((start, target))
+        t1 = time.perf_counter()
+        time_paths = t1 - t0
+
+        return {
+            "radius": radius,
+            "squares": field.size,
+            "eval_mismatches": eval_mismatches,
+            "samples": num_samples,
+            "path_failures": path_failures,
+            "fallbacks": fallbacks,
+            "time_field": time_field,
+            "time_eval": time_eval,
+            "time_paths": time_paths,
+            "max_coord": self._max_coord,
+            "seed": self._seed
+        }
+
+
+    def run_grid_console(self, radius: int, num_samples: int) -> None:
+        """
+        Run the exhaustive grid verification and print the report to the console.
+
+        Args:
+            radius (int): The half-width of the verified region.
+            num_samples (int): Number of squares whose paths are validated.
+        """
+        result = self._run_grid(radius, num_samples)
+        print(self.reporter.format_grid_result(result))
+
+
+    def run_grid_file(self, radius: int, num_samples: int, filepath: str = "tests/output/log.txt") -> None:
+        """
+        Run the exhaustive grid verification and write the report to a file.
+
+        Args:
+            radius (int): The half-width of the verified region.
+            num_samples (int): Number of squares whose paths are validated.
+            filepath (str): Destination path for output log file.
+        """
+        result = self._run_grid(radius, num_samples)
+
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(self.reporter.format_grid_result(result))
+
+        print(f"Grid verification written to {filepath}.")
+
+
+    def _run_board(self, N: int, M: int, num_samples: int) -> dict:
+        """
+        Verify KnightBoard on an N x M board against BFS ground truth restricted to the board.
+
+        Performs the following:
+            - Builds (or reuses) the board tables and measures the build time.
+            - For a random sample of source squares (every square if the board has at most
+              num_samples squares), runs one board BFS and compares KnightBoard.feval to it
+              for every target square.
+            - For every sampled source, validates KnightBoard.fpath to one random target:
+              legal knight moves, all squares on the board and optimal length.
+
+        Args:
+            N (int): Board size along x.
+            M (int): Board size along y.
+            num_samples (int): Number of source squares to verify.
+
+        Returns:
+            dict: A dictionary containing the verification counts, mismatches and timings.
+        """
+        if self._seed is not None:
+            random.seed(self._seed)
+
+        t0 = time.perf_counter()
+        board = KnightBoard(N, M)
+        t1 = time.perf_counter()
+        time_build = t1 - t0
+
+        squares = [Point(x, y) for x in range(N) for y in range(M)]
+        sources = squares if len(squares) <= num_samples else random.sample(squares, num_samples)
+
+        eval_mismatches = []
+        path_failures = []
+        time_eval = 0
+        time_paths = 0
+
+        for source in sources:
+            field = board.ffield(source)
+
+            t0 = time.perf_counter()
+            for target in squares:
+                if board.feval(source, target) != field[target.x, target.y]:
+                    eval_mismatches.append((source, target))
+            t1 = time.perf_counter()
+            time_eval += t1 - t0
+
+            target = random.choice(squares)
+
+            t0 = time.perf_counter()
+            path = board.fpath(source, target)
+            t1 = time.perf_counter()
+            time_paths += t1 - t0
+
+            if field[target.x, target.y] < 0:
+                valid = path == []
+            else:
+                valid = (
+                    KnightPathCase.is_valid_knight_path(path, source, target)
+                    and len(path) == field[target.x, target.y] + 1
+                    and all(0 <= p.x < N and 0 <= p.y < M for p in path)
+                )
+
+            if not valid:
+                path_failures.append((source, target))
+
+        tables = board.table if board.table is not None else board.corners
+
+        return {
+            "board": (N, M),
+            "table": "full" if board.table is not None else "corners" if tables is not None else "none, BFS per query",
+            "table_bytes": tables.nbytes if tables is not None else 0,
+            "sources": len(sources),
+            "squares": len(sources) * len(squares),
+            "eval_mismatches": eval_mismatches,
+            "path_failures": path_failures,
+            "time_build": time_build,
+            "time_eval": time_eval,
+            "time_paths": time_paths,
+            "seed": self._seed
+        }
+
+
+    def run_board_console(self, N: int, M: int, num_samples: int) -> None:
+        """
+        Run the bounded board verification and print the report to the console.
+
+        Args:
+            N (int): Board size along x.
+            M (int): Board size along y.
+            num_samples (int): Number of source squares to verify.
+        """
+        result = self._run_board(N, M, num_samples)
+        print(self.reporter.format_board_result(result))
+
+
+    def run_board_file(self, N: int, M: int, num_samples: int, filepath: str = "tests/output/log.txt") -> None:
+        """
+        Run the bounded board verification and write the report to a file.
+
+        Args:
+            N (int): Board size along x.
+            M (int): Board size along y.
+            num_samples (int): Number of source squares to verify.
+            filepath (str): Destination path for output log file.
+        """
+        result = self._run_board(N, M, num_samples)
+
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(self.reporter.format_board_result(result))
+
+        print(f"Board verification written to {filepath}.")
+
+
+    @staticmethod
+    def _freduce(dx: int, dy: int, margin: int) -> tuple[int, int, int]:
+        """
+        Translate a distance vector of any magnitude to a small one with a known difference
+        in the minimum number of moves, so that a small BFS distance field gives the ground
+        truth for it.
+
+        In the canonical octant x >= y >= 0, the minimum number of moves grows by exactly 2
+        for every translation by (4, 2) and, below the line y = x/2, by (4, 0), or above
+        it, by (3, 3), as long as the vector stays at least margin away from the lines
+        y = 0, y = x/2 and y = x that bound its region.
+
+        Args:
+            dx (int): The x-component of the distance vector.
+            dy (int): The y-component of the distance vector.
+            margin (int): The distance kept from the region boundaries.
+
+        Returns:
+            tuple[int, int, int]: The reduced vector (x, y), both within 3 * margin + 5,
+            and the number of moves removed by the reduction.
+        """
+        a, b = abs(dx), abs(dy)
+        if a < b:
+            a, b = b, a
+
+        if a >= 2 * b:
+            k = max(0, (b - margin) // 2)
+            a, b = a - 4 * k, b - 2 * k
+            j = max(0, (a - 2 * b - margin) // 4)
+            a -= 4 * j
+        else:
+            k = max(0, (a - b - margin) // 2)
+            a, b = a - 4 * k, b - 2 * k
+            j = max(0, (2 * b - a - margin) // 3)
+            a, b = a - 3 * j, b - 3 * j
+
+        return a, b, 2 * (k + j)
+
+
+    def _run_huge(self, num_samples: int, bits: int, steps: int = 8) -> dict:
+        """
+        Verify exact arithmetic for coordinates up to 2^bits against BFS ground truth.
+
+        Performs the following:
+            - Builds one small BFS distance field that covers every reduced vector.
+            - Draws start squares within 2^bits and distance vectors either uniformly or
+              close to the lines y = 0, y = x/2 and y = x, where rounding errors flip
+              region and parity decisions.
+            - Compares KnightQuest.feval against the field, translated by _freduce.
+            - Checks the first steps of fpath and iter_path, each lowering the ground truth
+              by exactly one, and the move count of KnightRuns.
+
+        Args:
+            num_samples (int): Number of (start, target) pairs to verify.
+            bits (int): Coordinates are drawn from (-2^bits, 2^bits).
+            steps (int): Number of path steps checked per pair (default 8).
+
+        Returns:
+            dict: A dictionary containing the verification counts, mismatches and timings.
+        """
+        if self._seed is not None:
+            random.seed(self._seed)
+
+        margin = self.HUGE_MARGIN
+        radius = 3 * margin + 5
+        field = KnightBFS.ffield(radius)
+        limit = 2 ** bits
+        kq = KnightQuest(Point(0, 0), Point(0, 0))
+
+        def truth(A: Point, B: Point) -> int:
+            x, y, moves = self._freduce(B.x - A.x, B.y - A.y, margin)
+            return int(field[x + radius, y + radius]) + moves
+
+        def descends(path: list, distances: list) -> bool:
+            return all(
+                sorted((abs(a.x - b.x), abs(a.y - b.y))) == [1, 2] and d - e == 1
+                for a, b, d, e in zip(path, path[1:], distances, distances[1:])
+            )
+
+        eval_mismatches = []
+        path_failures = []
+        time_eval = 0
+        time_paths = 0
+
+        for _ in range(num_samples):
+            t = random.randint(0, limit // 2)
+            e = random.randint(-4 * margin, 4 * margin)
+            f = random.randint(-4 * margin, 4 * margin)
+            dx, dy = random.choice([
+                (random.randint(-limit, limit), random.randint(-limit, limit)),
+                (2 * t + e, t + f),
+                (t + e, t + f),
+                (2 * t + e, f)
+            ])
+            dx, dy = (dy, dx) if random.random() < 0.5 else (dx, dy)
+            dx, dy = random.choice((1, -1)) * dx, random.choice((1, -1)) * dy
+
+            start = Point(random.randint(-limit, limit), random.randint(-limit, limit))
+            target = Point(start.x + dx, start.y + dy)
+            expected = truth(start, target)
+
+            t0 = time.perf_counter()
+            value = kq.feval(start, target)
+            t1 = time.perf_counter()
+            time_eval += t1 - t0
+
+            if value != expected:
+                eval_mismatches.append((start, target))
+
+            t0 = time.perf_counter()
+            # The first steps of fpath, which walks back from the target to the start,
+            # and of iter_path, which walks forward from the start. Exact multiples of a
+            # move are a single fmove call, so the steps are taken from the kernel lazily.
+            kq_path = KnightQuest(start, target)
+            moved = [target]
+            for square in kq_path._fwalk(target.x, target.y, start.x, start.y):
+                moved.append(square)
+                if len(moved) > steps:
+                    break
+
+            walked = []
+            for square in kq_path.iter_path():
+                walked.append(square)
+                if len(walked) > steps:
+                    break
+
+            runs = KnightRuns(start, target)
+            t1 = time.perf_counter()
+            time_paths += t1 - t0
+
+            valid = (
+                descends(moved, [truth(start, P) for P in moved])
+                and descends(walked, [truth(P, target) for P in walked])
+                and kq_path.fallback_count == 0
+                and runs.moves == expected
+            )
+
+            if not valid:
+                path_failures.append((start, target))
+
+        return {
+            "bits": bits,
+            "radius": radius,
+            "samples": num_samples,
+            "steps": steps,
+            "eval_mismatches": eval_mismatches,
+            "path_failures": path_failures,
+            "time_eval": time_eval,
+            "time_paths": time_paths,
+            "seed": self._seed
+        }
+
+
+    def run_huge_console(self, num_samples: int, bits: int) -> None:
+        """
+        Run the huge-coordinate verification and print the report to the console.
+
+        Args:
+            num_samples (int): Number of (start, target) pairs to verify.
+            bits (int): Coordinates are drawn from (-2^bits, 2^bits).
+        """
+        result = self._run_huge(num_samples, bits)
+        print(self.reporter.format_huge_result(result))
+
+
+    def run_huge_file(self, num_samples: int, bits: int, filepath: str = "tests/output/log.txt") -> None:
+        """
+        Run the huge-coordinate verification and write the report to a file.
+
+        Args:
+            num_samples (int): Number of (start, target) pairs to verify.
+            bits (int): Coordinates are drawn from (-2^bits, 2^bits).
+            filepath (str): Destination path for output log file.
+        """
+        result = self._run_huge(num_samples, bits)
+
+        with open(filepath, "w", encoding="utf-8") as f:
+            f.write(self.reporter.format_huge_result(result))
 
-        print(f"All test cases written to {filepath}.")
\ No newline at end of file
+        print(f"Huge-coordinate verification written to {filepath}.")
@@ -0,0 +1,144 @@
+import os
+import sqlite3
+from typing import Optional
+import numpy as np
+from model.point import Point
+from logic.cache import KnightPathCache
+from logic.packed import KnightPackedPath
+
+class KnightTruthCache:
+    """
+    Persistent BFS ground truth shared across runs and worker processes.
+
+    On the infinite board, the BFS distance from A to B depends only on the canonical
+    distance vector (a, b) = KnightPathCache.fkey(A, B), a >= b >= 0. The cache maps every
+    canonical vector to its BFS distance, a reference shortest path from the origin to
+    (a, b) packed by KnightPackedPath, and the time the BFS took, so that speedups against
+    BFS can still be reported for cached cases. The reference path is mapped back to the
+    actual A and B by KnightPathCache.fplace.
+
+    Entries live in a SQLite database. Every entry is inserted in its own transaction and
+    existing entries are never overwritten, so parallel workers writing the same vector
+    cannot corrupt or change an entry, and WAL mode lets readers proceed during writes.
+
+    Attributes:
+        TIMEOUT (float): Seconds to wait for a write lock held by another process.
+        path (str): The database path.
+        hits (int): Lookups answered from the cache by this instance.
+        misses (int): Lookups that found no entry.
+    """
+    TIMEOUT = 30.0
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS truth (
+            a INTEGER NOT NULL,
+            b INTEGER NOT NULL,
+            distance INTEGER NOT NULL,
+            path BLOB NOT NULL,
+            time_bfs REAL NOT NULL,
+            PRIMARY KEY (a, b)
+        ) WITHOUT ROWID
+    """
+
+    # Open caches of the current process, by (process id, path).
+    _instances = {}
+
+    def __init__(self, path: str) -> None:
+        """
+        Open the cache database, creating it if needed.
+
+        Args:
+            path (str): The database path.
+        """
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+
+        self._db = sqlite3.connect(path, timeout=self.TIMEOUT)
+        self._db.execute("PRAGMA journal_mode = WAL")
+
+        with self._db:
+            self._db.execute(self._SCHEMA)
+
+
+    @classmethod
+    def fopen(cls, path: str) -> 'KnightTruthCache':
+        """
+        Return the cache of this process for a database path, opening it on first use.
+        SQLite connections must not cross process boundaries, so every worker process
+        opens its own.
+
+        Args:
+            path (str): The database path.
+
+        Returns:
+            KnightTruthCache: The cache.
+        """
+        key = (os.getpid(), path)
+
+        if key not in cls._instances:
+            cls._instances[key] = cls(path)
+
+        return cls._instances[key]
+
+
+    def fget(self, A: 'Point', B: 'Point') -> Optional[tuple]:
+        """
+        Look up the BFS ground truth of a pair.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+
+        Returns:
+            Optional[tuple[list, float]]: A shortest path from A to B as Points and the
+            recorded BFS time, or None if the canonical vector is not cached.
+        """
+        row = self._db.execute(
+            "SELECT path, time_bfs FROM truth WHERE a = ? AND b = ?", KnightPathCache.fkey(A, B)
+        ).fetchone()
+
+        if row is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        packed = KnightPackedPath.from_bytes(row[0])
+        return Point.from_pairs(KnightPathCache.fplace(packed, A, B).tolist()), row[1]
+
+
+    def fput(self, A: 'Point', B: 'Point', path: list, time_bfs: float) -> None:
+        """
+        Record the BFS result of a pair under its canonical vector, unless an entry exists.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+            path (list[Point]): The BFS path from A to B.
+            time_bfs (float): The time the BFS took, in seconds.
+        """
+        dx, dy = B.x - A.x, B.y - A.y
+
+        # Undo the symmetry fplace applies: negate, then swap the axes.
+        coords = (np.array(path, dtype=np.int64) - (A.x, A.y)) * (-1 if dx < 0 else 1, -1 if dy < 0 else 1)
+        if abs(dy) > abs(dx):
+            coords = coords[:, ::-1]
+
+        a, b = KnightPathCache.fkey(A, B)
+        packed = KnightPackedPath.from_coords(coords)
+
+        with self._db:
+            self._db.execute(
+                "INSERT OR IGNORE INTO truth VALUES (?, ?, ?, ?, ?)",
+                (a, b, packed.length, packed.to_bytes(), time_bfs)
+            )
+
+
+    def __len__(self) -> int:
+        """
+        Number of cached canonical vectors.
+
+        Returns:
+            int: The number of entries.
+        """
+        return self._db.execute("SELECT COUNT(*) FROM truth").fetchone()[0]
@@ -0,0 +1,202 @@
+
+import json
+import time
+import random
+import asyncio
+import argparse
+from typing import Optional
+
+class KnightLoadGenerator:
+    """
+    Load generator for the knight query server. Opens a number of connections, keeps a
+    fixed number of requests in flight on each and measures the throughput and the latency
+    of every request, from sending it to reading its response.
+
+    Attributes:
+        latencies (list[float]): Latency of every answered request, in seconds.
+        errors (int): Responses carrying an error, including rejections.
+        elapsed (float): Wall time of the last run, in seconds.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None,
+                 op: str = "eval", max_coord: int = 100, seed: Optional[int] = None) -> None:
+        """
+        Initialize the KnightLoadGenerator.
+
+        Args:
+            host (str): Server TCP host (default 127.0.0.1).
+            port (int): Server TCP port (default 8765).
+            unix (Optional[str]): Server Unix socket path, instead of TCP (default None).
+            op (str): Request kind: 'eval', 'path' or 'mixed' (default 'eval').
+            max_coord (int): Squares are drawn from (-max_coord, max_coord) (default 100).
+            seed (Optional[int]): Seed value for reproducibility (default None).
+        """
+        self._host = host
+        self._port = port
+        self._unix = unix
+        self._op = op
+        self._max_coord = max_coord
+        self._rng = random.Random(seed)
+
+        self.latencies = []
+        self.errors = 0
+        self.elapsed = 0
+
+
+    async def _fconnect(self) -> tuple:
+        """
+        Open a connection to the server.
+
+        Returns:
+            tuple: The (reader, writer) pair.
+        """
+        if self._unix is not None:
+            return await asyncio.open_unix_connection(self._unix)
+        return await asyncio.open_connection(self._host, self._port)
+
+
+    def _frequest(self, rid: int) -> bytes:
+        """
+        Build one random request line.
+
+        Args:
+            rid (int): The request id.
+
+        Returns:
+            bytes: The JSON line.
+        """
+        c = self._max_coord
+        op = self._op if self._op != "mixed" else self._rng.choice(("eval", "path"))
+        request = {
+            "id": rid, "op": op,
+            "start": [self._rng.randint(-c, c), self._rng.randint(-c, c)],
+            "end": [self._rng.randint(-c, c), self._rng.randint(-c, c)]
+        }
+        return json.dumps(request).encode() + b"\n"
+
+
+    async def _fclient(self, num_requests: int, concurrency: int, first_id: int) -> None:
+        """
+        Send requests over one connection, keeping up to concurrency of them in flight.
+
+        Args:
+            num_requests (int): Number of requests to send.
+            concurrency (int): Maximum number of requests in flight.
+            first_id (int): Id of the first request.
+        """
+        reader, writer = await self._fconnect()
+        sent = {}
+        next_id = first_id
+        last_id = first_id + num_requests
+
+        async def fill():
+            nonlocal next_id
+            while next_id < last_id and len(sent) < concurrency:
+                writer.write(self._frequest(next_id))
+                sent[next_id] = time.perf_counter()
+                next_id += 1
+            await writer.drain()
+
+        await fill()
+
+        while sent:
+            response = json.loads(await reader.readline())
+            self.latencies.append(time.perf_counter() - sent.pop(response["id"]))
+
+            if "error" in response:
+                self.errors += 1
+
+            await fill()
+
+        writer.close()
+        await writer.wait_closed()
+
+
+    async def fstats(self) -> dict:
+        """
+        Fetch the server statistics.
+
+        Returns:
+            dict: The statistics reported by the server.
+        """
+        reader, writer = await self._fconnect()
+        writer.write(b'{"op": "stats"}\n')
+        await writer.drain()
+
+        stats = json.loads(await reader.readline())["stats"]
+        writer.close()
+        await writer.wait_closed()
+
+        return stats
+
+
+    async def run(self, num_requests: int, connections: int, concurrency: int) -> dict:
+        """
+        Run the load test.
+
+        Args:
+            num_requests (int): Total number of requests, split over the connections.
+            connections (int): Number of connections.
+            concurrency (int): Requests in flight per connection.
+
+        Returns:
+            dict: Requests, errors, throughput, latency percentiles in milliseconds and the
+            server statistics.
+        """
+        self.latencies = []
+        self.errors = 0
+
+        share, extra = divmod(num_requests, connections)
+        counts = [share + (i < extra) for i in range(connections)]
+        starts = [sum(counts[:i]) for i in range(connections)]
+
+        t0 = time.perf_counter()
+        await asyncio.gather(*(
+            self._fclient(count, concurrency, start) for count, start in zip(counts, starts) if count
+        ))
+        t1 = time.perf_counter()
+        self.elapsed = t1 - t0
+
+        latencies = sorted(self.latencies)
+
+        def percentile(q):
+            return 1000 * latencies[min(len(latencies) - 1, int(q * len(latencies)))] if latencies else 0
+
+        return {
+            "requests": len(latencies),
+            "errors": self.errors,
+            "elapsed": self.elapsed,
+            "rps": len(latencies) / self.elapsed if self.elapsed else 0,
+            "p50_ms": percentile(0.50),
+            "p90_ms": percentile(0.90),
+            "p99_ms": percentile(0.99),
+            "max_ms": 1000 * latencies[-1] if latencies else 0,
+            "server": await self.fstats()
+        }
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Load generator for the knight query server.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="Server TCP host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="Server TCP port (default: 8765)")
+    parser.add_argument("--unix", type=str, default=None, help="Server Unix socket path, instead of TCP (default: None)")
+    parser.add_argument("--requests", type=int, default=10000, help="Total number of requests (default: 10000)")
+    parser.add_argument("--connections", type=int, default=8, help="Number of connections (default: 8)")
+    parser.add_argument("--concurrency", type=int, default=8, help="Requests in flight per connection (default: 8)")
+    parser.add_argument("--op", choices=["eval", "path", "mixed"], default="eval", help="Request kind (default: eval)")
+    parser.add_argument("--max_coord", type=int, default=100, help="Point range: (-max_coord, +max_coord) (default: 100)")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for reproducibility (default: None)")
+    args = parser.parse_args()
+
+    generator = KnightLoadGenerator(args.host, args.port, args.unix, args.op, args.max_coord, args.seed)
+    result = asyncio.run(generator.run(args.requests, args.connections, args.concurrency))
+    server = result["server"]
+
+    print(f"\n📈 Load test: {result['requests']} {args.op} requests, {args.connections} connections x {args.concurrency} in flight")
+    print(f"  Errors: {result['errors']}")
+    print(f"  Throughput: {result['rps']:,.0f} requests/s ({result['elapsed']:.3f}s)")
+    print(f"  Client latency: p50 {result['p50_ms']:.3f} ms, p90 {result['p90_ms']:.3f} ms, "
+          f"p99 {result['p99_ms']:.3f} ms, max {result['max_ms']:.3f} ms")
+    print(f"  Server: {server['completed']} completed, {server['rejected']} rejected, "
+          f"average batch {server['avg_batch']:.1f}, p99 {server['p99_ms']:.3f} ms")
@@ -10,7 +10,30 @@ class KnightQuest:
     The knight's base move vectors (1, 2) and (2, 1) are rotated according to the quadrant 
     of the current position relative to the start, and the algorithm chooses the best move 
     based on an evaluation function that estimates the remaining minimum moves.
+
+    Near the target, feval and the path kernel use a lookup table instead of the formula.
+    It covers every distance vector within TABLE_RADIUS, and is built once by a breadth-first
+    search when the module is loaded. That is where the formula needs its special cases and
+    the moves their adjacent square adjustment.
+
+    Attributes:
+        ROTATIONS (tuple): The base vectors (1, 2) and (2, 1) rotated by theta * 90 degrees,
+            for theta = 0 to 3, as integer (x, y) pairs.
+        TABLE_RADIUS (int): Half-width of the square of distance vectors in the lookup table.
     """
+    ROTATIONS = (
+        ((1, 2), (2, 1)),
+        ((-2, 1), (-1, 2)),
+        ((-1, -2), (-2, -1)),
+        ((2, -1), (1, -2))
+    )
+    TABLE_RADIUS = 8
+
+    # Lookup table indexed by (dx + TABLE_RADIUS) * (2 * TABLE_RADIUS + 1) + dy + TABLE_RADIUS
+    # for a distance vector (dx, dy) from the current square to the target: the minimum
+    # number of moves, and the move to take (None on the target itself). Built by _ftable.
+    _DIST = []
+    _NEXT = []
 
     def __init__(self, A: 'Point', B: 'Point') -> None:
         """
@@ -110,9 +133,9 @@ class KnightQuest:
         Returns:
             int: The minimum number of moves remaining.
         """
-        d = A - B
-        r = self._fref(d)
-        return Sequence.from_point(r).value()
+        # A table lookup near the target, the integer form of the sequence formula
+        # (_fref, Sequence.from_point and Sequence.value) further away.
+        return self._fvalue(A.x - B.x, A.y - B.y)
 
 
     def fmove(self) -> None:
@@ -143,7 +166,7 @@ class KnightQuest:
         su = Sequence.from_point(ru)
         sv = Sequence.from_point(rv)
 
-        if min(d.x, d.y) != 0 and abs(max(d.x, d.y) / min(d.x, d.y)) == 2:
+        if min(d.x, d.y) != 0 and abs(max(d.x, d.y)) == 2 * abs(min(d.x, d.y)):
             # If (d) is an integer multiple of a base knight move, decompose 
             # it into unit knight steps and append each to the path.
             count = max(abs(d.x), abs(d.y)) // 2
@@ -176,16 +199,228 @@ class KnightQuest:
             self.fallback_count += 1
 
 
+    @staticmethod
+    def _fformula(dx: int, dy: int) -> int:
+        """
+        Evaluate the minimum number of moves for a distance vector (dx, dy) outside the
+        lookup table using plain integers. Equivalent to _fref, Sequence.from_point and
+        Sequence.value combined, with the ceilings computed by integer division. The special
+        cases of the sequence formula all lie within the table and are left out.
+
+        Args:
+            dx (int): The x-component of the distance vector.
+            dy (int): The y-component of the distance vector.
+
+        Returns:
+            int: The minimum number of moves.
+        """
+        x = dx if dx >= 0 else -dx
+        y = dy if dy >= 0 else -dy
+        if x < y:
+            x, y = y, x
+
+        if 2 * y <= x:
+            n = x
+            m = (n + 1) // 2 - y
+        else:
+            delta = -((x - 2 * y) // 3)
+            n = x + delta
+            m = (n + 1) // 2 - y + delta
+
+        if n & 1:
+            return (n + 3) // 2 - (m & 1)
+        return n // 2 + (m & 1)
+
+
+    @classmethod
+    def _fvalue(cls, dx: int, dy: int) -> int:
+        """
+        Evaluate the minimum number of moves for a distance vector (dx, dy): a table lookup
+        near the target, otherwise _fformula.
+
+        Args:
+            dx (int): The x-component of the distance vector.
+            dy (int): The y-component of the distance vector.
+
+        Returns:
+            int: The minimum number of moves.
+        """
+        R = cls.TABLE_RADIUS
+
+        if -R <= dx <= R and -R <= dy <= R:
+            return cls._DIST[(dx + R) * (2 * R + 1) + dy + R]
+
+        return cls._fformula(dx, dy)
+
+
+    @classmethod
+    def _ftable(cls) -> None:
+        """
+        Build the near-target lookup table. Distances come from a breadth-first search
+        around the origin, with a margin so that shortest paths may leave the table. The
+        move of every entry is the one fmove selects there, so paths are unchanged by the
+        table, unless fmove would not get one move closer; then it is a move the search
+        proves optimal.
+        """
+        R = cls.TABLE_RADIUS
+        W = 2 * R + 1
+        limit = R + 4
+        moves = [move for pair in cls.ROTATIONS for move in pair]
+
+        dist = {(0, 0): 0}
+        frontier = [(0, 0)]
+        while frontier:
+            level = []
+            for x, y in frontier:
+                for mx, my in moves:
+                    z = (x + mx, y + my)
+                    if z not in dist and abs(z[0]) <= limit and abs(z[1]) <= limit:
+                        dist[z] = dist[(x, y)] + 1
+                        level.append(z)
+            frontier = level
+
+        cls._DIST = [dist[(dx, dy)] for dx in range(-R, R + 1) for dy in range(-R, R + 1)]
+        cls._NEXT = [None] * (W * W)
+
+        origin = Point(0, 0)
+        for dx in range(-R, R + 1):
+            for dy in range(-R, R + 1):
+                if dx == 0 and dy == 0:
+                    continue
+
+                # fmove walks from the target towards A, here (dx, dy) from the origin.
+                kq = cls(Point(dx, dy), origin)
+                kq.fmove()
+                candidates = [(kq._p[1].x, kq._p[1].y)] + moves
+
+                cls._NEXT[(dx + R) * W + dy + R] = next(
+                    (mx, my) for mx, my in candidates
+                    if dist.get((dx - mx, dy - my)) == dist[(dx, dy)] - 1
+                )
+
+
+    def _fwalk(self, px: int, py: int, tx: int, ty: int):
+        """
+        Generate the squares of a shortest path from (px, py) to (tx, ty), excluding
+        (px, py). Applies the same move selection as fmove, with (tx, ty) in the role of
+        the start point, but on plain integers: within TABLE_RADIUS of the target the move
+        is looked up, further away rotated base vectors come from the ROTATIONS table, the
+        reflection and sequence evaluation are done by _fformula, and the remaining evaluation
+        is carried over from the chosen candidate instead of being recomputed by feval.
+        Only the yielded Points themselves are created.
+
+        Args:
+            px (int): The x-coordinate of the square to walk from.
+            py (int): The y-coordinate of the square to walk from.
+            tx (int): The x-coordinate of the square to walk to.
+            ty (int): The y-coordinate of the square to walk to.
+
+        Yields:
+            Point: The next square of the path.
+        """
+        dx = tx - px
+        dy = ty - py
+        s = self._fvalue(dx, dy)
+
+        R = self.TABLE_RADIUS
+        W = 2 * R + 1
+        table = self._NEXT
+        formula = self._fformula
+
+        while True:
+            if -R <= dx <= R and -R <= dy <= R:
+                # Near the target: the move comes from the lookup table.
+                move = table[(dx + R) * W + dy + R]
+
+                if move is None:
+                    return
+
+                mx, my = move
+                s -= 1
+            else:
+                hi, lo = (dx, dy) if dx >= dy else (dy, dx)
+
+                if lo != 0 and abs(hi) == 2 * abs(lo):
+                    # Integer multiple of a base knight move: walk it in unit steps.
+                    count = max(abs(dx), abs(dy)) // 2
+                    ux = dx // count
+                    uy = dy // count
+
+                    for _ in range(count):
+                        px += ux
+                        py += uy
+                        yield Point(px, py)
+
+                    return
+
+                if dx >= 0:
+                    theta = 0 if dy >= 0 else 3
+                else:
+                    theta = 1 if dy >= 0 else 2
+
+                # Outside the table, neither candidate can reach a special case of the
+                # formula, so it is evaluated directly.
+                (ux, uy), (vx, vy) = self.ROTATIONS[theta]
+                su = formula(dx - ux, dy - uy)
+
+                if s - su == 1:
+                    mx, my, s = ux, uy, su
+                else:
+                    sv = formula(dx - vx, dy - vy)
+
+                    if s - sv == 1:
+                        mx, my, s = vx, vy, sv
+                    else:
+                        # Fallback on the candidate better aligned with the distance vector.
+                        if ux * dx + uy * dy >= vx * dx + vy * dy:
+                            mx, my, s = ux, uy, su
+                        else:
+                            mx, my, s = vx, vy, sv
+
+                        self.fallback_count += 1
+
+            px += mx
+            py += my
+            dx -= mx
+            dy -= my
+            yield Point(px, py)
+
+
+    def _fkernel(self) -> None:
+        """
+        Extend the path from its current end to the start point A.
+        """
+        end = self._p[-1]
+        self._p.extend(self._fwalk(end.x, end.y, self.A.x, self.A.y))
+
+
     def fpath(self) -> list:
         """
         Construct the full knight path from the target back to the start point. Repeatedly 
-        applies moves using fmove until the evaluation function returns zero, meaning the 
-        knight has reached the start point.
+        applies moves, selected as in fmove, until the evaluation function returns zero, 
+        meaning the knight has reached the start point.
 
         Returns:
             list: The list of path segment (Points) in correct order.
         """
-        while self.feval(self.A, self._p[-1]) > 0:
-            self.fmove()
+        self._fkernel()
+
+        return self._p[::-1]
+
+
+    def iter_path(self):
+        """
+        Lazily generate a knight path from the start point to the target, one square at a
+        time. The path is built forward from A, with the roles of A and B swapped in the
+        move selection, so only the current square is held in memory and the first moves
+        are available immediately. It is a shortest path, the reverse of
+        KnightQuest(B, A).fpath(), but not necessarily the same squares as fpath().
+
+        Yields:
+            Point: The squares of the path from A to B, both included.
+        """
+        yield self.A
+        yield from self._fwalk(self.A.x, self.A.y, self.B.x, self.B.y)
+
 
-        return self._p[::-1]
\ No newline at end of file
+KnightQuest._ftable()
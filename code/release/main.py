@@ -1,4 +1,6 @@
 
+import sys
+import json
 import argparse
 from model.point import Point
 from logic.kq import KnightQuest
@@ -16,13 +18,138 @@ def str_to_point(value: str) -> Point:
         raise ValueError(f"Invalid point format: '{value}'. Expected format is 'x,y'.")
 
 
+def parse_pair(line: str, fmt: str) -> tuple:
+    """
+    Parse one input line into a (start, end) pair of Points.
+
+    CSV lines hold 'x1,y1,x2,y2'. JSON lines hold {"start": [x1, y1], "end": [x2, y2]}
+    or [[x1, y1], [x2, y2]]. With fmt 'auto', lines starting with '{' or '[' are JSON.
+    """
+    if fmt == "jsonl" or (fmt == "auto" and line[0] in "{["):
+        value = json.loads(line)
+        start, end = (value["start"], value["end"]) if isinstance(value, dict) else value
+
+        if not all(type(v) is int for v in (*start, *end)):
+            raise ValueError(f"Invalid pair: {line!r}. Expected integer coordinates.")
+
+        return Point(*start), Point(*end)
+
+    fields = line.split(",")
+    if len(fields) != 4:
+        raise ValueError(f"Invalid pair: {line!r}. Expected format is 'x1,y1,x2,y2'.")
+
+    x1, y1, x2, y2 = map(int, fields)
+    return Point(x1, y1), Point(x2, y2)
+
+
+def is_header(line: str) -> bool:
+    """
+    Tell whether a CSV line is a header such as 'x1,y1,x2,y2': none of its fields is an
+    integer.
+    """
+    for field in line.split(","):
+        try:
+            int(field)
+        except ValueError:
+            continue
+
+        return False
+
+    return True
+
+
+def run_batch(source, out, in_format: str = "auto", out_format: str = "jsonl",
+              eval_only: bool = False, buffer_lines: int = 1024) -> tuple:
+    """
+    Solve every pair read from source and write one result line per pair to out.
+
+    Lines are read, solved and written one at a time, and the output is flushed every
+    buffer_lines results, so memory use does not depend on the input size. Paths are the
+    squares of KnightQuest.fpath, the same as single pair mode and the server return.
+    Blank lines and lines starting with '#' are skipped, and so is a CSV header on the
+    first line (see is_header). Any other line that cannot be parsed produces an error
+    record and the batch continues.
+
+    Returns:
+        tuple: The number of solved pairs and the number of invalid lines.
+    """
+    kq = KnightQuest(Point(0, 0), Point(0, 0))
+    chunk = []
+    solved = errors = 0
+
+    for number, line in enumerate(source, 1):
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+
+        try:
+            A, B = parse_pair(line, in_format)
+        except (ValueError, TypeError, KeyError) as e:
+            if number == 1 and in_format != "jsonl" and line[0] not in "{[" and is_header(line):
+                continue
+
+            errors += 1
+            if out_format == "jsonl":
+                chunk.append(json.dumps({"line": number, "error": str(e)}) + "\n")
+            else:
+                chunk.append(f"{number},error,{json.dumps(str(e))}\n")
+        else:
+            moves = kq.feval(A, B)
+            solved += 1
+
+            if out_format == "jsonl":
+                record = f'{{"start":[{A.x},{A.y}],"end":[{B.x},{B.y}],"moves":{moves}'
+                if not eval_only:
+                    record += ',"path":[' + ",".join(f"[{P.x},{P.y}]" for P in KnightQuest(A, B).fpath()) + "]"
+                chunk.append(record + "}\n")
+            else:
+                record = f"{A.x},{A.y},{B.x},{B.y},{moves}"
+                if not eval_only:
+                    record += "," + " ".join(f"{P.x}:{P.y}" for P in KnightQuest(A, B).fpath())
+                chunk.append(record + "\n")
+
+        if len(chunk) >= buffer_lines:
+            out.write("".join(chunk))
+            out.flush()
+            chunk.clear()
+
+    out.write("".join(chunk))
+    out.flush()
+
+    return solved, errors
+
+
 if __name__ == "__main__":
 
     parser = argparse.ArgumentParser(description="Knight pathfinding test runner.")
     parser.add_argument("--start", type=str, default="0,0", help="Starting point[str]: 'x,y'")
     parser.add_argument("--end", type=str, default="10,10", help="Ending point[str]: 'x,y'")
+    parser.add_argument("--batch", type=str, default=None,
+                        help="Solve the pairs in this file, '-' for stdin, instead of --start/--end (default: None)")
+    parser.add_argument("--in_format", choices=["auto", "csv", "jsonl"], default="auto",
+                        help="Batch input format: 'x1,y1,x2,y2' lines or JSON lines (default: auto)")
+    parser.add_argument("--out_format", choices=["jsonl", "csv"], default="jsonl",
+                        help="Batch output format (default: jsonl)")
+    parser.add_argument("--eval_only", action="store_true", help="Batch: write move counts only, no paths")
+    parser.add_argument("--buffer_lines", type=int, default=1024, help="Batch: results per output flush (default: 1024)")
     args = parser.parse_args()
 
+    if args.batch is not None:
+        source = sys.stdin if args.batch == "-" else open(args.batch, "r", encoding="utf-8")
+
+        try:
+            solved, errors = run_batch(source, sys.stdout, args.in_format, args.out_format,
+                                       args.eval_only, args.buffer_lines)
+        except BrokenPipeError:
+            sys.exit(0)
+        finally:
+            if source is not sys.stdin:
+                source.close()
+
+        if errors:
+            print(f"{errors} invalid line(s), {solved} pair(s) solved.", file=sys.stderr)
+        sys.exit(1 if errors else 0)
+
     start = str_to_point(args.start)
     end = str_to_point(args.end)
 
@@ -1,8 +1,12 @@
 
-from dataclasses import dataclass
+from operator import itemgetter
+from itertools import repeat
 
-@dataclass(frozen=True)
-class Point:
+_new = tuple.__new__
+_eq = tuple.__eq__
+_ne = tuple.__ne__
+
+class Point(tuple):
     """
     Immutable 2D point representing coordinates on a Cartesian plane.
 
@@ -15,9 +19,111 @@ class Point:
 
     Includes a static method to create a Point from a complex number,
     rounding the real and imaginary parts to the nearest integers.
+
+    Points are backed by a 2-tuple without a per-instance dict, so construction and
+    hashing run in C. They unpack and index like (x, y), but otherwise behave like the
+    original Point: they only compare equal to other Points, are not ordered, and + and *
+    never concatenate or repeat them. Points with integer coordinates within INTERN_RANGE
+    of the origin are interned: such a Point is created once and shared.
     """
-    x: int
-    y: int
+    __slots__ = ()
+
+    INTERN_RANGE = 16
+
+    x = property(itemgetter(0), doc="The x-coordinate.")
+    y = property(itemgetter(1), doc="The y-coordinate.")
+
+
+    def __new__(cls, x: int, y: int) -> 'Point':
+        """
+        Create a Point, returning the shared instance for interned coordinates.
+
+        Args:
+            x (int): The x-coordinate.
+            y (int): The y-coordinate.
+
+        Returns:
+            Point: The point (x, y).
+        """
+        if type(x) is int and type(y) is int and -_RANGE <= x <= _RANGE and -_RANGE <= y <= _RANGE:
+            return _pool[(x + _RANGE) * _WIDTH + y + _RANGE]
+
+        return _new(cls, (x, y))
+
+
+    def __getnewargs__(self) -> tuple:
+        """
+        Arguments passed to __new__ when unpickling or copying.
+
+        Returns:
+            tuple: The coordinates (x, y).
+        """
+        return tuple(self)
+
+
+    def __repr__(self) -> str:
+        """
+        Represent the point as Point(x=..., y=...).
+
+        Returns:
+            str: The representation of the point.
+        """
+        return f"Point(x={self[0]!r}, y={self[1]!r})"
+
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare two points coordinate-wise. A Point never equals a plain tuple.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: Whether other is a Point with the same coordinates.
+        """
+        return isinstance(other, Point) and _eq(self, other)
+
+
+    def __ne__(self, other: object) -> bool:
+        """
+        Negation of __eq__.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: Whether other is not a Point with the same coordinates.
+        """
+        return not isinstance(other, Point) or _ne(self, other)
+
+
+    __hash__ = tuple.__hash__
+
+
+    def __lt__(self, other: object) -> bool:
+        """
+        Points are not ordered; the tuple ordering is disabled.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("Points are not ordered.")
+
+
+    __le__ = __gt__ = __ge__ = __lt__
+
+
+    def __mul__(self, other: object) -> 'Point':
+        """
+        Points cannot be repeated like tuples.
+
+        Raises:
+            TypeError: Always.
+        """
+        raise TypeError("Points cannot be multiplied.")
+
+
+    __rmul__ = __mul__
 
 
     def __add__(self, second_point: 'Point') -> 'Point':
@@ -29,8 +135,24 @@ class Point:
 
         Returns:
             Point: A new Point representing the sum of coordinates.
+
+        Raises:
+            TypeError: If second_point is not a Point; tuples are not concatenated.
         """
-        return Point(self.x + second_point.x, self.y + second_point.y)
+        if not isinstance(second_point, Point):
+            raise TypeError(f"Cannot add {type(second_point).__name__} to Point.")
+
+        return Point(self[0] + second_point[0], self[1] + second_point[1])
+
+
+    def __radd__(self, first: object) -> 'Point':
+        """
+        Reject adding a Point to anything that is not a Point, e.g. tuple concatenation.
+
+        Raises:
+            TypeError: Always; Point + Point is handled by __add__.
+        """
+        raise TypeError(f"Cannot add Point to {type(first).__name__}.")
 
 
     def __sub__(self, other: 'Point') -> 'Point':
@@ -43,7 +165,23 @@ class Point:
         Returns:
             Point: A new Point representing the difference of coordinates.
         """
-        return Point(self.x - other.x, self.y - other.y)
+        return Point(self[0] - other[0], self[1] - other[1])
+
+
+    @classmethod
+    def from_pairs(cls, pairs) -> list:
+        """
+        Create Points from (x, y) pairs in bulk, e.g. from ndarray.tolist(). The pairs are
+        wrapped directly, without the interning lookup of the constructor, which makes bulk
+        conversion about twice as fast. The Points are equal to interned ones.
+
+        Args:
+            pairs (Iterable): The (x, y) pairs, as tuples or lists.
+
+        Returns:
+            list: The Points in order.
+        """
+        return list(map(_new, repeat(cls), pairs))
 
 
     @staticmethod
@@ -57,4 +195,12 @@ class Point:
         Returns:
             Point: A new Point with integer coordinates derived from z.
         """
-        return Point(round(z.real), round(z.imag))
\ No newline at end of file
+        return Point(round(z.real), round(z.imag))
+
+
+# Interned points for -INTERN_RANGE <= x, y <= INTERN_RANGE, indexed by
+# (x + _RANGE) * _WIDTH + y + _RANGE. The bounds are module globals to avoid attribute lookups.
+_RANGE = Point.INTERN_RANGE
+_WIDTH = 2 * _RANGE + 1
+
+_pool = [_new(Point, (x, y)) for x in range(-_RANGE, _RANGE + 1) for y in range(-_RANGE, _RANGE + 1)]
@@ -1,9 +1,6 @@
 
-import math
-from dataclasses import dataclass
 from model.point import Point
 
-@dataclass
 class Sequence:
     """
     Abstract representation of knight move counts as a sequence indices (n, m).
@@ -19,8 +16,48 @@ class Sequence:
         For the full mathematical derivation of the sequence formulas, 
         see the KnightQuest.pdf.
     """
-    n: int
-    m: int
+    __slots__ = ('n', 'm')
+
+
+    def __init__(self, n: int, m: int) -> None:
+        """
+        Initialize the Sequence with its indices.
+
+        Args:
+            n (int): The primary sequence index.
+            m (int): The secondary sequence index.
+        """
+        self.n = n
+        self.m = m
+
+
+    def __eq__(self, other: object) -> bool:
+        """
+        Compare two sequences index-wise.
+
+        Args:
+            other (object): The object to compare with.
+
+        Returns:
+            bool: True if other is a Sequence with the same indices.
+        """
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+
+        return self.n == other.n and self.m == other.m
+
+    # Sequences are mutable, so they are not hashable.
+    __hash__ = None
+
+
+    def __repr__(self) -> str:
+        """
+        Represent the sequence as Sequence(n=..., m=...).
+
+        Returns:
+            str: The representation of the sequence.
+        """
+        return f"Sequence(n={self.n!r}, m={self.m!r})"
 
 
     @classmethod
@@ -37,19 +74,20 @@ class Sequence:
         Returns:
             Sequence: The corresponding sequence indices (n, m).
         """
-        # Reference point to sequence indices logic.
+        # Reference point to sequence indices logic. Ceilings are taken with integer
+        # division, ceil(a / b) = -(-a // b), so the indices are exact at any magnitude.
         if r.x == 2 and r.y == 2:
             # Special case 
             return cls(5, 0)
-        elif r.y <= (r.x / 2):
+        elif 2 * r.y <= r.x:
             n = r.x
-            m = math.ceil(n / 2) - r.y
+            m = -(-n // 2) - r.y
         else:
-            delta = math.ceil((2 * r.y - r.x) / 3)
+            delta = -((r.x - 2 * r.y) // 3)
             rr_x = r.x + delta
             rr_y = r.y - delta
             n = rr_x
-            m = math.ceil(n / 2) - rr_y
+            m = -(-n // 2) - rr_y
 
         return cls(n, m)
 
@@ -0,0 +1,394 @@
+
+import json
+import time
+import asyncio
+import argparse
+from collections import deque
+from typing import Optional
+from model.point import Point
+from logic.kq import KnightQuest
+
+class KnightServer:
+    """
+    Long-running knight path query server speaking newline-delimited JSON over TCP or a
+    Unix socket, so callers do not pay interpreter startup per query.
+
+    Requests (one JSON object per line, "id" is echoed back):
+      - {"id": 1, "op": "eval", "start": [x, y], "end": [x, y]}
+            -> {"id": 1, "moves": n}
+      - {"id": 2, "op": "path", "start": [x, y], "end": [x, y]}
+            -> {"id": 2, "moves": n, "path": [[x, y], ...]}
+      - {"id": 3, "op": "batch", "pairs": [[[x, y], [x, y]], ...], "path": false}
+            -> {"id": 3, "results": [{"moves": n}, ...]}
+      - {"id": 4, "op": "stats"}
+            -> {"id": 4, "stats": {...}}
+    Malformed requests get {"id": ..., "error": "..."}. Queries are solved on the event
+    loop, so their cost is bounded: request lines longer than max_line bytes are
+    discarded with an error, batches hold at most max_pairs pairs, and paths longer than
+    max_moves, or path batches longer than max_moves in total, are not built and get an
+    "error" instead, in place of the result of a single batch pair. Responses on one connection are
+    written as they complete; clients match them by id.
+
+    Solver requests go through a bounded queue. A single batcher task takes the waiting
+    requests, up to max_batch, waiting at most batch_window for more once the first one
+    arrived, and solves them together: identical queries within a batch are solved once,
+    and all futures of a batch are resolved in one pass. When the queue holds max_queue
+    requests, new ones are rejected with the error "queue full" instead of piling up.
+
+    Attributes:
+        max_queue (int): Maximum number of queued solver requests.
+        max_batch (int): Maximum number of requests solved in one batch.
+        batch_window (float): Seconds to wait for more requests after the first of a batch.
+        max_moves (int): Maximum number of moves of a returned path, or of all the paths
+            of a batch request.
+        max_pairs (int): Maximum number of pairs in a batch request.
+        max_line (int): Maximum length of a request line, in bytes.
+        completed (int): Requests answered so far.
+        rejected (int): Requests rejected because the queue was full.
+        batches (int): Batches solved so far.
+        batched (int): Requests solved in those batches.
+    """
+
+    def __init__(self, max_queue: int = 1024, max_batch: int = 64, batch_window: float = 0.001,
+                 history: int = 10000, max_moves: int = 100000, max_pairs: int = 1000,
+                 max_line: int = 1024 * 1024) -> None:
+        """
+        Initialize the KnightServer.
+
+        Args:
+            max_queue (int): Maximum number of queued solver requests (default 1024).
+            max_batch (int): Maximum number of requests solved in one batch (default 64).
+            batch_window (float): Seconds to wait for more requests after the first of a
+                batch (default 0.001).
+            history (int): Number of recent requests kept for latency percentiles and the
+                request rate (default 10000).
+            max_moves (int): Maximum number of moves of a returned path, or of all the
+                paths of a batch request (default 100000).
+            max_pairs (int): Maximum number of pairs in a batch request (default 1000).
+            max_line (int): Maximum length of a request line, in bytes (default 1 MiB).
+        """
+        self.max_queue = max_queue
+        self.max_batch = max_batch
+        self.batch_window = batch_window
+        self.max_moves = max_moves
+        self.max_pairs = max_pairs
+        self.max_line = max_line
+
+        self.completed = 0
+        self.rejected = 0
+        self.batches = 0
+        self.batched = 0
+
+        self._queue = None
+        self._kq = KnightQuest(Point(0, 0), Point(0, 0))
+        self._history = deque(maxlen=history)
+        self._started = time.perf_counter()
+
+
+    @staticmethod
+    def _fpoint(value) -> 'Point':
+        """
+        Convert a JSON [x, y] pair to a Point.
+
+        Args:
+            value (list): The pair.
+
+        Returns:
+            Point: The square.
+        """
+        x, y = value
+
+        if type(x) is not int or type(y) is not int:
+            raise ValueError(f"Invalid square: {value!r}. Expected [x, y] integers.")
+
+        return Point(x, y)
+
+
+    def _fsolve(self, A: 'Point', B: 'Point', path: bool) -> dict:
+        """
+        Solve one query.
+
+        Args:
+            A (Point): The starting position of the knight.
+            B (Point): The target position to reach.
+            path (bool): Whether to include the path.
+
+        Returns:
+            dict: The move count, and the path if requested; an error if the path would
+            exceed max_moves.
+        """
+        moves = self._kq.feval(A, B)
+
+        if not path:
+            return {"moves": moves}
+
+        if moves > self.max_moves:
+            return {"error": f"Path too long: {moves} moves, the limit is {self.max_moves}."}
+
+        squares = KnightQuest(A, B).fpath()
+        return {"moves": len(squares) - 1, "path": [[P.x, P.y] for P in squares]}
+
+
+    def _fbatch(self, batch: list) -> None:
+        """
+        Solve a batch of queued requests and resolve their futures. Identical queries are
+        solved once per batch.
+
+        Args:
+            batch (list): (request, future) pairs.
+        """
+        solved = {}
+
+        def solve(A, B, path):
+            key = (A, B, path)
+            if key not in solved:
+                solved[key] = self._fsolve(A, B, path)
+            return solved[key]
+
+        for request, future in batch:
+            if future.cancelled():
+                continue
+
+            try:
+                if request["op"] == "batch":
+                    path = bool(request.get("path", False))
+                    pairs = request["pairs"]
+
+                    if len(pairs) > self.max_pairs:
+                        result = {"error": f"Too many pairs: {len(pairs)}, the limit is {self.max_pairs}."}
+                    else:
+                        pairs = [(self._fpoint(A), self._fpoint(B)) for A, B in pairs]
+                        total = sum(self._kq.feval(A, B) for A, B in pairs) if path else 0
+
+                        if total > self.max_moves:
+                            result = {"error": f"Paths too long: {total} moves in total, the limit is {self.max_moves}."}
+                        else:
+                            result = {"results": [solve(A, B, path) for A, B in pairs]}
+                else:
+                    result = dict(solve(
+                        self._fpoint(request["start"]), self._fpoint(request["end"]),
+                        request["op"] == "path"
+                    ))
+            except (KeyError, TypeError, ValueError) as e:
+                result = {"error": f"Invalid request: {e}"}
+
+            future.set_result(result)
+
+        self.batches += 1
+        self.batched += len(batch)
+
+
+    async def _fbatcher(self) -> None:
+        """
+        Collect queued requests into micro-batches and solve them, forever.
+        """
+        loop = asyncio.get_running_loop()
+        queue = self._queue
+
+        while True:
+            batch = [await queue.get()]
+            deadline = loop.time() + self.batch_window
+
+            while len(batch) < self.max_batch:
+                if queue.empty():
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                else:
+                    batch.append(queue.get_nowait())
+
+            self._fbatch(batch)
+
+            # Let the connections write the responses before the next batch is solved.
+            await asyncio.sleep(0)
+
+
+    @staticmethod
+    async def _fdiscard(reader: asyncio.StreamReader) -> None:
+        """
+        Skip the rest of a request line that overran the reader limit, up to and including
+        its newline, without buffering it.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+        """
+        while True:
+            try:
+                await reader.readuntil(b"\n")
+                return
+            except asyncio.LimitOverrunError as e:
+                await reader.readexactly(e.consumed)
+            except asyncio.IncompleteReadError:
+                return
+
+
+    def stats(self) -> dict:
+        """
+        Summarize the server load: request counts, queue depth, recent request rate and
+        latency percentiles over the last `history` requests.
+
+        Returns:
+            dict: The statistics, latencies in milliseconds.
+        """
+        now = time.perf_counter()
+        latencies = sorted(latency for _, latency in self._history)
+        span = now - self._history[0][0] if self._history else 0
+
+        def percentile(q):
+            if not latencies:
+                return 0
+            return 1000 * latencies[min(len(latencies) - 1, int(q * len(latencies)))]
+
+        return {
+            "uptime": now - self._started,
+            "completed": self.completed,
+            "rejected": self.rejected,
+            "batches": self.batches,
+            "avg_batch": self.batched / self.batches if self.batches else 0,
+            "queue_depth": self._queue.qsize() if self._queue is not None else 0,
+            "rps": len(latencies) / span if span > 0 else 0,
+            "p50_ms": percentile(0.50),
+            "p90_ms": percentile(0.90),
+            "p99_ms": percentile(0.99),
+            "max_ms": 1000 * latencies[-1] if latencies else 0
+        }
+
+
+    async def _fhandle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Serve one connection: read requests line by line, queue them and write each
+        response as soon as it is ready.
+
+        Args:
+            reader (asyncio.StreamReader): The connection's reader.
+            writer (asyncio.StreamWriter): The connection's writer.
+        """
+        pending = set()
+
+        def respond(rid, response: dict, received: float) -> None:
+            if rid is not None:
+                response["id"] = rid
+
+            if not writer.is_closing():
+                writer.write(json.dumps(response, separators=(",", ":")).encode() + b"\n")
+
+            now = time.perf_counter()
+            self._history.append((now, now - received))
+            self.completed += 1
+
+        def done(future: asyncio.Future, rid, received: float) -> None:
+            pending.discard(future)
+
+            if not future.cancelled():
+                respond(rid, future.result(), received)
+
+        try:
+            while True:
+                try:
+                    line = await reader.readuntil(b"\n")
+                except asyncio.IncompleteReadError as e:
+                    line = e.partial
+                except asyncio.LimitOverrunError:
+                    respond(None, {"error": f"Request line longer than {self.max_line} bytes."}, time.perf_counter())
+                    await self._fdiscard(reader)
+                    await writer.drain()
+                    continue
+
+                if not line:
+                    break
+
+                received = time.perf_counter()
+                rid = None
+
+                try:
+                    request = json.loads(line)
+                    rid = request.get("id")
+                    op = request["op"]
+                except (ValueError, AttributeError, KeyError) as e:
+                    respond(rid, {"error": f"Invalid request: {e}"}, received)
+                    continue
+
+                if op == "stats":
+                    respond(rid, {"stats": self.stats()}, received)
+                elif op not in ("eval", "path", "batch"):
+                    respond(rid, {"error": f"Unknown op: {op!r}."}, received)
+                elif self._queue.full():
+                    self.rejected += 1
+                    respond(rid, {"error": "queue full"}, received)
+                else:
+                    future = asyncio.get_running_loop().create_future()
+                    future.add_done_callback(lambda f, rid=rid, received=received: done(f, rid, received))
+                    pending.add(future)
+                    self._queue.put_nowait((request, future))
+
+                await writer.drain()
+
+            # The client stopped sending; answer what is still queued before closing.
+            if pending:
+                await asyncio.wait(list(pending))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            for future in list(pending):
+                future.cancel()
+
+            writer.close()
+
+
+    async def serve(self, host: str = "127.0.0.1", port: int = 8765, unix: Optional[str] = None) -> None:
+        """
+        Start the batcher and serve connections until cancelled.
+
+        Args:
+            host (str): TCP host to listen on (default 127.0.0.1).
+            port (int): TCP port to listen on (default 8765).
+            unix (Optional[str]): Listen on this Unix socket path instead of TCP (default None).
+        """
+        self._queue = asyncio.Queue(maxsize=self.max_queue)
+        self._started = time.perf_counter()
+        batcher = asyncio.create_task(self._fbatcher())
+
+        if unix is not None:
+            server = await asyncio.start_unix_server(self._fhandle, path=unix, limit=self.max_line)
+        else:
+            server = await asyncio.start_server(self._fhandle, host, port, limit=self.max_line)
+
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            batcher.cancel()
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser(description="Knight pathfinding JSON-lines query server.")
+    parser.add_argument("--host", type=str, default="127.0.0.1", help="TCP host (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8765, help="TCP port (default: 8765)")
+    parser.add_argument("--unix", type=str, default=None, help="Unix socket path, instead of TCP (default: None)")
+    parser.add_argument("--max_queue", type=int, default=1024, help="Maximum queued requests (default: 1024)")
+    parser.add_argument("--max_batch", type=int, default=64, help="Maximum requests per batch (default: 64)")
+    parser.add_argument("--batch_window", type=float, default=1.0,
+                        help="Milliseconds to wait for more requests per batch (default: 1.0)")
+    parser.add_argument("--max_moves", type=int, default=100000,
+                        help="Maximum moves of a returned path, or of all paths of a batch (default: 100000)")
+    parser.add_argument("--max_pairs", type=int, default=1000, help="Maximum pairs per batch request (default: 1000)")
+    parser.add_argument("--max_line", type=int, default=1024 * 1024,
+                        help="Maximum request line length in bytes (default: 1048576)")
+    args = parser.parse_args()
+
+    server = KnightServer(args.max_queue, args.max_batch, args.batch_window / 1000, max_moves=args.max_moves,
+                          max_pairs=args.max_pairs, max_line=args.max_line)
+    where = args.unix if args.unix is not None else f"{args.host}:{args.port}"
+    print(f"Serving knight queries on {where}.")
+
+    try:
+        asyncio.run(server.serve(args.host, args.port, args.unix))
+    except KeyboardInterrupt:
+        pass